@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+게시판 목록 파서 마이크로 벤치마크
+- 이전 방식: 전체 문서 BeautifulSoup + 행마다 select('td')
+- 현재 방식: board_parser.parse_board (tbody만 파싱, 행 레코드 변환)
+- 저장된 목록 페이지(--html)가 없으면 비슷한 구조의 합성 페이지 사용
+
+사용법:
+    python benchmarks/bench_board_parser.py --html saved_board.html --repeat 50
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bs4 import BeautifulSoup
+from board_parser import PARSER, parse_board
+
+def build_synthetic_page(rows: int = 10) -> str:
+    """병무청 목록 페이지와 비슷한 구조의 합성 HTML (메뉴, 스크립트, 푸터 포함)"""
+    menu = ''.join(
+        f'<li><a href="/contents.do?mc=usr{i:07d}">메뉴 {i}</a>'
+        f'<ul>{"".join(f"<li><a href=/sub{j}.do>하위 메뉴 {j}</a></li>" for j in range(8))}</ul></li>'
+        for i in range(40)
+    )
+    script = '<script>' + 'var data = {"key": "value"};\n' * 200 + '</script>'
+    today = date.today()
+    body_rows = ''.join(
+        f'<tr><td class="ta_l"><a href="boardView.do?gesipan_id=69&gsgeul_no={1500000 - i}">'
+        f'2026년 {i % 12 + 1}월 입영 육군 기술행정병 모집 안내 {i}</a></td>'
+        f'<td>{"<img src=/images/file.gif alt=첨부>" if i % 2 else ""}</td>'
+        f'<td>{(today - timedelta(days=i)).isoformat()}</td><td>{1000 + i:,}</td></tr>'
+        for i in range(rows)
+    )
+    footer = '<div id="footer">' + '<p>서울특별시 … 병무청 민원상담 1588-9090</p>' * 30 + '</div>'
+    return (
+        '<!DOCTYPE html><html><head><title>육군 공지사항</title>' + script + '</head><body>'
+        f'<div id="header"><ul class="gnb">{menu}</ul></div>'
+        '<div id="content"><table class="board_list"><caption>목록</caption>'
+        '<thead><tr><th>제목</th><th>첨부</th><th>작성일</th><th>조회수</th></tr></thead>'
+        f'<tbody>{body_rows}</tbody></table></div>{footer}</body></html>'
+    )
+
+def legacy_parse(html: str) -> list:
+    """이전 get_today_posts 방식의 파싱 (비교용)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.select_one('table')
+    if not table:
+        return []
+    posts = []
+    for row in table.select('tbody tr'):
+        cells = row.select('td')
+        if len(cells) < 4:
+            continue
+        title_link = cells[0].select_one('a')
+        if title_link and title_link.get('href'):
+            posts.append({
+                'title': title_link.get_text(strip=True),
+                'url': title_link.get('href'),
+                'date': cells[2].get_text(strip=True),
+            })
+    return posts
+
+def measure(func, html: str, repeat: int):
+    # 실행 시간 (반복 평균)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(html)
+    elapsed = (time.perf_counter() - started) / repeat
+
+    # 최대 메모리 (1회)
+    tracemalloc.start()
+    func(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(result)
+
+def main():
+    parser = argparse.ArgumentParser(description='게시판 목록 파서 벤치마크')
+    parser.add_argument('--html', help='저장된 목록 페이지 경로 (없으면 합성 페이지)')
+    parser.add_argument('--rows', type=int, default=10, help='합성 페이지 행 수')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    if args.html:
+        with open(args.html, 'r', encoding='utf-8') as f:
+            html = f.read()
+        source = args.html
+    else:
+        html = build_synthetic_page(args.rows)
+        source = f'합성 페이지 ({args.rows}행)'
+
+    print(f"📄 입력: {source}, {len(html.encode('utf-8')):,} bytes, 파서: {PARSER}")
+    print(f"{'방식':<10}{'시간(ms)':>12}{'최대 메모리(KB)':>18}{'행 수':>8}")
+
+    results = {}
+    for name, func in (('이전', legacy_parse), ('현재', parse_board)):
+        elapsed, peak, count = measure(func, html, args.repeat)
+        results[name] = (elapsed, peak)
+        print(f"{name:<10}{elapsed * 1000:>12.2f}{peak / 1024:>18.1f}{count:>8}")
+
+    before, after = results['이전'], results['현재']
+    print(f"\n⚡ 시간 {before[0] / after[0]:.1f}배, 메모리 {before[1] / after[1]:.1f}배 감소")
+
+if __name__ == "__main__":
+    main()
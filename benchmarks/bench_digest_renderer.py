@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+알림 메일 본문 렌더러 벤치마크
+- 이전 방식: 텍스트/HTML 본문을 따로 만들며 문자열 += 연결
+- 현재 방식: digest_renderer.render_digest (게시글 한 번 순회, 조각 모아서 join)
+- 백필처럼 게시글이 많은 알림을 가정 (기본 1,000건, 게시판 2개)
+- 현재 방식은 HTML 이스케이프를 포함하므로 본문 글자 수가 조금 더 큼
+
+사용법:
+    python benchmarks/bench_digest_renderer.py --posts 1000 --repeat 20
+"""
+import os
+import sys
+import time
+import statistics
+import argparse
+import tracemalloc
+from datetime import datetime, date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from digest_renderer import board_title, render_digest
+
+def build_groups(count: int = 1000, boards: int = 2) -> list:
+    """요약이 채워진 합성 게시글을 게시판별로 묶은 목록"""
+    today = date.today()
+    summary = (
+        "• 접수기간: 2025-09-29 ~ 2025-10-02 14:00\n"
+        "• 지원자격: 18세~28세 현역병입영 대상자\n"
+        "• 제출서류를 반드시 확인하시기 바랍니다. 문의: 1588-9090"
+    )
+    groups = []
+    for b in range(boards):
+        posts = [
+            {
+                'title': f'2026년 {i % 12 + 1}월 입영 기술행정병 모집 안내 {i}',
+                'url': f'https://www.mma.go.kr/board/boardView.do?gesipan_id=69&gsgeul_no={1500000 - i}',
+                'date': (today - timedelta(days=i // 5)).isoformat(),
+                'summary': summary,
+            }
+            for i in range(b, count, boards)
+        ]
+        groups.append((f'게시판{b + 1}', 'https://www.mma.go.kr/board/boardList.do', posts))
+    return groups
+
+def legacy_text_body(groups: list, posts: list) -> str:
+    """이전 방식의 텍스트 본문 (문자열 += 연결, 비교용)"""
+    body = f"""
+🎯 {board_title(groups)} 알림
+
+📅 확인 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+📝 새 게시글: {len(posts)}건
+
+{'='*60}
+"""
+    
+    i = 0
+    for label, _, group in groups:
+        if len(groups) > 1:
+            body += f"""
+🪖 {label} ({len(group)}건)
+{'-'*60}
+"""
+        for post in group:
+            i += 1
+            body += f"""
+📌 게시글 {i}
+
+제목: {post['title']}
+작성일: {post['date']}
+링크: {post['url']}
+
+📋 요약:
+{post.get('summary', '요약 정보가 없습니다.')}
+
+{'='*60}
+"""
+    
+    body += "\n\n"
+    for label, board_url, _ in groups:
+        body += f"🔗 병무청 {label} 공지사항: {board_url}\n"
+    body += """
+※ 이 메일은 GitHub Actions를 통해 자동 발송되었습니다.
+※ 중요한 내용은 반드시 원문을 확인해주세요.
+"""
+    return body
+
+def legacy_html_body(groups: list, posts: list) -> str:
+    """이전 방식의 HTML 본문 (문자열 += 연결, 이스케이프 없음, 비교용)"""
+    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<style>
+    body {{ font-family: 'Malgun Gothic', sans-serif; line-height: 1.6; color: #333; }}
+    .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; }}
+    .content {{ background: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0; }}
+    .post {{ background: white; margin: 15px 0; padding: 20px; border-radius: 8px; border-left: 4px solid #007bff; }}
+    .post-title {{ color: #007bff; font-weight: bold; font-size: 16px; margin-bottom: 10px; }}
+    .post-meta {{ color: #6c757d; font-size: 14px; margin-bottom: 15px; }}
+    .post-summary {{ background: #e9ecef; padding: 15px; border-radius: 5px; font-size: 14px; }}
+    .footer {{ text-align: center; color: #6c757d; font-size: 12px; margin-top: 30px; }}
+    .link-button {{ display: inline-block; background: #28a745; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; margin: 10px 0; }}
+    .board-title {{ color: #495057; font-size: 18px; font-weight: bold; margin: 25px 0 5px; }}
+</style>
+</head>
+<body>
+<div class="header">
+    <h2>🎯 {board_title(groups)} 알림</h2>
+    <p>📅 {current_time} | 📝 새 게시글 {len(posts)}건</p>
+</div>
+
+<div class="content">
+"""
+    
+    for label, _, group in groups:
+        if len(groups) > 1:
+            html += f"""
+    <div class="board-title">🪖 {label} ({len(group)}건)</div>
+"""
+        for post in group:
+            html += f"""
+    <div class="post">
+        <div class="post-title">📌 {post['title']}</div>
+        <div class="post-meta">
+            작성일: {post['date']} | 
+            <a href="{post['url']}" class="link-button" target="_blank">📖 원문 보기</a>
+        </div>
+        <div class="post-summary">
+            <strong>📋 요약:</strong><br>
+            {post.get('summary', '요약 정보가 없습니다.').replace(chr(10), '<br>')}
+        </div>
+    </div>
+"""
+    
+    html += """
+</div>
+
+<div class="footer">
+"""
+    for label, board_url, _ in groups:
+        html += f"""
+    <p>
+        <a href="{board_url}" target="_blank">
+            🔗 병무청 {label} 공지사항 바로가기
+        </a>
+    </p>
+"""
+    html += """
+    <p>※ 이 메일은 GitHub Actions를 통해 자동 발송되었습니다.</p>
+    <p>※ 중요한 내용은 반드시 원문을 확인해주세요.</p>
+</div>
+</body>
+</html>
+"""
+    return html
+def legacy_render(groups: list):
+    posts = [post for _, _, group in groups for post in group]
+    return legacy_text_body(groups, posts), legacy_html_body(groups, posts)
+
+def current_render(groups: list):
+    return render_digest(groups, datetime.now())
+
+def measure(func, groups: list, repeat: int):
+    # 실행 시간 (준비 실행 1회 후 반복 중앙값)
+    func(groups)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text, html = func(groups)
+        timings.append(time.perf_counter() - started)
+    elapsed = statistics.median(timings)
+
+    # 최대 메모리 (1회)
+    tracemalloc.start()
+    func(groups)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(text) + len(html)
+
+def main():
+    parser = argparse.ArgumentParser(description='알림 메일 본문 렌더러 벤치마크')
+    parser.add_argument('--posts', type=int, default=1000, help='게시글 수')
+    parser.add_argument('--boards', type=int, default=2, help='게시판 수')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    groups = build_groups(args.posts, args.boards)
+    print(f"📄 입력: 게시글 {args.posts:,}건, 게시판 {args.boards}개")
+    print(f"{'방식':<10}{'시간(ms)':>12}{'최대 메모리(KB)':>18}{'본문 글자 수':>14}")
+
+    results = {}
+    for name, func in (('이전', legacy_render), ('현재', current_render)):
+        elapsed, peak, size = measure(func, groups, args.repeat)
+        results[name] = (elapsed, peak)
+        print(f"{name:<10}{elapsed * 1000:>12.2f}{peak / 1024:>18.1f}{size:>14,}")
+
+    before, after = results['이전'], results['현재']
+    print(f"\n⚡ 이전 대비 현재: 시간 {after[0] / before[0]:.2f}배, 최대 메모리 {after[1] / before[1]:.2f}배")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+본문 추출/요약 프로세스 풀 확장성 벤치마크
+- 대상: 저장한 상세 페이지 fixture(fixtures/mma/view, replay_server.py capture), 없으면 합성 게시글
+  (합성 게시글은 실제 페이지처럼 메뉴와 바닥글을 붙여 크기를 맞춤)
+- 기준: 한 프로세스에서 순서대로 추출 + 요약 (스레드로 나눠도 GIL 때문에 코어 1개)
+- 비교: parse_pool.ParsePool 작업자 수별 처리량, 기준 대비 속도 향상, 코어당 효율
+- 작업자 시작 시간(spawn + import)은 준비 실행으로 제외하고, 작업자 간 전송량(요청/결과 pickle 크기)도 출력
+
+사용법:
+    python benchmarks/bench_parse_pool.py --pages 2000 --workers 1 2 4 8 --chunksize 8
+"""
+import os
+import sys
+import glob
+import time
+import pickle
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from content_extractor import ContentExtractor
+from parse_pool import DetailJob, ParsePool, parse_detail, summarize_text, _init_worker
+from replay_server import DEFAULT_FIXTURE_DIR, SyntheticBoard
+from attachments import ATTACHMENT_LINK_PATTERN
+
+BOARD_KEY = 'bench'
+
+def load_pages(count: int, fixture_dir: str = DEFAULT_FIXTURE_DIR, menu_items: int = 300):
+    """fixture 상세 페이지를 count건이 될 때까지 반복, 없으면 합성 상세 페이지"""
+    paths = sorted(glob.glob(os.path.join(fixture_dir, 'view', '*', '*.html')))
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+        return (pages * (count // len(pages) + 1))[:count], f'fixture {len(paths)}건'
+
+    board = SyntheticBoard('69', count)
+    menu = ''.join(f'<li><a href="/contents.do?mc=usr{i:07d}">병역이행안내 메뉴 {i}</a></li>' for i in range(menu_items))
+    pages = [
+        board.view_page(board.start_id - index).replace(
+            '<ul class="gnb">', f'<ul class="gnb">{menu}'
+        ).encode('utf-8')
+        for index in range(count)
+    ]
+    return pages, '합성 게시글'
+
+def run_sequential(jobs, hints):
+    # 크롤러의 스레드 처리와 같은 계산을 한 프로세스에서 순서대로
+    _init_worker(hints, 100, 300, 'keyword', None)
+    results = [parse_detail(job) for job in jobs]
+    return results, [summarize_text(result.text)[0] for result in results if result.text]
+
+def run_pool(jobs, hints, workers: int, chunksize: int):
+    # 크롤러처럼 추출 결과를 받는 대로 요약을 작업자에 요청 (요약 캐시는 비어 있다고 가정)
+    with ParsePool(workers, chunksize=chunksize, hints=hints) as pool:
+        # 작업자 시작(spawn, import)은 측정에서 제외
+        list(pool.map(jobs[:workers * chunksize]))
+        started = time.perf_counter()
+        results = []
+        futures = []
+        for result in pool.map(jobs):
+            results.append(result)
+            if result.text:
+                futures.append(pool.summarize(result.text))
+        summaries = [future.result()[0] for future in futures]
+        return (results, summaries), time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description='본문 추출/요약 프로세스 풀 벤치마크')
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--workers', type=int, nargs='+', default=None,
+                        help='작업자 수 목록 (기본: 1, 2, 4, ... CPU 코어 수)')
+    parser.add_argument('--chunksize', type=int, default=8)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers_list = args.workers or sorted({min(cores, 2 ** i) for i in range(cores.bit_length() + 1)})
+    pages, source = load_pages(args.pages, args.fixtures)
+
+    # 기억한 선택자 (실제 실행처럼 첫 페이지에서 찾은 선택자 사용)
+    learner = ContentExtractor(hints_path=None)
+    learner.extract(pages[0].decode('utf-8', errors='replace'), board_key=BOARD_KEY)
+    hints = dict(learner.hints)
+    jobs = [DetailJob(page, 'utf-8', BOARD_KEY, ATTACHMENT_LINK_PATTERN) for page in pages]
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        expected, expected_summaries = run_sequential(jobs, hints)
+        timings.append(time.perf_counter() - started)
+    baseline = statistics.median(timings)
+
+    request_bytes = statistics.mean(len(pickle.dumps(job)) for job in jobs[:200])
+    result_bytes = statistics.mean(len(pickle.dumps(result)) for result in expected[:200])
+    print(f"📄 {source}: {len(pages):,}건, 평균 페이지 {statistics.mean(map(len, pages)) / 1024:.1f}KB, "
+          f"CPU 코어 {cores}개, chunksize {args.chunksize}")
+    print(f"📦 작업자 전송량: 요청 {request_bytes / 1024:.1f}KB → 결과 {result_bytes / 1024:.1f}KB (건당 평균)")
+    print(f"\n{'방식':<16}{'시간(초)':>10}{'처리량(건/초)':>16}{'속도 향상':>10}{'효율':>8}")
+    print(f"{'순차(1 프로세스)':<16}{baseline:>10.2f}{len(pages) / baseline:>16,.0f}{'1.00x':>10}{'-':>8}")
+
+    for workers in workers_list:
+        elapsed = statistics.median(
+            run_pool(jobs, hints, workers, args.chunksize)[1] for _ in range(args.repeat)
+        )
+        (results, summaries), _ = run_pool(jobs, hints, workers, args.chunksize)
+        assert [r.text for r in results] == [r.text for r in expected], "결과 순서/내용 불일치"
+        assert summaries == expected_summaries, "요약 불일치"
+        speedup = baseline / elapsed
+        print(f"{f'풀 {workers}개':<16}{elapsed:>10.2f}{len(pages) / elapsed:>16,.0f}"
+              f"{f'{speedup:.2f}x':>10}{f'{speedup / min(workers, cores):.0%}':>8}")
+
+    if cores == 1:
+        print("\n⚠️  CPU 코어가 1개라 작업자를 늘려도 빨라지지 않습니다 (코어가 여러 개인 환경에서 측정하세요).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+전문 검색 색인 벤치마크
+- 합성 공지 N건(기본 30,000건)을 search_index.SearchIndex에 색인한 뒤 검색어별 지연시간 측정
+  (replay_server 합성 문장에 특기/지역/안내 문구를 섞어 검색어가 일부 공지에만 나오도록 구성)
+- 비교 대상: 같은 데이터를 일반 테이블에 두고 instr()로 전체를 훑는 방식
+- 검색어: 3글자 이상 여러 개, 작성일 범위 제한, 2글자 검색어(색인 미사용)
+
+사용법:
+    python benchmarks/bench_search_index.py --posts 30000 --repeat 20
+"""
+import os
+import sys
+import time
+import random
+import sqlite3
+import tempfile
+import statistics
+import argparse
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from replay_server import SYNTHETIC_SENTENCES, SYNTHETIC_TITLES
+from search_index import SearchIndex, split_terms
+
+SPECIALTIES = [
+    '기술행정병', '전문특기병', '취사병', '운전병', '통신병', '의무병', '정비병', '공병', '포병', '기갑병',
+    '화생방병', '군악병', '어학병', '전산병', '사이버병', '헌병', '수송병', '항공정비병', '조리병', '특전병',
+]
+REGIONS = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+NOTES = [
+    "{region}지방병무청 민원실에서 서류를 접수합니다.",
+    "{region} 지역 병역판정검사장은 리모델링으로 임시 이전합니다.",
+    "코로나19 예방을 위해 마스크 착용을 권고합니다.",
+    "우편 접수는 마감일 소인까지 유효합니다.",
+    "온라인 접수 시 공동인증서가 필요합니다.",
+    "합격자는 {month}월 중 입영통지서를 받게 됩니다.",
+    "사회복무요원 소집 일정은 별도 공지합니다.",
+    "{specialty} 자격증 가산점 기준이 변경되었습니다.",
+]
+
+QUERIES = [
+    ('여러 검색어', '기술행정병 접수기간', {}),
+    ('구절 + 기간', '"선발 결과" 누리집', {'since': 'QUARTER_START', 'until': 'TODAY'}),
+    ('2글자 검색어', '면접', {}),
+]
+
+def build_posts(count: int, seed: int = 0):
+    """replay_server 합성 게시글과 같은 문장으로 만든 공지 (하루 3건씩 과거로)"""
+    rng = random.Random(seed)
+    today = date.today()
+    for index in range(count):
+        values = {
+            'year': today.year + 1, 'month': rng.randint(1, 12), 'day': rng.randint(1, 20),
+            'day2': rng.randint(21, 28), 'count': rng.randint(10, 500),
+        }
+        specialty = rng.choice(SPECIALTIES)
+        values.update(region=rng.choice(REGIONS), specialty=specialty)
+        sentences = [s.format(**values) for s in rng.sample(SYNTHETIC_SENTENCES, rng.randint(2, 5))]
+        sentences += [s.format(**values) for s in rng.sample(NOTES, rng.randint(1, 3))]
+        sentences = [s.replace('기술행정병', specialty) for s in sentences]
+        rng.shuffle(sentences)
+        yield {
+            'post_id': 1_600_000 - index,
+            'board_key': '69',
+            'title': rng.choice(SYNTHETIC_TITLES).format(**values).replace('기술행정병', specialty),
+            'date': (today - timedelta(days=index // 3)).isoformat(),
+            'url': f'https://www.mma.go.kr/board/boardView.do?gesipan_id=69&gsgeul_no={1_600_000 - index}',
+            'summary': ' '.join(sentences[:2]),
+            'content': '\n'.join(sentences),
+        }
+
+def scan_search(conn, query: str, limit: int = 10, since=None, until=None):
+    # 색인 없이 모든 게시글의 제목/요약/본문을 instr()로 확인
+    long_terms, short_terms = split_terms(query)
+    conditions, params = [], []
+    for term in long_terms + short_terms:
+        conditions.append("(instr(title, ?) > 0 OR instr(summary, ?) > 0 OR instr(content, ?) > 0)")
+        params.extend([term, term, term])
+    if since:
+        conditions.append("date >= ?")
+        params.append(since)
+    if until:
+        conditions.append("date <= ?")
+        params.append(until)
+    return conn.execute(
+        f"SELECT post_id, title FROM posts WHERE {' AND '.join(conditions)} ORDER BY date DESC LIMIT ?",
+        params + [limit],
+    ).fetchall()
+
+def timed(func, repeat: int):
+    func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], len(result)
+
+def main():
+    parser = argparse.ArgumentParser(description='전문 검색 색인 벤치마크')
+    parser.add_argument('--posts', type=int, default=30000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='search-bench-')
+    posts = list(build_posts(args.posts))
+    today = date.today()
+    quarter_start = (today - timedelta(days=90)).isoformat()
+
+    index = SearchIndex(os.path.join(workdir, 'search.db'))
+    started = time.perf_counter()
+    for start in range(0, len(posts), 500):
+        index.add_posts(posts[start:start + 500])
+    build_seconds = time.perf_counter() - started
+    index.optimize()
+    size = os.path.getsize(index.path)
+    print(f"📚 색인 {index.count():,}건: {build_seconds:.1f}초 ({len(posts) / build_seconds:,.0f}건/초), "
+          f"파일 {size / 1024 / 1024:.1f}MB")
+
+    scan = sqlite3.connect(os.path.join(workdir, 'scan.db'))
+    scan.execute("CREATE TABLE posts (post_id INTEGER PRIMARY KEY, title, summary, content, date)")
+    scan.executemany("INSERT INTO posts VALUES (?, ?, ?, ?, ?)",
+                     [(p['post_id'], p['title'], p['summary'], p['content'], p['date']) for p in posts])
+    scan.commit()
+
+    print(f"\n{'검색어':<24}{'색인 p50/p95(ms)':>20}{'전체 조회 p50/p95(ms)':>26}{'결과':>6}")
+    for label, query, options in QUERIES:
+        options = {key: {'QUARTER_START': quarter_start, 'TODAY': today.isoformat()}[value]
+                   for key, value in options.items()}
+        p50, p95, found = timed(lambda: index.search(query, **options), args.repeat)
+        scan_p50, scan_p95, _ = timed(lambda: scan_search(scan, query, **options), args.repeat)
+        print(f"{label + ': ' + query:<24}{f'{p50:.2f} / {p95:.2f}':>20}{f'{scan_p50:.2f} / {scan_p95:.2f}':>26}{found:>6}")
+
+    hit = index.search(QUERIES[0][1], limit=1)
+    if hit:
+        print(f"\n🔎 1위 예시: [{hit[0].date}] {hit[0].title}\n   {hit[0].snippet}")
+    index.close()
+    scan.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+상세 페이지 본문 추출 벤치마크
+- 이전 방식: 응답 전체를 받아 BeautifulSoup 트리를 만든 뒤 기억한 선택자로 추출
+- 현재 방식: stream_extractor.StreamingExtractor (조각 단위 HTMLParser.feed, 본문 영역이 닫히면 중단)
+- 본문 뒤에 큰 인라인 스크립트와 base64 이미지가 붙은 공지를 가정 (응답은 16KB 조각으로 나눠 전달)
+- 읽은 바이트 수는 실제 요청에서 내려받는 양 (현재 방식은 본문이 끝나면 연결을 닫음)
+
+사용법:
+    python benchmarks/bench_stream_extractor.py --script-kb 512 --image-kb 1024 --repeat 20
+"""
+import os
+import sys
+import time
+import codecs
+import base64
+import statistics
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from content_extractor import ContentExtractor
+from stream_extractor import CHUNK_SIZE, StreamingExtractor
+
+SELECTOR = 'td.bbs_content'
+
+def build_page(paragraphs: int = 30, script_kb: int = 512, image_kb: int = 1024) -> bytes:
+    """메뉴, 본문 표, 큰 인라인 스크립트와 base64 이미지가 있는 상세 페이지"""
+    menu = ''.join(f'<li><a href="/contents.do?mc=usr{i:07d}">메뉴 {i}</a></li>' for i in range(60))
+    body = ''.join(
+        f'<p>{i + 1}. 2026년 입영 육군 기술행정병 모집 안내입니다. 접수기간과 지원자격을 반드시 확인하시기 바랍니다.</p>'
+        for i in range(paragraphs)
+    )
+    script = '<script>var chart = [' + ','.join(str(i) for i in range(script_kb * 1024 // 7)) + '];</script>'
+    image = base64.b64encode(os.urandom(image_kb * 1024 * 3 // 4)).decode('ascii')
+    return (
+        '<!DOCTYPE html><html><head><meta charset="UTF-8"><title>공지사항</title></head><body>'
+        f'<div id="header"><ul class="gnb">{menu}</ul></div>'
+        '<div id="content"><table class="board_view"><tbody>'
+        '<tr><th>제목</th><td>2026년 1월 입영 육군 기술행정병 모집 안내</td></tr>'
+        f'<tr><td colspan="2" class="bbs_content">{body}</td></tr>'
+        '</tbody></table></div>'
+        f'{script}<div class="attach"><img src="data:image/png;base64,{image}" alt="안내문"></div>'
+        '<div id="footer"><p>병무청 민원상담 1588-9090</p></div></body></html>'
+    ).encode('utf-8')
+
+def chunks(data: bytes, size: int = CHUNK_SIZE):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+def legacy_extract(data: bytes):
+    # 응답 전체를 받은 뒤 (response.content → response.text) 트리 생성
+    body = b''.join(chunks(data))
+    extractor = ContentExtractor(hints_path=None)
+    extractor.hints['bench'] = SELECTOR
+    result = extractor.extract(body.decode('utf-8'), board_key='bench')
+    return result.text, len(body)
+
+def current_extract(data: bytes):
+    stream = StreamingExtractor(SELECTOR)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks(data):
+        if stream.feed(chunk, decoder):
+            break
+    return stream.result().text, stream.bytes_read
+
+def measure(func, data: bytes, repeat: int):
+    # 실행 시간 (준비 실행 1회 후 반복 중앙값)
+    func(data)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text, read = func(data)
+        timings.append(time.perf_counter() - started)
+    elapsed = statistics.median(timings)
+
+    # 최대 메모리 (1회, 입력 바이트 제외)
+    tracemalloc.start()
+    func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, read, text
+
+def main():
+    parser = argparse.ArgumentParser(description='상세 페이지 본문 추출 벤치마크')
+    parser.add_argument('--paragraphs', type=int, default=30, help='본문 문단 수')
+    parser.add_argument('--script-kb', type=int, default=512, help='본문 뒤 인라인 스크립트 크기(KB)')
+    parser.add_argument('--image-kb', type=int, default=1024, help='본문 뒤 base64 이미지 크기(KB)')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    data = build_page(args.paragraphs, args.script_kb, args.image_kb)
+    print(f"📄 입력: {len(data):,} bytes, 선택자 {SELECTOR}")
+    print(f"{'방식':<10}{'시간(ms)':>12}{'최대 메모리(KB)':>18}{'읽은 바이트':>14}")
+
+    results = {}
+    texts = []
+    for name, func in (('이전', legacy_extract), ('현재', current_extract)):
+        elapsed, peak, read, text = measure(func, data, args.repeat)
+        results[name] = (elapsed, peak, read)
+        texts.append(text)
+        print(f"{name:<10}{elapsed * 1000:>12.2f}{peak / 1024:>18.1f}{read:>14,}")
+
+    before, after = results['이전'], results['현재']
+    print(f"\n⚡ 이전 대비 현재: 시간 {after[0] / before[0]:.2f}배, 최대 메모리 {after[1] / before[1]:.2f}배, "
+          f"읽은 바이트 {after[2] / before[2]:.2f}배")
+    print(f"🔎 추출 텍스트 일치: {'예' if texts[0] == texts[1] else '아니오'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+크롤링 → 본문 추출 → 요약 → 메일 렌더링 전체 벤치마크
+- 로컬 대체 서버(src/replay_server.py)에 저장한 fixture(없으면 합성 게시글)로 실행
+- 단계별 처리량과 p50/p95 지연시간, 최대 RSS, import/시작 시간 측정
+- python -X importtime으로 모듈별 import 시간, 새 게시글이 없는 실행(idle run)의 전체 시간 측정
+- 결과를 JSON으로 저장하고, 기준 결과(--baseline)보다 임계값 이상 느려지면 실패(종료 코드 1)
+
+단계:
+    list       get_today_posts (목록 요청 + 파싱)
+    extract    get_post_content (상세 요청 + 본문 추출)
+    summarize  SimpleTextSummarizer.summarize
+    render     EmailSender.render (제목 + 텍스트/HTML 본문)
+    idle_run   새 프로세스로 src/crawler.py 실행, 모든 게시판이 워터마크 이하 (요청 수, 로드된 무거운 모듈 포함)
+
+사용법:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline results.json --threshold 0.2
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+import tempfile
+import logging
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+# 벤치마크는 저장소/캐시/보관함을 쓰지 않고 매번 같은 조건으로 실행
+BENCHMARK_ENV = {
+    'SENDER_EMAIL': 'bench@example.com',
+    'SENDER_PASSWORD': 'bench',
+    'RECIPIENT_EMAIL': 'bench@example.com',
+    'POST_STORE_PATH': '',
+    'OUTBOX_PATH': '',
+    'SUMMARY_CACHE_PATH': '',
+    'EXTRACTOR_HINTS_PATH': '',
+    'HTTP_CACHE': 'off',
+    'ATTACHMENT_DIR': '',
+    'SEARCH_INDEX_PATH': '',
+}
+
+def percentile(samples: List[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def run_stage(func: Callable, inputs: List, count_items: Callable = lambda result: 1) -> Dict:
+    """
+    입력마다 func를 실행하고 지연시간 통계 계산
+    - 처리량은 처리한 항목 수 / 전체 실행 시간
+    """
+    timings = []
+    items = 0
+    started = time.perf_counter()
+    for value in inputs:
+        call_started = time.perf_counter()
+        result = func(value)
+        timings.append(time.perf_counter() - call_started)
+        items += count_items(result)
+    total = time.perf_counter() - started
+    return {
+        'calls': len(timings),
+        'items': items,
+        'total_seconds': round(total, 6),
+        'throughput_per_second': round(items / total, 2) if total > 0 else None,
+        'p50_ms': round(percentile(timings, 50) * 1000, 3),
+        'p95_ms': round(percentile(timings, 95) * 1000, 3),
+        'max_ms': round(max(timings) * 1000, 3) if timings else 0.0,
+    }
+
+def measure_import_time(module: str = 'crawler', repeat: int = 3) -> Dict:
+    """새 인터프리터에서 모듈 import에 걸린 시간 (인터프리터 시작 시간 제외)"""
+    code = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); started = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - started)"
+    )
+    env = dict(os.environ, **BENCHMARK_ENV)
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', code, SRC_DIR],
+            capture_output=True, text=True, env=env, check=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return {'module': module, 'median_ms': round(statistics.median(samples) * 1000, 3),
+            'samples_ms': [round(s * 1000, 3) for s in samples]}
+
+# 새 게시글이 없는 실행에서는 로드되지 않아야 하는 모듈
+HEAVY_MODULES = ('bs4', 'smtplib', 'email.mime.multipart', 'content_extractor', 'email_sender', 'numpy')
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, float]]:
+    """
+    -X importtime 출력 파싱
+    - 반환: 모듈 이름 → {'self_us', 'cumulative_us', 'depth'} (depth 0은 최상위 import, 1은 그 하위 import)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        label = parts[2][1:]
+        depth = (len(label) - len(label.lstrip(' '))) // 2
+        modules[label.strip()] = {
+            'self_us': int(parts[0]), 'cumulative_us': int(parts[1]), 'depth': depth,
+        }
+    return modules
+
+def measure_importtime(module: str = 'crawler', repeat: int = 3, top: int = 10) -> Dict:
+    """
+    python -X importtime으로 측정한 모듈별 import 시간
+    - total_ms: module 전체 누적 시간 (반복 측정 중앙값)
+    - top: module이 import한 하위 모듈 중 누적 시간 상위 top개 (중앙값, ms)
+    """
+    env = dict(os.environ, **BENCHMARK_ENV)
+    runs = []
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f"import sys; sys.path.insert(0, sys.argv[1]); import {module}",
+             SRC_DIR],
+            capture_output=True, text=True, env=env, check=True,
+        ).stderr
+        runs.append(parse_importtime(stderr))
+
+    def median_ms(name: str) -> float:
+        return round(statistics.median(run[name]['cumulative_us'] for run in runs if name in run) / 1000, 3)
+
+    children = {name for run in runs for name, info in run.items() if info['depth'] == 1}
+    ranked = sorted(((name, median_ms(name)) for name in children), key=lambda item: item[1], reverse=True)
+    return {
+        'module': module,
+        'total_ms': median_ms(module),
+        'top': dict(ranked[:top]),
+        'heavy_loaded': [name for name in HEAVY_MODULES if name in runs[-1]],
+    }
+
+def measure_idle_run(base_url: str, stats: Dict, repeat: int = 3) -> Dict:
+    """
+    새 게시글이 없는 실행(대부분의 정기 실행) 전체 시간
+    - 모든 게시판 워터마크를 최신 게시글보다 크게 두고 새 프로세스로 src/crawler.py 실행
+    - 이메일 설정 없이 실행 (메일을 보낼 일이 없으면 발송기를 만들지 않아야 함)
+    - wall_ms는 인터프리터 시작 시간 포함, requests는 실행 1회당 대체 서버 요청 수
+    """
+    from board_config import load_boards
+    from post_store import PostStore
+
+    workdir = tempfile.mkdtemp(prefix='idle_run_')
+    store_path = os.path.join(workdir, 'posts.db')
+    store = PostStore(store_path)
+    for board in load_boards():
+        store.advance_watermark(10 ** 12, board.key)
+    store.close()
+
+    env = dict(os.environ, **BENCHMARK_ENV)
+    for name in ('SENDER_EMAIL', 'SENDER_PASSWORD', 'RECIPIENT_EMAIL'):
+        env.pop(name, None)
+    env.update({
+        'MMA_BASE_URL': base_url,
+        'POST_STORE_PATH': store_path,
+        'OUTBOX_PATH': os.path.join(workdir, 'outbox.db'),
+        'RUN_REPORT_DIR': '',
+        'MANUAL_MODE': 'false',
+        'BACKFILL_SINCE': '',
+    })
+    command = [sys.executable, os.path.join(SRC_DIR, 'crawler.py')]
+
+    timings = []
+    requests_before = stats.get('requests', 0)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(command, capture_output=True, text=True, env=env, cwd=workdir, check=True)
+        timings.append(time.perf_counter() - started)
+    requests_per_run = (stats.get('requests', 0) - requests_before) / repeat
+
+    # 로드된 모듈 확인은 측정과 별도로 1회 실행
+    stderr = subprocess.run([sys.executable, '-X', 'importtime'] + command[1:],
+                            capture_output=True, text=True, env=env, cwd=workdir, check=True).stderr
+    loaded = parse_importtime(stderr)
+    return {
+        'wall_ms': round(statistics.median(timings) * 1000, 3),
+        'samples_ms': [round(t * 1000, 3) for t in timings],
+        'requests': requests_per_run,
+        'heavy_loaded': [name for name in HEAVY_MODULES if name in loaded],
+    }
+
+def peak_rss_kb() -> Optional[int]:
+    """현재 프로세스의 최대 RSS (KB, 측정할 수 없으면 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def run_benchmarks(args) -> Dict:
+    os.environ.update(BENCHMARK_ENV)
+    from replay_server import ReplayServer
+
+    results: Dict = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'fixtures': args.fixtures, 'synthetic_posts': args.synthetic_posts,
+            'posts': args.posts, 'list_repeat': args.list_repeat, 'render_posts': args.render_posts,
+        },
+        'import': measure_import_time(),
+        'importtime': measure_importtime(),
+        'stages': {},
+    }
+
+    with ReplayServer(fixture_dir=args.fixtures, synthetic_posts=args.synthetic_posts) as server:
+        started = time.perf_counter()
+        from crawler import MMABoardCrawler
+        from rate_limiter import AdaptiveRateLimiter
+        crawler = MMABoardCrawler(base_url=server.base_url, use_cache=False)
+        results['startup_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        # 로컬 서버이므로 요청 속도 제한 해제
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=10_000, burst=10_000, max_rate=10_000)
+
+        # 측정에 쓸 게시글 목록 (측정 제외)
+        cutoff = date.today() - timedelta(days=3650)
+        pages = max(1, (args.posts + 9) // 10)
+        posts = crawler.get_posts_since(cutoff, max_pages=pages)[:args.posts]
+        if not posts:
+            raise SystemExit("❌ 게시글이 없습니다. fixture를 저장하거나 --synthetic-posts를 지정하세요.")
+
+        stages = results['stages']
+        # 목록 단계 처리량은 페이지/초
+        stages['list'] = run_stage(lambda _: crawler.get_today_posts(), range(args.list_repeat))
+        contents: List[str] = []
+        def extract(post):
+            content = crawler.get_post_content(post['url'])
+            contents.append(content)
+            return content
+        stages['extract'] = run_stage(extract, posts)
+        stages['summarize'] = run_stage(crawler.summarizer.summarize, [c for c in contents if c])
+
+        for post, content in zip(posts, contents):
+            post['summary'] = crawler.summarizer.summarize(content) if content else ''
+        digest = (posts * (args.render_posts // len(posts) + 1))[:args.render_posts]
+        stages['render'] = run_stage(
+            crawler.email_sender.render, [digest] * args.render_repeat, count_items=lambda _: len(digest)
+        )
+        results['server_requests'] = dict(server.stats)
+        results['idle_run'] = measure_idle_run(server.base_url, server.stats)
+
+    results['peak_rss_kb'] = peak_rss_kb()
+    return results
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """기준 결과보다 p50/p95가 threshold 비율 이상 느려진 항목"""
+    regressions = []
+    for stage, current in results['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous:
+            continue
+        for metric in ('p50_ms', 'p95_ms'):
+            before, after = previous.get(metric), current.get(metric)
+            if before and after and after > before * (1 + threshold):
+                regressions.append(f"{stage}.{metric}: {before:.3f} → {after:.3f}ms (+{after / before - 1:.0%})")
+    checks = [
+        ('import.median_ms', baseline.get('import', {}).get('median_ms'), results['import']['median_ms']),
+        ('importtime.total_ms', baseline.get('importtime', {}).get('total_ms'), results['importtime']['total_ms']),
+        ('idle_run.wall_ms', baseline.get('idle_run', {}).get('wall_ms'), results['idle_run']['wall_ms']),
+    ]
+    for name, before, after in checks:
+        if before and after > before * (1 + threshold):
+            regressions.append(f"{name}: {before:.3f} → {after:.3f}ms (+{after / before - 1:.0%})")
+    # 새 게시글이 없는 실행에서 무거운 모듈이 다시 로드되면 실패
+    newly_loaded = set(results['idle_run']['heavy_loaded']) - set(baseline.get('idle_run', {}).get('heavy_loaded', []))
+    if 'idle_run' in baseline and newly_loaded:
+        regressions.append(f"idle_run.heavy_loaded: {', '.join(sorted(newly_loaded))} 추가 로드")
+    return regressions
+
+def print_report(results: Dict):
+    print(f"📦 import {results['import']['module']}: {results['import']['median_ms']:.1f}ms, "
+          f"크롤러 import+생성: {results['startup_ms']:.1f}ms, 최대 RSS: {results['peak_rss_kb'] or '-'}KB")
+    importtime = results['importtime']
+    top = ', '.join(f"{name} {ms:.1f}ms" for name, ms in list(importtime['top'].items())[:5])
+    print(f"🐢 -X importtime {importtime['module']}: {importtime['total_ms']:.1f}ms ({top})")
+    idle = results['idle_run']
+    print(f"💤 새 게시글 없는 실행: {idle['wall_ms']:.1f}ms, 요청 {idle['requests']:g}회, "
+          f"무거운 모듈: {', '.join(idle['heavy_loaded']) or '없음'}")
+    print(f"{'단계':<12}{'호출':>6}{'항목':>8}{'처리량(/s)':>14}{'p50(ms)':>10}{'p95(ms)':>10}")
+    for name, stage in results['stages'].items():
+        print(f"{name:<12}{stage['calls']:>6}{stage['items']:>8}{stage['throughput_per_second'] or 0:>14.1f}"
+              f"{stage['p50_ms']:>10.2f}{stage['p95_ms']:>10.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 전체 파이프라인 벤치마크')
+    parser.add_argument('--fixtures', default=os.path.join(SRC_DIR, '..', 'fixtures', 'mma'),
+                        help='저장한 fixture 디렉토리 (src/replay_server.py capture)')
+    parser.add_argument('--synthetic-posts', type=int, default=None,
+                        help='게시판별 합성 게시글 수 (기본: fixture가 없으면 200)')
+    parser.add_argument('--posts', type=int, default=50, help='추출/요약할 게시글 수')
+    parser.add_argument('--list-repeat', type=int, default=20, help='목록 요청 반복 횟수')
+    parser.add_argument('--render-posts', type=int, default=1000, help='렌더링할 알림의 게시글 수')
+    parser.add_argument('--render-repeat', type=int, default=10)
+    parser.add_argument('--output', help='결과 JSON 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.2, help='허용 지연 증가 비율 (기본 0.2 = 20%%)')
+    args = parser.parse_args()
+
+    if args.synthetic_posts is None:
+        # 목록 fixture만 있으면(목록 파서 테스트용) 상세 페이지가 없으므로 합성 게시글 사용
+        has_fixtures = all(os.path.isdir(os.path.join(args.fixtures, kind)) for kind in ('list', 'view'))
+        args.synthetic_posts = 0 if has_fixtures else 200
+
+    logging.basicConfig(level=logging.WARNING)
+    results = run_benchmarks(args)
+    print_report(results)
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 저하 ({args.threshold:.0%} 초과):")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n✅ 기준 대비 {args.threshold:.0%} 이내")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+pytest 공통 설정
+- src 디렉토리를 Python 경로에 추가
+- crawler_env: 크롤러가 data/, reports/에 쓰지 않도록 저장 위치를 테스트 임시 디렉토리로 지정
+- mailbox: 메일을 SMTP 대신 FakeDelivery에 기록
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+@pytest.fixture
+def crawler_env(tmp_path, monkeypatch):
+    """오프라인 크롤러 실행 환경 (처리 이력, 선택자, HTTP 캐시는 임시 디렉토리, 나머지 저장은 끔)"""
+    env = {
+        'POST_STORE_PATH': str(tmp_path / 'posts.db'),
+        'EXTRACTOR_HINTS_PATH': str(tmp_path / 'extractor_hints.json'),
+        'HTTP_CACHE_DIR': str(tmp_path / 'http_cache'),
+        'CORPUS_STATS_PATH': str(tmp_path / 'corpus_stats.json'),
+        'OUTBOX_PATH': '',
+        'SUMMARY_CACHE_PATH': '',
+        'SEARCH_INDEX_PATH': '',
+        'ATTACHMENT_DIR': '',
+        'RUN_REPORT_DIR': '',
+        'PARSE_WORKERS': '1',
+        'HTTP_RETRIES': '0',
+        'MMA_BASE_URL': '',
+    }
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    for name in ('BACKFILL_SINCE', 'MANUAL_MODE', 'SUMMARIZER_MODE', 'BOARDS_CONFIG'):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path
+
+class FakeDelivery:
+    """SMTP 대신 발송한 메시지를 기록하는 발송 엔진 (fail=True면 모두 실패)"""
+
+    def __init__(self):
+        self.messages = []
+        self.fail = False
+        self.reconnects = 0
+
+    def send(self, msg, to_addrs=None) -> bool:
+        if self.fail:
+            return False
+        self.messages.append(msg)
+        return True
+
+    def send_batch(self, messages):
+        return [self.send(msg, to_addrs) for msg, to_addrs in messages]
+
+    def close(self):
+        pass
+
+    @property
+    def subjects(self):
+        return [str(msg['Subject']) for msg in self.messages]
+
+    def texts(self):
+        """발송한 메시지의 텍스트 본문"""
+        return [msg.get_payload()[0].get_payload(decode=True).decode('utf-8') for msg in self.messages]
+
+@pytest.fixture
+def mailbox(crawler_env, monkeypatch):
+    """EmailSender가 SMTP 대신 FakeDelivery로 발송하도록 설정 (수신자 1명)"""
+    import email_sender
+
+    monkeypatch.setenv('SENDER_EMAIL', 'bot@example.com')
+    monkeypatch.setenv('SENDER_PASSWORD', 'secret')
+    monkeypatch.setenv('RECIPIENT_EMAIL', 'user@example.com')
+    delivery = FakeDelivery()
+    monkeypatch.setattr(email_sender, 'SMTPDeliveryEngine', lambda *args, **kwargs: delivery)
+    return delivery
@@ -2,12 +2,20 @@
 """
 크롤러 디버깅 - HTML 구조 확인
 """
+import os
+import sys
 import requests
 from bs4 import BeautifulSoup
 
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from http_cache import CachingAdapter, create_cache_from_env
+
 def debug_html_structure():
     """HTML 구조 디버깅"""
-    url = "https://www.mma.go.kr/board/boardList.do?gesipan_id=69&mc=usr0000127"
+    base_url = os.getenv('MMA_BASE_URL', 'https://www.mma.go.kr').rstrip('/')
+    url = base_url + "/board/boardList.do?gesipan_id=69&mc=usr0000127"
     
     print("🔍 병무청 게시판 HTML 구조 분석")
     print("="*60)
@@ -16,6 +24,10 @@ def debug_html_structure():
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     })
+    # 크롤러와 같은 디스크 캐시 사용 (HTTP_CACHE=off로 끄기)
+    adapter = CachingAdapter(create_cache_from_env())
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     
     try:
         response = session.get(url, timeout=30)
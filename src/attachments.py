@@ -0,0 +1,335 @@
+"""
+첨부파일 다운로드
+- 상세 페이지에서 찾은 첨부 링크를 조각 단위로 디스크에 저장 (메모리에 파일 전체를 올리지 않음)
+- 저장 위치는 내용의 sha256 (objects/ab/abcdef...), 같은 파일이 여러 공지에 붙어 있어도 한 번만 저장
+- 이미 받은 URL, 또는 같은 ETag/크기의 파일이 있으면 본문을 받지 않음
+- 중간에 끊긴 다운로드는 partial/에 남겨 두고 Range(If-Range) 요청으로 이어 받기
+- 동시 다운로드 수 제한 (max_workers)
+"""
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import unquote
+
+import requests
+
+from resilience import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# 첨부 링크 href 패턴 (게시판 설정의 selectors.attachment로 바꿀 수 있음)
+ATTACHMENT_LINK_PATTERN = re.compile(r'download|filedown|atchfile|fileDownload', re.I)
+
+# Content-Disposition 파일 이름 (filename*=UTF-8''... 우선)
+FILENAME_STAR = re.compile(r"filename\*\s*=\s*([\w-]+)''([^;]+)", re.I)
+FILENAME_PLAIN = re.compile(r'filename\s*=\s*"?([^";]+)"?', re.I)
+CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)')
+
+CHUNK_SIZE = 64 * 1024
+
+class AttachmentTooLarge(Exception):
+    """첨부파일이 크기 상한을 넘음"""
+
+def filename_from_headers(headers, fallback: str) -> str:
+    """Content-Disposition에서 파일 이름 추출 (없으면 fallback)"""
+    disposition = headers.get('Content-Disposition') or ''
+    match = FILENAME_STAR.search(disposition)
+    if match:
+        return unquote(match.group(2).strip(), encoding=match.group(1) or 'utf-8', errors='replace')
+    match = FILENAME_PLAIN.search(disposition)
+    if match:
+        name = match.group(1).strip()
+        # 서버가 UTF-8 이름을 latin-1로 보내는 경우 복원
+        try:
+            return name.encode('latin-1').decode('utf-8')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return name
+    return fallback
+
+class AttachmentStore:
+    """
+    내용 주소 기반 첨부파일 저장소
+    - objects/<sha256 앞 2자리>/<sha256>: 파일 본문
+    - index.db: URL → sha256, 파일 이름, 크기, ETag
+    """
+
+    def __init__(self, directory: str = 'data/attachments'):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, 'objects')
+        self.partial_dir = os.path.join(directory, 'partial')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.partial_dir, exist_ok=True)
+
+        # 다운로드가 여러 스레드에서 실행되므로 연결을 공유하고 잠금으로 보호
+        self.conn = sqlite3.connect(os.path.join(directory, 'index.db'), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS attachments (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    name TEXT,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    content_type TEXT,
+                    downloaded_at TEXT
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS attachments_etag ON attachments (etag, size)")
+
+    def object_path(self, sha256: str) -> str:
+        return os.path.join(self.objects_dir, sha256[:2], sha256)
+
+    def partial_paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.partial_dir, key)
+        return base + '.part', base + '.json'
+
+    def _existing(self, row) -> Optional[Dict]:
+        if row and os.path.exists(self.object_path(row['sha256'])):
+            return dict(row)
+        return None
+
+    def by_url(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM attachments WHERE url = ?", (url,)).fetchone()
+        return self._existing(row)
+
+    def by_etag(self, etag: str, size: int) -> Optional[Dict]:
+        """같은 강한 ETag와 크기로 저장된 파일 (약한 ETag는 내용이 같다는 보장이 없어 사용 안 함)"""
+        if not etag or etag.startswith('W/'):
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM attachments WHERE etag = ? AND size = ? LIMIT 1", (etag, size)
+            ).fetchone()
+        return self._existing(row)
+
+    def add(self, url: str, sha256: str, name: str, size: int,
+            etag: Optional[str] = None, content_type: Optional[str] = None):
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO attachments (url, sha256, name, size, etag, content_type, downloaded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (url, sha256, name, size, etag, content_type, datetime.now().isoformat(timespec='seconds')))
+
+    def commit_object(self, part_path: str, sha256: str) -> bool:
+        """다 받은 파일을 내용 주소 위치로 이동, 이미 있으면 임시 파일 삭제 후 False"""
+        path = self.object_path(sha256)
+        if os.path.exists(path):
+            os.remove(part_path)
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(part_path, path)
+        return True
+
+    def close(self):
+        self.conn.close()
+
+class AttachmentDownloader:
+    """
+    첨부파일 다운로더
+    - fetch: 크롤러의 _fetch(url, stage=, consume=, headers=) (속도 제한, 재시도, 회로 차단기, 지표 적용)
+    - download_all(attachments): 첨부 딕셔너리(url, name) 목록을 받아 size, sha256, path를 채움
+    """
+
+    def __init__(self, store: AttachmentStore, fetch: Callable[..., requests.Response],
+                 max_workers: int = 2, max_bytes: int = 50 * 1024 * 1024, resume_attempts: int = 3,
+                 on_event: Optional[Callable[[str], None]] = None):
+        self.store = store
+        self.fetch = fetch
+        self.max_workers = max(1, max_workers)
+        self.max_bytes = max_bytes
+        self.resume_attempts = max(1, resume_attempts)
+        self.on_event = on_event or (lambda event: None)
+
+    def download_all(self, attachments: List[Dict]) -> List[Dict]:
+        """URL별로 한 번만 받고 결과를 같은 URL의 첨부 딕셔너리에 모두 반영"""
+        by_url: Dict[str, List[Dict]] = {}
+        for attachment in attachments:
+            by_url.setdefault(attachment['url'], []).append(attachment)
+        if not by_url:
+            return attachments
+
+        def work(url: str):
+            return url, self.download(url, by_url[url][0].get('name') or '')
+
+        if self.max_workers == 1 or len(by_url) == 1:
+            results = [work(url) for url in by_url]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(work, by_url))
+
+        for url, info in results:
+            for attachment in by_url[url]:
+                attachment.update(info)
+        return attachments
+
+    def download(self, url: str, name: str = '') -> Dict:
+        """첨부파일 1개 다운로드, 결과 정보(name, size, sha256, path 또는 error) 반환"""
+        stored = self.store.by_url(url)
+        if stored:
+            self.on_event('cached')
+            return self._info(stored)
+
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self.resume_attempts + 1):
+            try:
+                return self._download_once(url, name)
+            except AttachmentTooLarge as e:
+                self.on_event('failed')
+                logger.warning(f"⚠️  첨부파일 크기 상한 초과: {url} ({e})")
+                return {'name': name, 'error': 'too_large'}
+            except CircuitOpenError:
+                # 사이트 장애는 실행 전체를 실패로 처리
+                raise
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status == 416:
+                    # 이어 받을 위치가 맞지 않음 → 처음부터 다시
+                    self._discard_partial(url)
+                    last_error = e
+                    continue
+                last_error = e
+                break
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError, OSError) as e:
+                last_error = e
+                logger.warning(f"🔁 첨부파일 다운로드 중단 ({attempt}/{self.resume_attempts}), 이어 받기 예정: {url} ({e})")
+            except requests.RequestException as e:
+                last_error = e
+                break
+
+        self.on_event('failed')
+        logger.error(f"❌ 첨부파일 다운로드 실패: {url} ({last_error})")
+        return {'name': name, 'error': str(last_error)}
+
+    def _download_once(self, url: str, name: str) -> Dict:
+        part_path, meta_path = self.store.partial_paths(url)
+        meta = self._load_meta(meta_path)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+        headers = {}
+        validator = meta.get('etag') or meta.get('last_modified')
+        if offset and validator:
+            headers['Range'] = f'bytes={offset}-'
+            headers['If-Range'] = validator
+        else:
+            offset = 0
+
+        state: Dict = {}
+
+        def consume(response: requests.Response) -> int:
+            start = 0
+            if response.status_code == 206:
+                match = CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                if match and int(match.group(1)) == offset:
+                    start = offset
+            total = int(response.headers.get('Content-Length') or 0) + start or None
+            if total and total > self.max_bytes:
+                raise AttachmentTooLarge(f"{total:,} bytes")
+
+            etag = response.headers.get('ETag')
+            state.update({
+                'name': filename_from_headers(response.headers, name),
+                'etag': etag,
+                'content_type': response.headers.get('Content-Type'),
+            })
+
+            # 같은 파일(강한 ETag와 크기 일치)이 이미 저장되어 있으면 본문을 받지 않음
+            if total and start == 0:
+                existing = self.store.by_etag(etag, total)
+                if existing:
+                    state['existing'] = existing
+                    return 0
+
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'etag': etag, 'last_modified': response.headers.get('Last-Modified')}, f)
+
+            hasher = hashlib.sha256()
+            if start:
+                # 이미 받은 부분을 해시에 반영
+                with open(part_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+            size = start
+            read = 0
+            with open(part_path, 'ab' if start else 'wb') as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    size += len(chunk)
+                    read += len(chunk)
+                    if size > self.max_bytes:
+                        raise AttachmentTooLarge(f"{size:,} bytes 이상")
+                    hasher.update(chunk)
+                    f.write(chunk)
+            if total and size != total:
+                raise requests.exceptions.ChunkedEncodingError(f"응답이 중간에 끊김 ({size:,}/{total:,} bytes)")
+            state.update({'sha256': hasher.hexdigest(), 'size': size, 'resumed_from': start})
+            return read
+
+        self.fetch(url, stage='attachment', consume=consume, headers=headers)
+
+        if 'existing' in state:
+            existing = state['existing']
+            self.store.add(url, existing['sha256'], state['name'] or existing['name'], existing['size'],
+                           state['etag'], state['content_type'])
+            self.on_event('deduplicated')
+            logger.info(f"♻️  같은 첨부파일이 이미 저장되어 있음 (ETag): {state['name']}")
+            return self._info(self.store.by_url(url) or existing)
+
+        created = self.store.commit_object(part_path, state['sha256'])
+        self._discard_partial(url, part=False)
+        self.store.add(url, state['sha256'], state['name'], state['size'], state['etag'], state['content_type'])
+        self.on_event('downloaded' if created else 'deduplicated')
+        resumed = f", {state['resumed_from']:,} bytes부터 이어 받음" if state['resumed_from'] else ''
+        logger.info(f"📎 첨부파일 저장: {state['name']} ({state['size']:,} bytes{resumed}"
+                    f"{'' if created else ', 같은 내용이 이미 있어 저장 생략'})")
+        return self._info(self.store.by_url(url))
+
+    def _info(self, row: Dict) -> Dict:
+        return {
+            'name': row['name'], 'size': row['size'], 'sha256': row['sha256'],
+            'path': self.store.object_path(row['sha256']),
+        }
+
+    @staticmethod
+    def _load_meta(meta_path: str) -> Dict:
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _discard_partial(self, url: str, part: bool = True):
+        part_path, meta_path = self.store.partial_paths(url)
+        for path in ((part_path, meta_path) if part else (meta_path,)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def create_downloader_from_env(fetch: Callable[..., requests.Response],
+                               on_event: Optional[Callable[[str], None]] = None) -> Optional[AttachmentDownloader]:
+    """
+    환경변수로 다운로더 생성
+    - ATTACHMENT_DIR: 저장 위치 (기본 data/attachments, 비우면 첨부파일을 받지 않음)
+    - ATTACHMENT_WORKERS: 동시 다운로드 수 (기본 2)
+    - ATTACHMENT_MAX_MB: 파일 1개 최대 크기 (기본 50MB)
+    """
+    directory = os.getenv('ATTACHMENT_DIR', 'data/attachments')
+    if not directory:
+        return None
+    return AttachmentDownloader(
+        AttachmentStore(directory), fetch,
+        max_workers=int(os.getenv('ATTACHMENT_WORKERS', '2')),
+        max_bytes=int(float(os.getenv('ATTACHMENT_MAX_MB', '50')) * 1024 * 1024),
+        on_event=on_event,
+    )
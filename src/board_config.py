@@ -0,0 +1,68 @@
+"""
+게시판 설정 (boards.json)
+- 게시판별 gesipan_id, 메뉴 코드(mc), 표시 이름, 선택자
+  (selectors.content: 본문 선택자, selectors.attachment: 첨부 링크 href 정규식)
+"""
+import os
+import json
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'boards.json')
+
+class BoardConfig(NamedTuple):
+    """감시할 게시판 하나"""
+    gesipan_id: str
+    mc: str
+    label: str
+    selectors: Dict[str, str] = {}
+
+    @property
+    def key(self) -> str:
+        """게시판 식별자 (처리 이력, 본문 선택자 기억에 사용)"""
+        return self.gesipan_id
+
+    @property
+    def list_path(self) -> str:
+        """게시판 목록 경로"""
+        return f"/board/boardList.do?gesipan_id={self.gesipan_id}&mc={self.mc}"
+
+    @property
+    def view_params(self) -> str:
+        """boardView.do 요청에 필요한 추가 파라미터"""
+        return f"pageIndex=1&searchCondition=&searchKeyword=&pageUnit=10&mc={self.mc}&jbc_gonggibodo=0"
+
+# 설정 파일이 없을 때 사용하는 기본 게시판 (육군 공지사항)
+DEFAULT_BOARD = BoardConfig(gesipan_id='69', mc='usr0000127', label='육군')
+
+def load_boards(path: Optional[str] = None) -> List[BoardConfig]:
+    """
+    설정 파일에서 사용 중인 게시판 목록 로드
+    - enabled가 false이거나 gesipan_id/mc가 비어 있는 항목은 제외
+    - 파일이 없거나 사용할 게시판이 없으면 기본 게시판(육군)만 사용
+    """
+    path = path or os.getenv('BOARDS_CONFIG', DEFAULT_CONFIG_PATH)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except OSError:
+        logger.info(f"ℹ️  게시판 설정 파일이 없어 기본 게시판을 사용합니다: {path}")
+        return [DEFAULT_BOARD]
+
+    boards = []
+    for entry in config.get('boards', []):
+        if not entry.get('enabled', True):
+            continue
+        if not entry.get('gesipan_id') or not entry.get('mc'):
+            logger.warning(f"⚠️  gesipan_id/mc가 없는 게시판 설정 제외: {entry.get('label')}")
+            continue
+        boards.append(BoardConfig(
+            gesipan_id=str(entry['gesipan_id']),
+            mc=entry['mc'],
+            label=entry.get('label', str(entry['gesipan_id'])),
+            selectors=entry.get('selectors') or {},
+        ))
+
+    return boards or [DEFAULT_BOARD]
@@ -0,0 +1,90 @@
+"""
+게시판 목록 파서
+- 목록 HTML에서 게시글 tbody만 파싱 (SoupStrainer, lxml 설치 시 lxml 사용)
+- 각 행을 한 번만 읽어 간결한 BoardRow 레코드로 변환
+- bs4는 parse_board를 처음 호출할 때 import (새 게시글이 없는 실행은 latest_post_id로 끝남)
+"""
+import re
+from datetime import datetime, date
+from importlib.util import find_spec
+from typing import Callable, List, NamedTuple, Optional
+
+# lxml은 import하지 않고 설치 여부만 확인
+PARSER = 'lxml' if find_spec('lxml') else 'html.parser'
+
+# boardView.do 게시글 번호
+POST_ID_PATTERN = re.compile(r'gsgeul_no=(\d+)')
+
+class BoardRow(NamedTuple):
+    """게시판 목록 한 행"""
+    post_id: Optional[int]
+    title: str
+    url: str
+    date: str
+    post_date: Optional[date]
+    has_attachment: bool
+    views: Optional[int]
+
+def extract_post_id(url: str) -> Optional[int]:
+    """boardView.do URL에서 게시글 번호(gsgeul_no) 추출"""
+    match = POST_ID_PATTERN.search(url)
+    return int(match.group(1)) if match else None
+
+def latest_post_id(html: str) -> Optional[int]:
+    """
+    목록 HTML에 있는 가장 큰 게시글 번호 (HTML 파싱 없이 정규식으로 확인)
+    - 목록 밖의 링크가 섞여도 값이 커질 뿐이므로 "새 게시글 없음" 판정에는 안전
+    """
+    ids = POST_ID_PATTERN.findall(html)
+    return max(map(int, ids)) if ids else None
+
+def parse_board(html: str, build_url: Callable[[str], str] = lambda href: href) -> List[BoardRow]:
+    """
+    목록 HTML을 BoardRow 목록으로 변환
+    - 셀 구성: 제목, 첨부, 작성일, 조회수
+    - 셀이 4개 미만이거나 제목 링크가 없는 행은 제외
+    - 작성일이 YYYY-MM-DD 형식이 아니면 post_date는 None
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    soup = BeautifulSoup(html, PARSER, parse_only=SoupStrainer('tbody'))
+    tbody = soup.find('tbody')
+    if tbody is None:
+        return []
+
+    rows = []
+    for tr in tbody.find_all('tr', recursive=False):
+        cells = tr.find_all('td', recursive=False)
+        if len(cells) < 4:
+            continue
+
+        link = cells[0].find('a')
+        href = link.get('href') if link else None
+        if not href:
+            continue
+
+        date_text = cells[2].get_text(strip=True)
+        try:
+            post_date = datetime.strptime(date_text, '%Y-%m-%d').date()
+        except ValueError:
+            post_date = None
+
+        attachment_cell = cells[1]
+        has_attachment = bool(
+            attachment_cell.find(('a', 'img')) or attachment_cell.get_text(strip=True)
+        )
+
+        views_text = cells[3].get_text(strip=True).replace(',', '')
+        views = int(views_text) if views_text.isdigit() else None
+
+        rows.append(BoardRow(
+            post_id=extract_post_id(href),
+            title=link.get_text(strip=True),
+            url=build_url(href),
+            date=date_text,
+            post_date=post_date,
+            has_attachment=has_attachment,
+            views=views,
+        ))
+
+    return rows
@@ -0,0 +1,237 @@
+"""
+게시글 본문 추출기
+- 문서를 한 번 순회하며 텍스트 노드를 가장 가까운 블록(td, div 등)에 배점
+- 게시판별로 마지막에 성공한 선택자를 기억해 다음 추출 때 먼저 시도 (맞으면 채점하지 않음)
+- 추출 신뢰도(본문이 페이지 텍스트에서 차지하는 비율)를 함께 반환
+"""
+import os
+import json
+import re
+import threading
+import logging
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from bs4 import BeautifulSoup, Comment
+
+logger = logging.getLogger(__name__)
+
+# 본문 후보 블록 태그
+CANDIDATE_TAGS = {'td', 'div', 'article', 'section', 'main'}
+# 본문이 아닌 텍스트를 담는 태그
+SKIP_TAGS = {'script', 'style', 'noscript', 'head', 'title', 'select', 'option', 'button'}
+
+POSITIVE_HINT = re.compile(r'content|view|article|bbs|board|body|cont', re.I)
+NEGATIVE_HINT = re.compile(r'nav|header|footer|menu|gnb|lnb|snb|side|banner|util|skip|location|quick', re.I)
+
+# 이 값보다 신뢰도가 낮으면 사이트 구조 변경 의심
+LOW_CONFIDENCE = 0.3
+
+class ExtractionResult(NamedTuple):
+    """본문 추출 결과"""
+    text: str
+    selector: str
+    score: float
+    confidence: float
+    method: str  # 'hint': 기억한 선택자 사용, 'scan': 전체 후보 채점
+    links: Tuple[Tuple[str, str], ...] = ()  # 첨부 링크 (href, 링크 텍스트), 크롤러가 채움
+
+class ContentExtractor:
+    def __init__(self, hints_path: Optional[str] = 'data/extractor_hints.json',
+                 min_length: int = 100):
+        self.hints_path = hints_path
+        self.min_length = min_length
+        self._lock = threading.Lock()
+        self.hints: Dict[str, str] = self._load_hints()
+
+    def _load_hints(self) -> Dict[str, str]:
+        if not self.hints_path:
+            return {}
+        try:
+            with open(self.hints_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hint(self, board_key: str, selector: str):
+        with self._lock:
+            if self.hints.get(board_key) == selector:
+                return
+            self.hints[board_key] = selector
+            if not self.hints_path:
+                return
+            directory = os.path.dirname(self.hints_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.hints_path, 'w', encoding='utf-8') as f:
+                json.dump(self.hints, f, ensure_ascii=False, indent=2)
+        logger.info(f"📌 본문 선택자 기억: 게시판 {board_key} → {selector}")
+
+    def remember(self, board_key: str, result: 'ExtractionResult'):
+        """다른 프로세스에서 전체 채점으로 찾은 선택자 기억 (신뢰도가 낮으면 기억하지 않음)"""
+        if result.method == 'scan' and result.confidence >= LOW_CONFIDENCE:
+            self._save_hint(board_key, result.selector)
+
+    def extract(self, html: str, board_key: str = 'default') -> Optional[ExtractionResult]:
+        """HTML에서 본문 추출 (찾지 못하면 None)"""
+        soup = BeautifulSoup(html, 'html.parser')
+        return self.extract_from_soup(soup, board_key)
+
+    def extract_from_soup(self, soup, board_key: str = 'default') -> Optional[ExtractionResult]:
+        # 1. 기억한 선택자 먼저 시도 (맞으면 후보 채점 없이 반환)
+        hint = self.hints.get(board_key)
+        if hint:
+            result = self._extract_hint(soup, hint)
+            if result is not None:
+                return result
+            logger.warning(f"⚠️  기억한 본문 선택자가 맞지 않습니다 (사이트 구조 변경 의심): {hint}")
+
+        scores, total_length = self._score_candidates(soup)
+        if not scores:
+            return None
+
+        # 2. 점수가 가장 높은 후보 선택
+        nodes = {id(node): node for node in soup.find_all(CANDIDATE_TAGS)}
+        for node_id, score in sorted(scores.items(), key=lambda item: item[1], reverse=True):
+            node = nodes.get(node_id)
+            if node is None:
+                continue
+            text = node.get_text(separator='\n', strip=True)
+            if len(text) < self.min_length:
+                continue
+
+            selector = self._build_selector(soup, node)
+            confidence = self._confidence(text, total_length)
+            if confidence < LOW_CONFIDENCE:
+                logger.warning(f"⚠️  본문 추출 신뢰도 낮음 ({confidence:.2f}): {selector}")
+            else:
+                self._save_hint(board_key, selector)
+            return ExtractionResult(
+                text=text, selector=selector, score=score,
+                confidence=confidence, method='scan'
+            )
+
+        return None
+
+    def _extract_hint(self, soup, hint: str) -> Optional[ExtractionResult]:
+        """기억한 선택자로 추출 (요소가 없거나 본문이 min_length보다 짧으면 None)"""
+        node = soup.select_one(hint)
+        if node is None:
+            return None
+        text = node.get_text(separator='\n', strip=True)
+        if len(text) < self.min_length:
+            return None
+        return ExtractionResult(
+            text=text, selector=hint, score=float(len(text)),
+            confidence=self._confidence(text, self._text_length(soup)), method='hint'
+        )
+
+    @staticmethod
+    def _text_length(soup) -> int:
+        """
+        신뢰도 계산용 페이지 텍스트 길이 (채점 없이 문서 순서대로 한 번 훑음)
+        - script 등과 링크(a)는 하위 노드를 건너뛰고 다음 형제로 이동
+        """
+        total_length = 0
+        node = soup.contents[0] if soup.contents else None
+        while node is not None:
+            if node.name in SKIP_TAGS or node.name == 'a':
+                # 하위 노드를 읽지 않고 다음 형제(없으면 조상의 다음 형제)로
+                while node is not None and node.next_sibling is None:
+                    node = node.parent
+                node = node.next_sibling if node is not None else None
+                continue
+            if node.name is None and not isinstance(node, Comment):
+                total_length += len(node.strip())
+            node = node.next_element
+        return total_length
+
+    def _score_candidates(self, soup):
+        """
+        텍스트 노드를 한 번 순회하며 후보 블록 점수 계산
+        - 가장 가까운 후보 블록에 글자 수만큼, 그 위 후보 블록에 절반 배점
+        - 링크 안의 텍스트는 배점하지 않음 (메뉴, 목록 링크 제외)
+        - class/id 이름으로 가중치 보정
+        """
+        raw_scores: Dict[int, float] = {}
+        weights: Dict[int, float] = {}
+        total_length = 0
+
+        for string in soup.find_all(string=True):
+            if isinstance(string, Comment):
+                continue
+            length = len(string.strip())
+            if not length:
+                continue
+
+            in_link = False
+            skipped = False
+            found = 0
+            for parent in string.parents:
+                name = parent.name
+                if name in SKIP_TAGS:
+                    skipped = True
+                    break
+                if name == 'a' and found == 0:
+                    in_link = True
+                if name in CANDIDATE_TAGS:
+                    if in_link:
+                        break
+                    key = id(parent)
+                    if key not in weights:
+                        weights[key] = self._class_weight(parent)
+                    raw_scores[key] = raw_scores.get(key, 0.0) + (length if found == 0 else length / 2)
+                    found += 1
+                    if found == 2:
+                        break
+
+            if skipped or in_link:
+                continue
+            total_length += length
+
+        scores = {key: score * weights[key] for key, score in raw_scores.items()}
+        return scores, total_length
+
+    @staticmethod
+    def _class_weight(node) -> float:
+        names = ' '.join(node.get('class') or []) + ' ' + (node.get('id') or '')
+        weight = 1.0
+        if NEGATIVE_HINT.search(names):
+            weight *= 0.2
+        if POSITIVE_HINT.search(names):
+            weight *= 1.5
+        return weight
+
+    @staticmethod
+    def _confidence(text: str, total_length: int) -> float:
+        """본문 길이가 페이지 전체 텍스트에서 차지하는 비율 (0~1)"""
+        if total_length <= 0:
+            return 0.0
+        length = sum(len(line) for line in text.split('\n'))
+        return round(min(1.0, length / total_length), 2)
+
+    @staticmethod
+    def _build_selector(soup, node) -> str:
+        """노드를 다시 찾을 수 있는 CSS 선택자 생성"""
+        if node.get('id'):
+            return f"{node.name}#{node['id']}"
+
+        classes = node.get('class') or []
+        if classes:
+            selector = f"{node.name}.{classes[0]}"
+            if soup.select_one(selector) is node:
+                return selector
+
+        # id가 있는 가장 가까운 조상부터 nth-of-type 경로
+        parts = []
+        current = node
+        while current is not None and current.name not in (None, '[document]'):
+            if current.get('id') and current is not node:
+                parts.append(f"{current.name}#{current['id']}")
+                break
+            position = 1
+            for sibling in current.previous_siblings:
+                if getattr(sibling, 'name', None) == current.name:
+                    position += 1
+            parts.append(f"{current.name}:nth-of-type({position})")
+            current = current.parent
+        return ' > '.join(reversed(parts))
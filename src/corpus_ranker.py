@@ -0,0 +1,188 @@
+"""
+코퍼스 기반 문장 순위 (TF-IDF / TextRank)
+- 이전에 수집한 게시글로 문서 빈도(DF)를 누적하고 IDF 가중치를 미리 계산해 저장
+- 문장 유사도와 순위 계산은 NumPy 행렬 연산으로 처리
+- SentenceRanker는 NumPy가 필요합니다 (requirements.txt에 포함), CorpusStats는 NumPy 없이도 동작
+"""
+import os
+import re
+import json
+import math
+import hashlib
+import logging
+from typing import Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 SentenceRanker 생성 시 ImportError (요약기는 키워드 방식으로 대체)
+    np = None
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[A-Za-z]+|\d+')
+
+def tokenize(text: str) -> List[str]:
+    """
+    형태소 분석기 없이 쓰는 토큰화
+    - 한글은 음절 2-gram (조사가 붙어도 같은 토큰이 나오도록)
+    - 영문/숫자는 단어 단위
+    """
+    tokens = []
+    for word in TOKEN_PATTERN.findall(text):
+        if '가' <= word[0] <= '힣':
+            if len(word) == 1:
+                continue
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+class CorpusStats:
+    """
+    게시글 코퍼스 통계 (문서 수, 토큰별 문서 빈도, IDF)
+    - JSON 파일로 저장/로드
+    """
+
+    def __init__(self, path: str = 'data/corpus_stats.json'):
+        self.path = path
+        self.doc_count = 0
+        self.df: Dict[str, int] = {}
+        self.idf: Dict[str, float] = {}
+        self._dirty = False
+        self._fingerprint = None
+        self._load()
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.doc_count = data.get('doc_count', 0)
+        self.df = data.get('df', {})
+        self.idf = data.get('idf') or self._compute_idf()
+
+    def add_documents(self, texts: Iterable[str]):
+        """게시글 본문을 코퍼스에 추가"""
+        for text in texts:
+            if not text:
+                continue
+            self.doc_count += 1
+            for token in set(tokenize(text)):
+                self.df[token] = self.df.get(token, 0) + 1
+            self._dirty = True
+            self._fingerprint = None
+
+    def _compute_idf(self) -> Dict[str, float]:
+        # 평활화한 IDF: log((1 + N) / (1 + df)) + 1
+        n = self.doc_count
+        return {token: math.log((1 + n) / (1 + df)) + 1 for token, df in self.df.items()}
+
+    def default_idf(self) -> float:
+        """코퍼스에 없는 토큰의 IDF (가장 희귀한 토큰과 같은 값)"""
+        return math.log(1 + self.doc_count) + 1
+
+    def fingerprint(self) -> str:
+        """
+        순위 계산에 쓰는 통계(문서 수, IDF)의 해시
+        - 요약 캐시 키에 넣어 코퍼스가 바뀌면 이전 요약을 쓰지 않도록 함
+        - 통계가 바뀔 때까지 한 번 계산한 값을 재사용
+        """
+        if self._fingerprint is None:
+            state = json.dumps([self.doc_count, self.idf], sort_keys=True, ensure_ascii=False)
+            self._fingerprint = hashlib.sha256(state.encode('utf-8')).hexdigest()[:16]
+        return self._fingerprint
+
+    def save(self):
+        """IDF를 다시 계산해 저장 (변경된 경우에만)"""
+        if not self._dirty:
+            return
+        self.idf = self._compute_idf()
+        self._dirty = False
+        self._fingerprint = None
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'doc_count': self.doc_count, 'df': self.df, 'idf': self.idf},
+                      f, ensure_ascii=False)
+        logger.info(f"📚 코퍼스 통계 저장: 문서 {self.doc_count}건, 토큰 {len(self.df)}개")
+
+class SentenceRanker:
+    """
+    문장 중요도 계산
+    - tfidf: 문장 TF-IDF 벡터와 문서 중심 벡터의 코사인 유사도
+    - textrank: 문장 간 코사인 유사도 그래프의 PageRank
+    """
+
+    def __init__(self, stats: CorpusStats, method: str = 'textrank',
+                 damping: float = 0.85, max_iter: int = 50, tol: float = 1e-6):
+        if method not in ('tfidf', 'textrank'):
+            raise ValueError(f"지원하지 않는 순위 방식입니다: {method}")
+        if np is None:
+            raise ImportError("코퍼스 기반 문장 순위에는 NumPy가 필요합니다 (pip install numpy)")
+        self.stats = stats
+        self.method = method
+        self.damping = damping
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def _matrix(self, sentences: List[str]) -> 'np.ndarray':
+        """문장 × 토큰 TF-IDF 행렬 (행 단위 L2 정규화)"""
+        vocabulary: Dict[str, int] = {}
+        rows, cols, counts = [], [], []
+        for i, sentence in enumerate(sentences):
+            for token in tokenize(sentence):
+                j = vocabulary.setdefault(token, len(vocabulary))
+                rows.append(i)
+                cols.append(j)
+                counts.append(1.0)
+
+        matrix = np.zeros((len(sentences), max(1, len(vocabulary))))
+        if vocabulary:
+            np.add.at(matrix, (np.array(rows), np.array(cols)), np.array(counts))
+            # 코퍼스 통계는 스레드 간 공유되므로 지역 변수로 참조
+            idf_table = self.stats.idf
+            default = self.stats.default_idf()
+            idf = np.empty(len(vocabulary))
+            for token, j in vocabulary.items():
+                idf[j] = idf_table.get(token, default)
+            matrix *= idf
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def rank(self, sentences: List[str]) -> 'np.ndarray':
+        """문장별 점수 (입력 순서)"""
+        if not sentences:
+            return np.zeros(0)
+        matrix = self._matrix(sentences)
+
+        if self.method == 'tfidf':
+            centroid = matrix.sum(axis=0)
+            norm = np.linalg.norm(centroid)
+            if norm == 0:
+                return np.zeros(len(sentences))
+            return matrix @ (centroid / norm)
+
+        # TextRank: 유사도 행렬을 행 정규화한 뒤 거듭제곱법
+        n = len(sentences)
+        similarity = matrix @ matrix.T
+        np.fill_diagonal(similarity, 0.0)
+        row_sums = similarity.sum(axis=1, keepdims=True)
+        row_sums[row_sums == 0] = 1.0
+        transition = similarity / row_sums
+
+        scores = np.full(n, 1.0 / n)
+        for _ in range(self.max_iter):
+            updated = (1 - self.damping) / n + self.damping * (transition.T @ scores)
+            if np.abs(updated - scores).sum() < self.tol:
+                scores = updated
+                break
+            scores = updated
+        return scores
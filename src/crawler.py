@@ -1,228 +1,564 @@
 #!/usr/bin/env python3
 """
 병무청 육군 공지사항 크롤러 - GitHub Actions 버전
+
+대부분의 실행은 새 게시글이 없으므로, 본문 추출(bs4)과 메일 발송(smtplib, email)
+모듈은 처음 필요할 때 import합니다.
 """
 import os
+import re
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, date
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from urllib.parse import urljoin, urlsplit
 import time
+import threading
 import logging
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional
 
 from text_summarizer import SimpleTextSummarizer
-from email_sender import EmailSender
+from rate_limiter import AdaptiveRateLimiter, parse_retry_after
+from post_store import PostStore
+from http_cache import CachingAdapter, HTTPCache, create_cache_from_env
+from board_parser import BoardRow, latest_post_id, parse_board
+from board_config import BoardConfig, load_boards
+from summary_cache import SummaryCache
+from outbox import Outbox
+from search_index import create_index_from_env
+from revisions import content_fingerprint, create_revalidation_from_env
+from run_metrics import RunMetrics
+from resilience import CircuitOpenError, attempts_of, create_breaker_from_env, create_retry_from_env
+
+if TYPE_CHECKING:
+    from attachments import AttachmentDownloader
+    from content_extractor import ContentExtractor, ExtractionResult
+    from email_sender import EmailSender
+    from parse_pool import DetailJob
+    from poll_schedule import PollSchedule
+    from stream_extractor import StreamingExtractor
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+def configure_logging(level: int = logging.INFO):
+    """로깅 설정 (실행 스크립트에서 한 번 호출)"""
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
 class MMABoardCrawler:
-    def __init__(self):
-        self.base_url = "https://www.mma.go.kr"
-        self.board_url = "/board/boardList.do?gesipan_id=69&mc=usr0000127"
+    def __init__(self, max_workers: Optional[int] = None, use_cache: Optional[bool] = None,
+                 boards: Optional[List[BoardConfig]] = None, base_url: Optional[str] = None):
+        # 실행 지표 (단계별 시간, HTTP 상태, 다운로드 바이트 등)
+        self.metrics = RunMetrics()
+        # 단계별 메모리 스냅샷 (--trace-memory 또는 PROFILE_MEMORY=true일 때 main()에서 설정)
+        self.memory_tracer = None
         
-        # 세션 설정
+        # 사이트 주소 (MMA_BASE_URL로 로컬 대체 서버 지정 가능, src/replay_server.py)
+        self.base_url = (base_url or os.getenv('MMA_BASE_URL') or "https://www.mma.go.kr").rstrip('/')
+
+        # 감시할 게시판 목록 (boards.json), 첫 번째 게시판이 기본 게시판
+        self.boards = boards or load_boards()
+        self.board = self.boards[0]
+
+        # 동시 상세 페이지 요청 수 (1이면 순차 처리)
+        if max_workers is None:
+            max_workers = int(os.getenv('CRAWLER_MAX_WORKERS', '4'))
+        self.max_workers = max(1, max_workers)
+
+        # 조건부 요청 디스크 캐시 (HTTP_CACHE=off 또는 use_cache=False면 사용 안 함)
+        if use_cache is False:
+            self.http_cache = None
+        elif use_cache is True:
+            self.http_cache = create_cache_from_env() or HTTPCache()
+        else:
+            self.http_cache = create_cache_from_env()
+
+        # 세션 설정 (동시 요청 수만큼 커넥션 풀 확보)
+        # 연결 오류와 429/5xx 응답은 지터를 넣은 지수 백오프로 재시도 (HTTP_RETRIES, HTTP_BACKOFF)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        adapter = CachingAdapter(
+            self.http_cache,
+            pool_connections=4,
+            pool_maxsize=max(self.max_workers, len(self.boards)),
+            max_retries=create_retry_from_env(on_retry=lambda url, attempt, reason: self.metrics.incr('http_retries')),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # 호스트별 요청 속도 제한 (고정 sleep 대체)
+        self.rate_limiter = AdaptiveRateLimiter()
+        # 호스트별 회로 차단기 (재시도 후에도 연속으로 실패하면 실행을 실패로 처리)
+        self.circuit_breaker = create_breaker_from_env()
+
+        # 처리 이력 저장소 (POST_STORE_PATH를 비우면 사용 안 함)
+        store_path = os.getenv('POST_STORE_PATH', 'data/posts.db')
+        self.store = PostStore(store_path) if store_path else None
+
+        # 상세 페이지 스트리밍 추출 (STREAM_DETAIL=off면 전체 분석), 상세 응답 크기 상한
+        self.stream_detail = os.getenv('STREAM_DETAIL', 'on').lower() not in ('off', 'false', '0')
+        self.max_body_bytes = int(float(os.getenv('DETAIL_MAX_MB', '2')) * 1024 * 1024)
         
+        # 처리할 게시글이 PARSE_POOL_MIN_POSTS건 이상이면 본문 추출/요약을 프로세스 PARSE_WORKERS개로 분산
+        # (기본: CPU 코어 수, 0 또는 1이면 사용 안 함), 작업자에는 PARSE_CHUNKSIZE건씩 전달
+        parse_workers = os.getenv('PARSE_WORKERS', '').strip()
+        self.parse_workers = int(parse_workers) if parse_workers else (os.cpu_count() or 1)
+        self.parse_pool_min_posts = int(os.getenv('PARSE_POOL_MIN_POSTS', '50'))
+        self.parse_chunksize = int(os.getenv('PARSE_CHUNKSIZE', '8'))
+
+        # 첨부파일 다운로더는 받을 첨부파일이 있을 때 생성 (ATTACHMENT_DIR을 비우면 링크만 표시)
+        self.download_attachments = bool(os.getenv('ATTACHMENT_DIR', 'data/attachments'))
+        self._attachment_downloader: Optional['AttachmentDownloader'] = None
+
+        # 본문 추출기와 메일 발송기는 처음 사용할 때 생성 (extractor, email_sender 속성)
+        self._extractor: Optional['ContentExtractor'] = None
+        self._email_sender: Optional['EmailSender'] = None
+
         # 컴포넌트 초기화
-        self.summarizer = SimpleTextSummarizer(max_length=300)
-        self.email_sender = EmailSender()
+        # SUMMARIZER_MODE=tfidf|textrank이면 이전 게시글로 쌓은 코퍼스 통계 사용
+        summarizer_mode = os.getenv('SUMMARIZER_MODE', 'keyword')
+        self.corpus_stats = None
+        if summarizer_mode != 'keyword':
+            from corpus_ranker import CorpusStats
+            self.corpus_stats = CorpusStats(os.getenv('CORPUS_STATS_PATH', 'data/corpus_stats.json'))
+        self.summarizer = SimpleTextSummarizer(
+            max_length=300, mode=summarizer_mode, corpus_stats=self.corpus_stats
+        )
+        # 요약 캐시 (SUMMARY_CACHE_PATH를 비우면 메모리 캐시만 사용)
+        self.summary_cache = SummaryCache(os.getenv('SUMMARY_CACHE_PATH', 'data/summary_cache.db'))
+        # 발송 보관함 (OUTBOX_PATH를 비우면 보관 없이 바로 발송, OUTBOX_RETENTION_DAYS=0이면 기록을 지우지 않음)
+        outbox_path = os.getenv('OUTBOX_PATH', 'data/outbox.db')
+        retention_days = float(os.getenv('OUTBOX_RETENTION_DAYS', '30'))
+        self.outbox = Outbox(
+            outbox_path, retention=retention_days * 24 * 3600 if retention_days > 0 else None
+        ) if outbox_path else None
+        # 전문 검색 색인 (SEARCH_INDEX_PATH를 비우면 색인하지 않음, src/search_index.py로 검색)
+        self.search_index = create_index_from_env()
+        # 최근 게시글 수정 확인 범위 (REVALIDATE_DAYS=0이면 확인 안 함)
+        self.revalidation = create_revalidation_from_env()
+    
+    @property
+    def board_url(self) -> str:
+        """기본 게시판 목록 경로"""
+        return self.board.list_path
     
-    def get_latest_posts(self, count: int = 1) -> List[Dict]:
+    @property
+    def extractor(self) -> 'ContentExtractor':
+        """본문 추출기 (게시판별 성공 선택자를 기억, 설정 파일의 선택자로 초기화)"""
+        if self._extractor is None:
+            from content_extractor import ContentExtractor
+            extractor = ContentExtractor(os.getenv('EXTRACTOR_HINTS_PATH', 'data/extractor_hints.json'))
+            for board in self.boards:
+                if board.selectors.get('content'):
+                    extractor.hints.setdefault(board.key, board.selectors['content'])
+            self._extractor = extractor
+        return self._extractor
+    
+    @property
+    def email_sender(self) -> 'EmailSender':
+        """메일 발송기 (이메일 설정은 실제로 보낼 메일이 있을 때 확인)"""
+        if self._email_sender is None:
+            from email_sender import EmailSender
+            self._email_sender = EmailSender()
+            self._email_sender.metrics = self.metrics
+        return self._email_sender
+    
+    @property
+    def attachment_downloader(self) -> Optional['AttachmentDownloader']:
+        """첨부파일 다운로더 (요청은 _fetch를 거쳐 속도 제한, 재시도, 회로 차단기 적용)"""
+        if self._attachment_downloader is None and self.download_attachments:
+            from attachments import create_downloader_from_env
+            self._attachment_downloader = create_downloader_from_env(
+                self._fetch, on_event=lambda event: self.metrics.incr(f'attachments_{event}')
+            )
+        return self._attachment_downloader
+    
+    def get_latest_posts(self, count: int = 1, board: Optional[BoardConfig] = None) -> List[Dict]:
         """
         최신 게시글 목록 조회 (수동 테스트용)
         """
+        board = board or self.board
         posts = []
         
         try:
-            logger.info(f"🔍 최신 게시글 {count}개 크롤링: {self.base_url + self.board_url}")
-            
-            response = self.session.get(
-                self.base_url + self.board_url, 
-                timeout=30
-            )
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            logger.info(f"🔍 [{board.label}] 최신 게시글 {count}개 크롤링: {self.base_url + board.list_path}")
             
-            # 게시글 테이블 찾기
-            table = soup.select_one('table')
-            if not table:
-                logger.warning("⚠️  게시글 테이블을 찾을 수 없습니다.")
-                return posts
-            
-            # 테이블 행 추출
-            rows = table.select('tbody tr')
-            logger.info(f"📄 총 {len(rows)}개 행 발견")
+            rows = self._fetch_board_rows(board=board)
             
             for idx, row in enumerate(rows[:count]):  # 최신 N개만
-                cells = row.select('td')
-                
-                logger.debug(f"행 {idx}: 셀 개수 = {len(cells)}")
-                
-                # 최소 4개 셀이 있어야 함 (제목, 첨부, 작성일, 조회수)
-                if len(cells) < 4:
-                    logger.debug(f"행 {idx}: 셀 부족 (최소 4개 필요)")
-                    continue
-                
-                try:
-                    # 각 셀의 내용 로깅
-                    for i, cell in enumerate(cells[:4]):
-                        logger.debug(f"  셀 {i}: {cell.get_text(strip=True)[:30]}")
-                    
-                    # 제목과 링크 추출 (첫 번째 셀)
-                    title_cell = cells[0]
-                    title_link = title_cell.select_one('a')
-                    
-                    if title_link and title_link.get('href'):
-                        post = {
-                            'title': title_link.get_text(strip=True),
-                            'url': self._build_full_url(title_link.get('href')),
-                            'date': cells[2].get_text(strip=True),  # 세 번째 셀이 날짜
-                            'number': str(idx + 1)  # 번호는 인덱스로 대체
-                        }
-                        posts.append(post)
-                        logger.info(f"✅ 게시글 발견: {post['title']}")
-                    else:
-                        logger.debug(f"행 {idx}: 링크 없음")
-                
-                except (ValueError, AttributeError) as e:
-                    logger.debug(f"행 {idx}: 파싱 오류 - {e}")
-                    continue
+                post = self._to_post(row, idx, board)
+                posts.append(post)
+                logger.info(f"✅ 게시글 발견: {post['title']}")
             
             logger.info(f"🎯 최신 게시글 {len(posts)}건 수집 완료")
             
         except requests.RequestException as e:
-            logger.error(f"❌ 네트워크 오류: {e}")
+            # 네트워크 오류를 빈 목록으로 바꾸면 "새 게시글 없음"과 구별할 수 없으므로 실행 실패로 처리
+            logger.error(f"❌ [{board.label}] 네트워크 오류: {e}")
+            raise
         except Exception as e:
             logger.error(f"❌ 크롤링 오류: {e}")
         
         return posts
     
-    def get_today_posts(self) -> List[Dict]:
+    def get_today_posts(self, board: Optional[BoardConfig] = None) -> List[Dict]:
         """
         오늘 작성된 게시글 목록 조회
         """
+        board = board or self.board
         posts = []
         today = date.today()
         
         try:
-            logger.info(f"🔍 게시판 크롤링 시작: {self.base_url + self.board_url}")
+            logger.info(f"🔍 [{board.label}] 게시판 크롤링 시작: {self.base_url + board.list_path}")
             
-            response = self.session.get(
-                self.base_url + self.board_url, 
-                timeout=30
-            )
-            response.raise_for_status()
+            rows = self._fetch_board_rows(board=board)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            for row_idx, row in enumerate(rows):
+                # 오늘 날짜와 비교 (날짜 형식이 아니면 None)
+                if row.post_date != today:
+                    continue
+                
+                post = self._to_post(row, row_idx, board)
+                posts.append(post)
+                logger.info(f"✅ 새 게시글 발견: {post['title']}")
             
-            # 게시글 테이블 찾기
-            table = soup.select_one('table')
-            if not table:
-                logger.warning("⚠️  게시글 테이블을 찾을 수 없습니다.")
-                return posts
+            logger.info(f"🎯 [{board.label}] 오늘 작성된 게시글: {len(posts)}건")
             
-            # 테이블 행 추출
-            rows = table.select('tbody tr')
-            logger.info(f"📄 총 {len(rows)}개 행 발견")
+        except requests.RequestException as e:
+            logger.error(f"❌ [{board.label}] 네트워크 오류: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"❌ 크롤링 오류: {e}")
+        
+        return posts
+    
+    def get_new_posts(self, max_pages: int = 3, board: Optional[BoardConfig] = None) -> List[Dict]:
+        """
+        마지막 워터마크 이후 새 게시글 목록 조회
+        - 목록을 위에서부터 읽다가 이미 알림을 보낸 게시글을 만나면 중단
+        - 저장소가 비어 있으면(첫 실행) 오늘 작성된 게시글만 선택하고
+          나머지 게시글 번호로 워터마크를 초기화
+        """
+        board = board or self.board
+        if self.store is None:
+            return self.get_today_posts(board)
+        
+        watermark = self.store.get_watermark(board.key)
+        if watermark is None:
+            return self._seed_watermark(board)
+        
+        posts = []
+        
+        try:
+            logger.info(f"🔍 [{board.label}] 게시판 크롤링 시작: 워터마크 {watermark} 이후")
             
-            for row_idx, row in enumerate(rows):
-                cells = row.select('td')
+            for page_index in range(1, max_pages + 1):
+                url = self._board_page_url(page_index, board)
+                html = self._fetch(url, stage='fetch_list').text
                 
-                # 최소 4개 셀이 있어야 함 (제목, 첨부, 작성일, 조회수)
-                if len(cells) < 4:
-                    continue
+                # 첫 페이지의 가장 큰 게시글 번호가 워터마크 이하이면 파싱 없이 종료
+                if page_index == 1:
+                    latest = latest_post_id(html)
+                    if latest is not None and latest <= watermark:
+                        logger.info(f"🎯 [{board.label}] 새 게시글: 0건 (최신 게시글 {latest})")
+                        return posts
                 
-                try:
-                    # 작성일 추출 및 파싱 (세 번째 셀)
-                    date_text = cells[2].get_text(strip=True)
+                rows = self._rows_from_html(html, url, board)
+                if not rows:
+                    break
+                
+                reached_known = False
+                for row_idx, row in enumerate(rows):
+                    if row.post_id is None:
+                        continue
                     
-                    # 날짜 형식 확인 (YYYY-MM-DD)
-                    post_date = datetime.strptime(date_text, '%Y-%m-%d').date()
+                    if row.post_id <= watermark or self.store.is_notified(row.post_id):
+                        reached_known = True
+                        break
                     
-                    # 오늘 날짜와 비교
-                    if post_date == today:
-                        # 제목과 링크 추출 (첫 번째 셀)
-                        title_cell = cells[0]
-                        title_link = title_cell.select_one('a')
-                        
-                        if title_link and title_link.get('href'):
-                            post = {
-                                'title': title_link.get_text(strip=True),
-                                'url': self._build_full_url(title_link.get('href')),
-                                'date': date_text,
-                                'number': str(row_idx + 1)
-                            }
-                            posts.append(post)
-                            logger.info(f"✅ 새 게시글 발견: {post['title']}")
+                    post = self._to_post(row, len(posts), board)
+                    posts.append(post)
+                    logger.info(f"✅ 새 게시글 발견: {post['title']}")
                 
-                except (ValueError, AttributeError) as e:
-                    # 날짜 파싱 실패 또는 링크 없음 - 계속 진행
-                    continue
+                if reached_known:
+                    break
             
-            logger.info(f"🎯 오늘 작성된 게시글: {len(posts)}건")
+            logger.info(f"🎯 [{board.label}] 새 게시글: {len(posts)}건")
             
         except requests.RequestException as e:
-            logger.error(f"❌ 네트워크 오류: {e}")
+            logger.error(f"❌ [{board.label}] 네트워크 오류: {e}")
+            raise
         except Exception as e:
             logger.error(f"❌ 크롤링 오류: {e}")
         
         return posts
     
+    def _seed_watermark(self, board: BoardConfig) -> List[Dict]:
+        """첫 실행: 오늘 게시글만 선택하고 이전 게시글로 워터마크 초기화"""
+        logger.info(f"🌱 [{board.label}] 처리 이력이 없어 오늘 작성된 게시글 기준으로 시작합니다.")
+        posts = [
+            post for post in self.get_today_posts(board)
+            if post['post_id'] is None or not self.store.is_notified(post['post_id'])
+        ]
+        
+        if not posts:
+            rows = self._fetch_board_rows(board=board)
+            older_ids = [row.post_id for row in rows if row.post_id is not None]
+            if older_ids:
+                self.store.advance_watermark(max(older_ids), board.key)
+        
+        return posts
+    
+    def get_posts_since(self, cutoff: date, max_pages: int = 10,
+                        board: Optional[BoardConfig] = None) -> List[Dict]:
+        """
+        과거 게시글 백필 조회
+        - pageIndex=1..max_pages 순서로 목록 페이지를 순회
+        - 현재 페이지를 파싱하는 동안 다음 페이지를 미리 요청
+        - cutoff보다 오래된 게시글을 만나면 순회 중단
+        """
+        board = board or self.board
+        posts = []
+        seen_urls = set()
+        
+        logger.info(f"🔍 [{board.label}] 백필 크롤링 시작: {cutoff} 이후, 최대 {max_pages}페이지")
+        
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(self._fetch, self._board_page_url(1, board), stage='fetch_list')
+            
+            for page_index in range(1, max_pages + 1):
+                try:
+                    response = pending.result()
+                except requests.RequestException as e:
+                    # 일부 페이지만 수집한 채 끝나지 않도록 실행 실패로 처리
+                    logger.error(f"❌ {page_index}페이지 요청 실패: {e}")
+                    raise
+                
+                # 다음 페이지 미리 요청
+                if page_index < max_pages:
+                    pending = prefetcher.submit(self._fetch, self._board_page_url(page_index + 1, board),
+                                                stage='fetch_list')
+                
+                rows = self._rows_from_html(response.text, self._board_page_url(page_index, board), board)
+                if not rows:
+                    logger.info(f"📄 {page_index}페이지: 게시글 없음 - 순회 종료")
+                    break
+                
+                reached_cutoff = False
+                offset = len(posts)
+                for row_idx, row in enumerate(rows):
+                    if row.post_date is None:
+                        continue
+                    
+                    if row.post_date < cutoff:
+                        reached_cutoff = True
+                        break
+                    
+                    if row.url in seen_urls:
+                        continue
+                    seen_urls.add(row.url)
+                    posts.append(self._to_post(row, offset + row_idx, board))
+                
+                logger.info(f"📄 {page_index}페이지 처리 완료 (누적 {len(posts)}건)")
+                
+                if reached_cutoff:
+                    logger.info(f"⏹️  {cutoff} 이전 게시글 도달 - 순회 종료")
+                    break
+            
+            pending.cancel()
+        
+        logger.info(f"🎯 [{board.label}] 백필 게시글: {len(posts)}건")
+        return posts
+    
+    def _board_page_url(self, page_index: int = 1, board: Optional[BoardConfig] = None) -> str:
+        """게시판 목록 페이지 URL"""
+        url = self.base_url + (board or self.board).list_path
+        if page_index > 1:
+            url += f'&pageIndex={page_index}'
+        return url
+    
+    def _fetch_board_rows(self, page_index: int = 1,
+                          board: Optional[BoardConfig] = None) -> List[BoardRow]:
+        """게시판 목록 페이지를 요청하고 게시글 행 레코드 목록 반환"""
+        board = board or self.board
+        url = self._board_page_url(page_index, board)
+        response = self._fetch(url, stage='fetch_list')
+        return self._rows_from_html(response.text, url, board)
+    
+    def _rows_from_html(self, html: str, url: str, board: BoardConfig) -> List[BoardRow]:
+        """목록 HTML 파싱 (소요 시간 기록, 행이 없으면 경고)"""
+        with self.metrics.stage('parse_list', url):
+            rows = self._parse_board(html, board)
+        if not rows:
+            logger.warning(f"⚠️  [{board.label}] 게시글 테이블을 찾을 수 없습니다.")
+        logger.info(f"📄 [{board.label}] 총 {len(rows)}개 행 발견")
+        return rows
+    
+    def _parse_board(self, html: str, board: BoardConfig) -> List[BoardRow]:
+        """목록 HTML 파싱 (게시판별 상세 URL 파라미터 적용)"""
+        return parse_board(html, lambda href: self._build_full_url(href, board))
+    
+    def _to_post(self, row: BoardRow, row_idx: int, board: Optional[BoardConfig] = None) -> Dict:
+        """목록 행 레코드를 게시글 딕셔너리로 변환"""
+        board = board or self.board
+        return {
+            'title': row.title,
+            'url': row.url,
+            'date': row.date,
+            'post_date': row.post_date,
+            'number': str(row_idx + 1),  # 번호는 인덱스로 대체
+            'post_id': row.post_id,
+            'has_attachment': row.has_attachment,
+            'views': row.views,
+            'board': board.label,
+            'board_key': board.key,
+            'board_url': self.base_url + board.list_path,
+        }
+    
     def get_post_content(self, post_url: str) -> Optional[str]:
         """
         게시글 상세 내용 크롤링
         """
+        result = self.extract_post(post_url)
+        return result.text if result else None
+    
+    def extract_post(self, post_url: str, board_key: Optional[str] = None,
+                     need_links: bool = False) -> Optional['ExtractionResult']:
+        """
+        게시글 상세 내용 크롤링 (추출 선택자, 신뢰도, 첨부 링크 포함)
+        - 기억한 본문 선택자가 단순하면(태그, 태그.클래스, 태그#아이디) 응답을 받으면서 본문 영역만 읽고 중단
+          (need_links=True면 첨부 링크를 찾을 때까지 계속 읽음)
+        - 선택자가 없거나 스트리밍으로 찾지 못하면 응답을 크기 상한까지 읽어 전체 분석
+        """
+        board_key = board_key or self.board.key
+        link_pattern = self._attachment_pattern(board_key)
         try:
             logger.info(f"📖 게시글 내용 크롤링: {post_url}")
             
-            # 요청 간격 조절
-            time.sleep(1)
-            
-            response = self.session.get(post_url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 게시글 내용 추출 (여러 패턴 시도)
-            content_selectors = [
-                'table tbody tr td',  # 기본 테이블 구조
-                '.board-content',      # 클래스명 기반
-                '#content',            # ID 기반
-                'div.content',         # div 컨테이너
-            ]
-            
-            content = None
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text(separator='\n', strip=True)
-                    if len(text) > 100:  # 충분한 길이의 텍스트
-                        content = text
-                        break
-                if content:
-                    break
+            stream = self._extract_streaming(post_url, board_key, link_pattern, need_links)
+            result = stream.result() if stream else None
+            links = stream.links if stream else []
+            # 크기 상한으로 중단한 페이지는 다시 받지 않음
+            if result is None and not (stream and stream.truncated):
+                from stream_extractor import BoundedReader, find_links
+                reader = BoundedReader(self.max_body_bytes)
+                self._fetch(post_url, consume=reader.consume)
+                with self.metrics.stage('extract', post_url):
+                    html = reader.html
+                    result = self.extractor.extract(html, board_key=board_key)
+                    links = find_links(html, link_pattern)
             
-            if content:
-                logger.info(f"✅ 내용 추출 완료: {len(content)}자")
-                return content
+            if result:
+                if links:
+                    # 같은 링크가 본문과 첨부 목록에 모두 있으면 한 번만
+                    result = result._replace(links=tuple(dict.fromkeys(links)))
+                logger.info(f"✅ 내용 추출 완료: {len(result.text)}자 "
+                            f"({result.method}, {result.selector}, 신뢰도 {result.confidence:.2f})")
+                return result
             else:
                 logger.warning("⚠️  게시글 내용을 찾을 수 없습니다.")
                 return None
                 
+        except CircuitOpenError:
+            # 사이트 장애는 게시글 1건 실패로 처리하지 않고 실행 전체를 실패로 처리
+            raise
         except Exception as e:
             logger.error(f"❌ 게시글 내용 크롤링 실패: {e}")
             return None
     
-    def _build_full_url(self, relative_url: str) -> str:
+    def _attachment_pattern(self, board_key: str):
+        """게시판의 첨부 링크 패턴 (selectors.attachment, 없으면 기본 패턴)"""
+        from attachments import ATTACHMENT_LINK_PATTERN
+        board = next((board for board in self.boards if board.key == board_key), self.board)
+        pattern = board.selectors.get('attachment')
+        return re.compile(pattern, re.I) if pattern else ATTACHMENT_LINK_PATTERN
+    
+    def _extract_streaming(self, post_url: str, board_key: str, link_pattern=None,
+                           need_links: bool = False) -> Optional['StreamingExtractor']:
+        """기억한 선택자로 스트리밍 추출 (스트리밍을 쓸 수 없으면 None)"""
+        if not self.stream_detail:
+            return None
+        from stream_extractor import StreamingExtractor
+        hint = self.extractor.hints.get(board_key)
+        if not StreamingExtractor.supports(hint):
+            return None
+        
+        stream = StreamingExtractor(hint, max_bytes=self.max_body_bytes, min_length=self.extractor.min_length,
+                                    link_pattern=link_pattern, need_links=need_links)
+        # 파싱은 응답을 읽는 동안 진행되므로 소요 시간은 fetch_detail 단계에 포함
+        self._fetch(post_url, consume=stream.consume)
+        if stream.result() is None:
+            if not stream.truncated:
+                logger.warning(f"⚠️  스트리밍 추출 실패 ({hint}) - 전체 페이지 분석")
+        elif not stream.closed:
+            logger.warning(f"⚠️  본문 영역이 끝나기 전에 읽기 중단 ({stream.bytes_read:,} bytes)")
+        return stream
+    
+    def _fetch(self, url: str, stage: str = 'fetch_detail',
+               consume: Optional[Callable[[requests.Response], int]] = None,
+               headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        요청 속도 제한과 회로 차단기를 적용한 GET 요청 (재시도는 세션 어댑터에서 처리)
+        - 응답 상태와 지연시간을 제한기에 보고해 속도를 자동 조절
+        - 재시도 후 최종 결과를 회로 차단기에 기록 (연결 오류, 429/5xx만 실패로 계산)
+        - 소요 시간, 상태 코드, 다운로드 바이트를 실행 지표에 기록
+        - consume을 주면 stream=True로 요청하고 consume(response)가 본문을 읽음 (읽은 바이트 수 반환)
+          (상세 페이지(fetch_detail)의 검증자가 있는 200 응답만 consume이 끝난 뒤 본문을 크기 상한까지
+          마저 받아 HTTP 캐시에 저장, 첨부파일은 캐시에 넣지 않음)
+        - headers: 요청별 추가 헤더 (첨부파일 이어 받기의 Range, If-Range 등)
+        """
+        self.circuit_breaker.before_request(url)
+        self.rate_limiter.acquire(url)
+        started = time.monotonic()
+        status = None
+        retry_after = None
+        size = 0
+        from_cache = False
+        attempts = 1
+        try:
+            response = self.session.get(url, timeout=30, stream=consume is not None, headers=headers)
+            status = response.status_code
+            from_cache = getattr(response, 'from_cache', False)
+            attempts = attempts_of(response)
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if consume is None:
+                size = len(response.content)
+                response.raise_for_status()
+            else:
+                try:
+                    response.raise_for_status()
+                    # 다음 요청에서 조건부 요청(304)을 쓸 수 있도록 읽은 본문을 HTTP 캐시에 저장
+                    recorder = (self.http_cache.record(response, self.max_body_bytes)
+                                if self.http_cache is not None and stage == 'fetch_detail' else None)
+                    size = consume(response)
+                    if recorder is not None:
+                        size += recorder.finish()
+                finally:
+                    # 끝까지 읽지 않은 연결은 재사용할 수 없으므로 닫음
+                    response.close()
+            return response
+        finally:
+            elapsed = time.monotonic() - started
+            if status is None or status == 429 or status >= 500:
+                if self.circuit_breaker.record_failure(url):
+                    self.metrics.info['circuit_open'] = urlsplit(url).netloc
+                logger.warning(f"⚠️  요청 실패: {url} ({f'상태 {status}, 시도 {attempts}회' if status else '연결 오류'}, "
+                               f"{elapsed:.2f}초)")
+            else:
+                self.circuit_breaker.record_success(url)
+                if attempts > 1:
+                    logger.info(f"🔁 {attempts}번째 시도에 응답: {url} (상태 {status}, {elapsed:.2f}초)")
+                else:
+                    logger.debug(f"응답: {url} (상태 {status}, {elapsed:.2f}초)")
+            self.rate_limiter.record(url, status, elapsed, retry_after)
+            self.metrics.add_duration(stage, elapsed, url)
+            self.metrics.record_response(status, size, from_cache)
+    
+    def _build_full_url(self, relative_url: str, board: Optional[BoardConfig] = None) -> str:
         """상대 URL을 절대 URL로 변환"""
         if relative_url.startswith('http'):
             return relative_url
@@ -232,89 +568,629 @@ class MMABoardCrawler:
             # 상대 URL에 필요한 파라미터 추가
             if 'boardView.do' in relative_url and 'pageIndex=' not in relative_url:
                 # pageIndex와 기타 필수 파라미터 추가
+                params = (board or self.board).view_params
                 if '?' in relative_url:
-                    relative_url += '&pageIndex=1&searchCondition=&searchKeyword=&pageUnit=10&mc=usr0000127&jbc_gonggibodo=0'
+                    relative_url += '&' + params
                 else:
-                    relative_url += '?pageIndex=1&searchCondition=&searchKeyword=&pageUnit=10&mc=usr0000127&jbc_gonggibodo=0'
+                    relative_url += '?' + params
             
             return self.base_url + '/board/' + relative_url
     
     def process_posts(self, posts: List[Dict]) -> List[Dict]:
         """
-        게시글 목록 처리 (내용 크롤링 및 요약)
+        게시글 목록 처리 (내용 크롤링, 요약, 첨부파일 다운로드)
+        - 저장소에 이미 요약이 있는 게시글은 상세 요청과 요약을 건너뜀
+        - 상세 페이지는 최대 max_workers개까지 동시에 요청
+        - 게시글이 많으면(백필) 본문 추출과 요약은 프로세스 풀에서 코어 수만큼 동시에 처리
+        - 첨부파일은 상세 페이지를 모두 처리한 뒤 URL별로 한 번씩 받음 (ATTACHMENT_WORKERS개까지 동시)
+        - 처리한 게시글은 전문 검색 색인에 추가
+        - 결과는 원래 게시글 순서대로 반환
         """
-        processed_posts = []
-        
+        pending = []
+        reused = []
         for post in posts:
-            logger.info(f"🔄 게시글 처리 중: {post['title']}")
-            
-            # 게시글 내용 크롤링
-            content = self.get_post_content(post['url'])
-            
-            # 내용 요약
-            if content:
-                summary = self.summarizer.summarize(content)
-                post['summary'] = summary
-                post['content_length'] = len(content)
+            stored = self._load_processed(post)
+            if stored:
+                reused.append(post)
+                logger.info(f"♻️  이미 처리된 게시글: {post['title']}")
+                post['summary'] = stored['summary']
+                post['content_length'] = stored['content_length']
+                post['attachments'] = stored['attachments']
             else:
-                post['summary'] = "게시글 내용을 불러올 수 없습니다."
-                post['content_length'] = 0
-            
-            processed_posts.append(post)
+                pending.append(post)
+        self.metrics.incr('posts_skipped', len(posts) - len(pending))
+        self.metrics.incr('posts_processed', len(pending))
+        
+        if self.parse_workers > 1 and len(pending) >= self.parse_pool_min_posts:
+            self._process_with_pool(pending)
+        elif self.max_workers == 1 or len(pending) <= 1:
+            for post in pending:
+                self._process_post(post)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self._process_post, pending))
         
-        return processed_posts
+        self._download_attachments(pending)
+        
+        # 저장소 기록은 메인 스레드에서만 수행
+        if self.store:
+            for post in pending:
+                if post.get('post_id') is not None and post['content_length']:
+                    self.store.save_processed(post)
+        
+        # 새로 처리한 게시글은 본문까지 색인, 저장소에서 불러온 게시글은 색인에 없을 때만 제목과 요약 추가
+        if self.search_index is not None:
+            with self.metrics.stage('index'):
+                self.search_index.add_posts(post for post in pending if post['content_length'])
+                self.search_index.add_posts(reused, replace=False)
+        
+        # 새로 수집한 본문을 코퍼스 통계에 반영
+        if self.corpus_stats is not None:
+            self.corpus_stats.add_documents(post.get('content') for post in pending)
+            self.corpus_stats.save()
+        
+        return posts
+    
+    def _download_attachments(self, posts: List[Dict]):
+        """게시글 첨부파일 다운로드 (결과 크기, sha256, 저장 경로를 첨부 정보에 기록)"""
+        attachments = [attachment for post in posts for attachment in post.get('attachments') or []]
+        downloader = self.attachment_downloader if attachments else None
+        if downloader is None:
+            return
+        logger.info(f"📎 첨부파일 {len(attachments)}개 확인 중")
+        with self.metrics.stage('attachments'):
+            downloader.download_all(attachments)
+    
+    def _load_processed(self, post: Dict) -> Optional[Dict]:
+        """저장소에서 이미 처리된 게시글 조회"""
+        if self.store is None or post.get('post_id') is None:
+            return None
+        return self.store.get_processed(post['post_id'])
+    
+    def _process_post(self, post: Dict) -> Dict:
+        """게시글 1건 처리 (내용 크롤링 및 요약)"""
+        logger.info(f"🔄 게시글 처리 중: {post['title']}")
+        
+        # 게시글 내용 크롤링
+        # 목록에 첨부 표시가 있으면 첨부 링크를 찾을 때까지 상세 페이지를 읽음
+        extraction = self.extract_post(post['url'], post.get('board_key'),
+                                       need_links=bool(post.get('has_attachment')))
+        content = extraction.text if extraction else None
+        
+        # 내용 요약
+        summary = None
+        if content:
+            with self.metrics.stage('summarize', post['url']):
+                summary = self.summary_cache.summarize(content, self.summarizer)
+        return self._fill_post(post, extraction, summary)
+    
+    def _fill_post(self, post: Dict, extraction, summary: Optional[str]) -> Dict:
+        """추출 결과(ExtractionResult 또는 parse_pool.ParsedDetail)와 요약을 게시글에 기록"""
+        content = extraction.text if extraction else None
+        if extraction and content:
+            post['extraction'] = {
+                'selector': extraction.selector,
+                'method': extraction.method,
+                'confidence': extraction.confidence,
+            }
+            post['attachments'] = [
+                {'url': urljoin(post['url'], href), 'name': name} for href, name in extraction.links
+            ]
+        
+        if content:
+            post['content'] = content
+            post['summary'] = summary
+            post['content_length'] = len(content)
+            post['fingerprint'] = content_fingerprint(content)
+        else:
+            post['summary'] = "게시글 내용을 불러올 수 없습니다."
+            post['content_length'] = 0
+        
+        return post
+    
+    def _process_with_pool(self, pending: List[Dict]):
+        """
+        게시글 여러 건 처리: 상세 요청은 스레드, 본문 추출과 요약은 프로세스 풀 (parse_pool.py)
+        - 응답은 바이트로 받아 받은 순서대로 작업자에 chunksize건씩 전달 (요청과 파싱이 겹침)
+        - 결과는 게시글 순서대로 받아 메인 프로세스에서 기억한 선택자에 반영
+        - 요약 캐시에 있는 본문은 저장된 요약을 쓰고, 없는 본문만 작업자에 요약을 맡긴 뒤 캐시에 저장
+        """
+        from parse_pool import ParsePool
+        
+        workers = min(self.parse_workers, len(pending))
+        logger.info(f"🧵 본문 추출/요약을 프로세스 {workers}개로 분산: {len(pending)}건")
+        extractor = self.extractor
+        pool = ParsePool(
+            workers, chunksize=self.parse_chunksize, hints=extractor.hints, min_length=extractor.min_length,
+            max_length=self.summarizer.max_length, mode=self.summarizer.mode,
+            corpus_stats_path=self.corpus_stats.path if self.corpus_stats is not None else None,
+        )
+        with pool, ThreadPoolExecutor(max_workers=self.max_workers) as fetcher:
+            jobs = fetcher.map(self._fetch_detail_job, pending)
+            with self.metrics.stage('parse_pool'):
+                results = []
+                for post, parsed in zip(pending, pool.map(jobs)):
+                    self.metrics.add_duration('extract', parsed.extract_seconds, post['url'])
+                    summary = None
+                    if parsed.text:
+                        extractor.remember(post.get('board_key') or self.board.key, parsed)
+                        summary = self.summary_cache.lookup(parsed.text, self.summarizer)
+                        if summary is None:
+                            summary = pool.summarize(parsed.text)
+                        logger.info(f"✅ 내용 추출 완료: {len(parsed.text)}자 ({parsed.method}, "
+                                    f"{parsed.selector}, 신뢰도 {parsed.confidence:.2f}) - {post['title']}")
+                    else:
+                        logger.warning(f"⚠️  게시글 내용을 찾을 수 없습니다: {post['title']}")
+                    results.append((post, parsed, summary))
+                
+                for post, parsed, summary in results:
+                    if isinstance(summary, Future):
+                        summary, seconds = summary.result()
+                        self.metrics.add_duration('summarize', seconds, post['url'])
+                        self.summary_cache.add(parsed.text, self.summarizer, summary, seconds)
+                    self._fill_post(post, parsed, summary)
+    
+    def _fetch_detail_job(self, post: Dict) -> 'DetailJob':
+        """상세 페이지를 크기 상한까지 바이트로 받아 작업자에 보낼 작업 생성 (실패하면 빈 본문)"""
+        from parse_pool import DetailJob
+        from stream_extractor import BoundedReader
+        
+        board_key = post.get('board_key') or self.board.key
+        reader = BoundedReader(self.max_body_bytes)
+        try:
+            logger.info(f"📖 게시글 내용 크롤링: {post['url']}")
+            self._fetch(post['url'], consume=reader.consume)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 게시글 내용 크롤링 실패: {e}")
+        return DetailJob(reader.body, reader.encoding, board_key, self._attachment_pattern(board_key))
+    
+    def collect_posts(self, select) -> List[Dict]:
+        """
+        모든 게시판에서 게시글 수집
+        - select(board)를 게시판별로 동시에 실행 (전체 시간은 가장 느린 게시판 기준)
+        - 결과는 설정 파일의 게시판 순서대로 병합
+        """
+        with self.metrics.stage('collect'):
+            if len(self.boards) == 1:
+                posts = select(self.boards[0])
+            else:
+                with ThreadPoolExecutor(max_workers=len(self.boards)) as executor:
+                    results = list(executor.map(select, self.boards))
+                posts = [post for board_posts in results for post in board_posts]
+        self.metrics.incr('posts_found', len(posts))
+        return posts
     
     def run(self):
         """
         크롤러 메인 실행 함수
         """
-        logger.info("🚀 병무청 육군 공지사항 크롤러 시작")
+        labels = ', '.join(board.label for board in self.boards)
+        logger.info(f"🚀 병무청 공지사항 크롤러 시작 ({labels})")
         logger.info(f"📅 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # 수동 실행 모드 확인 (GitHub Actions workflow_dispatch)
         is_manual = os.getenv('MANUAL_MODE', 'false').lower() == 'true'
         
+        # 백필 모드 확인 (BACKFILL_SINCE=YYYY-MM-DD)
+        backfill_since = os.getenv('BACKFILL_SINCE', '').strip()
+        self.metrics.info.update({
+            'mode': 'backfill' if backfill_since else 'manual' if is_manual else 'auto',
+            'boards': labels,
+        })
+        
+        success = True
         try:
-            if is_manual:
-                # 수동 실행: 최신 게시글 1개
-                logger.info("🔧 수동 실행 모드: 최신 게시글 1개 조회")
-                posts = self.get_latest_posts(1)
+            self._checkpoint('start')
+            
+            # 1. 이전 실행에서 보내지 못한 메일 먼저 발송
+            self._drain_outbox()
+            
+            if backfill_since:
+                # 백필 실행: 지정 날짜 이후 게시글 전체
+                cutoff = datetime.strptime(backfill_since, '%Y-%m-%d').date()
+                max_pages = int(os.getenv('BACKFILL_MAX_PAGES', '10'))
+                logger.info(f"📚 백필 모드: {cutoff} 이후 게시글 조회 (최대 {max_pages}페이지)")
+                posts = self._skip_queued(self.collect_posts(
+                    lambda board: self.get_posts_since(cutoff, max_pages=max_pages, board=board)
+                ))
+                
+                if not posts:
+                    logger.info(f"ℹ️  {cutoff} 이후 작성된 게시글이 없습니다.")
+                    return
+            elif is_manual:
+                # 수동 실행: 게시판별 최신 게시글 1개
+                logger.info("🔧 수동 실행 모드: 게시판별 최신 게시글 1개 조회")
+                posts = self.collect_posts(lambda board: self.get_latest_posts(1, board=board))
                 
                 if not posts:
                     logger.info("❌ 게시글을 찾을 수 없습니다.")
                     return
             else:
-                # 자동 실행: 오늘 작성된 게시글
-                logger.info("⏰ 자동 실행 모드: 오늘 작성된 게시글 조회")
-                posts = self.get_today_posts()
+                # 자동 실행: 마지막 실행 이후 새 게시글
+                logger.info("⏰ 자동 실행 모드: 새 게시글 조회")
+                if self._revalidation_due():
+                    self.revalidate_posts()
+                posts = self._collect_new_posts()
                 
                 if not posts:
-                    logger.info("ℹ️  오늘 작성된 새 게시글이 없습니다.")
+                    logger.info("ℹ️  새 게시글이 없습니다.")
                     return
             
-            # 2. 게시글 내용 크롤링 및 요약
-            processed_posts = self.process_posts(posts)
+            self._checkpoint('collect')
             
-            # 3. 이메일 알림 발송
-            success = self.email_sender.send_notification(processed_posts)
+            # 2. 게시글 내용 크롤링 및 요약, 3. 이메일 알림 발송
+            # 수동 실행(테스트 발송)은 보관함과 처리 이력에 반영하지 않음
+            success = self._deliver(posts, record=bool(backfill_since) or not is_manual)
             
             if success:
                 logger.info("🎉 크롤링 및 알림 발송 완료!")
             else:
-                logger.error("❌ 알림 발송 실패")
+                logger.error("❌ 알림 발송 실패 (보관함에 남은 메일은 다음 실행에서 다시 발송)")
                 
         except Exception as e:
+            success = False
             logger.error(f"❌ 크롤러 실행 중 오류 발생: {e}")
             raise
+        finally:
+            if self._email_sender is not None:
+                self._email_sender.close()
+            self._report_cache_stats()
+            self.metrics.success = success
+            self._write_report()
+    
+    def revalidate_posts(self) -> int:
+        """
+        최근 게시글 수정 확인, 수정 알림을 보낸(보관함에 넣은) 게시글 수 반환
+        - 처리 이력에서 작성일이 REVALIDATE_DAYS일 이내인 발송 게시글을 최신순으로 REVALIDATE_LIMIT건 확인
+        - 상세 페이지는 조건부 요청으로 받아 304면 본문을 추출하지 않음
+        - 본문 지문이 바뀐 게시글만 이전 본문과 문장 단위로 비교해 바뀐 문장만 알림
+          (요약, 처리 이력, 검색 색인은 새 본문으로 갱신)
+        - 지문이 없던 게시글(수정 감지 이전에 처리)은 지금 본문을 기준으로 기록만 함
+        """
+        config = self.revalidation
+        if self.store is None or not config.enabled:
+            return 0
+        self.store.set_last_revalidation(time.time())
+        since = (date.today() - timedelta(days=config.days)).isoformat()
+        stored = self.store.recent_notified(since, config.limit)
+        if not stored:
+            return 0
+        
+        logger.info(f"🔁 최근 게시글 {len(stored)}건 수정 확인 ({since} 이후 작성)")
+        with self.metrics.stage('revalidate'):
+            if self.max_workers == 1 or len(stored) <= 1:
+                contents = [self._refetch_content(post) for post in stored]
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    contents = list(executor.map(self._refetch_content, stored))
+        self.metrics.incr('posts_revalidated', len(stored))
+        
+        # 저장소 기록은 메인 스레드에서만 수행
+        from revisions import diff_sentences
+        revised = []
+        for post, content in zip(stored, contents):
+            if content is None:
+                continue
+            fingerprint = content_fingerprint(content)
+            if fingerprint == post['fingerprint']:
+                continue
+            changes = diff_sentences(post['content'], content) if post['fingerprint'] else []
+            if not changes:
+                # 기준 본문이 없거나 문장 경계만 바뀐 경우
+                self.store.save_revision(post['post_id'], fingerprint, content, revised=False)
+                continue
+            board = next((board for board in self.boards if board.key == post['board']), self.board)
+            logger.info(f"✏️  수정된 게시글: {post['title']} (바뀐 문장 {len(changes)}개)")
+            revised.append({
+                'post_id': post['post_id'], 'title': post['title'], 'date': post['date'], 'url': post['url'],
+                'board': board.label, 'board_key': board.key, 'board_url': self.base_url + board.list_path,
+                'content': content, 'content_length': len(content),
+                'fingerprint': fingerprint, 'revision': fingerprint[:16],
+                'changes': changes[:config.max_changes],
+                'omitted': max(0, len(changes) - config.max_changes),
+            })
+        if not revised:
+            logger.info("ℹ️  수정된 게시글이 없습니다.")
+            return 0
+        
+        self.metrics.incr('posts_revised', len(revised))
+        with self.metrics.stage('notify'):
+            if self.outbox:
+                # 보관함에 넣으면 발송에 실패해도 다음 실행에서 재발송되므로 바로 새 본문으로 기록
+                subject, text_body, html_body = self.email_sender.render_revisions(revised)
+                for recipient in self.email_sender.recipients:
+                    self.outbox.enqueue(recipient, subject, text_body, html_body, revised)
+                self._drain_outbox()
+                delivered = True
+            else:
+                delivered = self.email_sender.send_revisions(revised)
+        if not delivered:
+            # 지문을 갱신하지 않았으므로 다음 확인에서 다시 수정으로 감지
+            logger.error("❌ 수정 알림 발송 실패 (다음 확인에서 다시 발송)")
+            return 0
+        
+        for post in revised:
+            post['summary'] = self.summary_cache.summarize(post['content'], self.summarizer)
+            self.store.save_revision(post['post_id'], post['fingerprint'], post['content'], post['summary'])
+        if self.search_index is not None:
+            with self.metrics.stage('index'):
+                self.search_index.add_posts(revised)
+        return len(revised)
+    
+    def _refetch_content(self, post: Dict) -> Optional[str]:
+        """
+        저장된 게시글의 현재 본문 (304 등으로 다시 추출할 필요가 없거나 실패하면 None)
+        - 조건부 요청을 쓰려면 응답이 HTTP 캐시에 저장되어야 하므로 스트리밍하지 않고 받음
+        """
+        try:
+            response = self._fetch(post['url'], stage='fetch_detail')
+        except CircuitOpenError:
+            raise
+        except requests.RequestException as e:
+            logger.warning(f"⚠️  수정 확인 실패: {post['title']} ({e})")
+            return None
+        if getattr(response, 'from_cache', False) and post['fingerprint']:
+            return None
+        with self.metrics.stage('extract', post['url']):
+            result = self.extractor.extract(response.text, board_key=post['board'])
+        return result.text if result else None
+    
+    def _revalidation_due(self) -> bool:
+        """
+        자동/상주 실행에서 수정 확인 차례인지
+        - 처리 이력에 기록한 마지막 확인 시각에서 REVALIDATE_INTERVAL초가 지났을 때만
+          (새 게시글이 없는 실행은 목록 요청 1건으로 끝나도록)
+        - HTTP 캐시가 꺼져 있으면 304 없이 매번 전체 상세 페이지를 받게 되므로 확인하지 않음
+        """
+        if self.store is None or self.http_cache is None or not self.revalidation.enabled:
+            return False
+        last = self.store.get_last_revalidation()
+        return last is None or time.time() - last >= self.revalidation.interval
+    
+    def _collect_new_posts(self) -> List[Dict]:
+        """모든 게시판의 새 게시글 (보관함에서 발송을 기다리는 게시글 제외)"""
+        posts = self.collect_posts(lambda board: self.get_new_posts(board=board))
+        return self._skip_queued(posts)
+    
+    def _deliver(self, posts: List[Dict], record: bool = True) -> bool:
+        """
+        게시글 처리(본문, 요약, 첨부파일) 후 알림 발송, 모두 발송되면 True
+        - record=False(수동 실행의 테스트 발송)면 보관함과 처리 이력에 반영하지 않음
+        """
+        with self.metrics.stage('process'):
+            processed_posts = self.process_posts(posts)
+        self._checkpoint('process')
+        
+        with self.metrics.stage('notify'):
+            if self.outbox and record:
+                self._enqueue_notification(processed_posts)
+                success = self._drain_outbox()
+            else:
+                success = self.email_sender.send_notification(processed_posts)
+                if success and self.store and record:
+                    self._mark_notified(processed_posts)
+        self._checkpoint('notify')
+        return success
+    
+    def poll_once(self) -> int:
+        """
+        상주 실행의 조회 1회, 새 게시글 수 반환
+        - 발송할 차례가 된 보관함 메일을 먼저 보내고 새 게시글을 조회
+        - 목록 요청은 HTTP 캐시의 조건부 요청(If-None-Match/If-Modified-Since)이라 변경이 없으면 304
+        - 새 게시글이 있으면 기다리지 않고 바로 처리해 알림 발송
+        """
+        self._drain_outbox()
+        if self._revalidation_due():
+            self.revalidate_posts()
+        posts = self._collect_new_posts()
+        if not posts:
+            return 0
+        
+        logger.info(f"🆕 새 게시글 {len(posts)}건 - 바로 알림 발송")
+        if self._deliver(posts):
+            logger.info("🎉 알림 발송 완료")
+        else:
+            logger.error("❌ 알림 발송 실패 (보관함에 남은 메일은 다음 조회에서 다시 발송)")
+        # 다음 알림까지 오래 걸릴 수 있으므로 SMTP 연결은 닫아 둠 (다음 발송 때 다시 연결)
+        if self._email_sender is not None:
+            self._email_sender.close()
+        return len(posts)
+    
+    def run_daemon(self, schedule: Optional['PollSchedule'] = None,
+                   stop: Optional[threading.Event] = None):
+        """
+        상주 실행: 세션(연결, TLS), HTTP 캐시, 저장소를 유지한 채 적응형 간격으로 새 게시글 조회
+        - 간격은 poll_schedule.PollSchedule (업무시간/최근 활동이면 촘촘하게, 조용하면 점점 길게)
+        - SIGTERM/SIGINT를 받으면 진행 중인 조회를 마치고 종료 (두 번째 신호는 즉시 종료)
+        - 조회 실패(사이트 장애, 회로 차단 등)는 로그를 남기고 회로 차단 시간 이상 쉬었다가 다시 조회
+        """
+        from poll_schedule import KST, create_schedule_from_env
+        
+        if self.store is None:
+            # 처리 이력이 없으면 조회할 때마다 오늘 게시글 전체를 다시 발송하게 됨
+            raise RuntimeError("상주 실행에는 처리 이력 저장소가 필요합니다 (POST_STORE_PATH)")
+        
+        schedule = schedule or create_schedule_from_env()
+        stop = stop or threading.Event()
+        restore = self._install_stop_handlers(stop)
+        labels = ', '.join(board.label for board in self.boards)
+        logger.info(f"🛰️  상주 실행 시작 ({labels})")
+        if self.http_cache is None:
+            logger.warning("⚠️  HTTP 캐시가 꺼져 있어 목록을 매번 새로 받습니다 (조건부 요청 사용 안 함)")
+        self.metrics.info.update({'mode': 'daemon', 'boards': labels})
+        
+        failures = 0
+        try:
+            while not stop.is_set():
+                self.metrics.incr('polls')
+                try:
+                    new_posts = self.poll_once()
+                    failures = 0
+                except Exception as e:
+                    new_posts = 0
+                    failures += 1
+                    self.metrics.incr('poll_failures')
+                    logger.error(f"❌ 조회 실패 ({failures}회 연속): {e}")
+                
+                now = datetime.now(KST)
+                schedule.record(new_posts, now)
+                interval = schedule.next_interval(now)
+                if failures:
+                    interval = max(interval, self.circuit_breaker.cooldown)
+                if new_posts:
+                    self._write_report()
+                wake_at = (now + timedelta(seconds=interval)).strftime('%H:%M:%S')
+                logger.info(f"💤 다음 조회: {interval:.0f}초 후 ({wake_at} KST, {schedule.phase(now)})")
+                stop.wait(interval)
+            logger.info("👋 상주 실행 종료")
+        finally:
+            restore()
+            if self._email_sender is not None:
+                self._email_sender.close()
+            self._report_cache_stats()
+            self._write_report()
+    
+    @staticmethod
+    def _install_stop_handlers(stop: threading.Event) -> Callable[[], None]:
+        """SIGTERM/SIGINT에 stop을 설정하는 핸들러 등록, 이전 핸들러로 되돌리는 함수 반환"""
+        import signal
+        
+        if threading.current_thread() is not threading.main_thread():
+            return lambda: None
+        
+        def handle(signum, frame):
+            if stop.is_set():
+                raise KeyboardInterrupt
+            logger.info(f"🛑 종료 신호 수신 ({signal.Signals(signum).name}) - 진행 중인 조회를 마치고 종료합니다.")
+            stop.set()
+        
+        previous = {signum: signal.signal(signum, handle) for signum in (signal.SIGTERM, signal.SIGINT)}
+        
+        def restore():
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+        return restore
+    
+    def _checkpoint(self, stage: str):
+        """단계 경계 메모리 스냅샷 (메모리 프로파일링을 켠 경우만)"""
+        if self.memory_tracer is not None:
+            self.memory_tracer.checkpoint(stage)
+    
+    def _write_report(self):
+        """실행 지표를 JSON/OpenMetrics로 저장 (RUN_REPORT_DIR을 비우면 저장 안 함)"""
+        stats = self.summary_cache.stats()
+        self.metrics.set_cache('summary', stats['hits'], stats['misses'])
+        if self._email_sender is not None:
+            self.metrics.counters['smtp_reconnects'] = self._email_sender.delivery.reconnects
+        self.metrics.log_summary()
+        
+        report_dir = os.getenv('RUN_REPORT_DIR', 'reports')
+        if not report_dir:
+            return
+        try:
+            self.metrics.write(report_dir)
+        except OSError as e:
+            logger.warning(f"⚠️  실행 보고서 저장 실패: {e}")
+    
+    def _report_cache_stats(self):
+        """요약 캐시 통계 출력"""
+        stats = self.summary_cache.stats()
+        if stats['hits'] + stats['misses'] == 0:
+            return
+        logger.info(
+            f"🗃️  요약 캐시: 적중 {stats['hits']}건 (메모리 {stats['memory_hits']}, "
+            f"디스크 {stats['disk_hits']}), 미스 {stats['misses']}건, "
+            f"적중률 {stats['hit_rate']:.0%}, 절약 시간 {stats['time_saved_seconds']:.3f}초"
+        )
+    
+    def _enqueue_notification(self, posts: List[Dict]):
+        """알림 메일을 한 번 만들어 수신자별로 보관함에 저장"""
+        subject, text_body, html_body = self.email_sender.render(posts)
+        for recipient in self.email_sender.recipients:
+            self.outbox.enqueue(recipient, subject, text_body, html_body, posts)
+    
+    def _drain_outbox(self) -> bool:
+        """보관함에서 발송할 차례인 메일 발송, 실패가 없으면 True"""
+        if not self.outbox:
+            return True
+        with self.metrics.stage('outbox_drain'):
+            result = self.outbox.drain(lambda message: self.email_sender.send_message(
+                message['recipient'], message['subject'], message['text_body'], message['html_body']
+            ))
+        if self.store and result.delivered:
+            self._mark_notified([
+                {'board_key': board_key, 'post_id': post_id} for board_key, post_id in result.delivered
+            ])
+        return result.failed == 0
+    
+    def _skip_queued(self, posts: List[Dict]) -> List[Dict]:
+        """보관함에서 발송을 기다리는 게시글 제외 (같은 게시글을 두 번 알리지 않도록)"""
+        if not self.outbox or not posts:
+            return posts
+        queued = self.outbox.queued_urls()
+        if not queued:
+            return posts
+        remaining = [post for post in posts if post['url'] not in queued]
+        self.metrics.incr('posts_skipped', len(posts) - len(remaining))
+        if len(remaining) < len(posts):
+            logger.info(f"📮 보관함에서 발송 대기 중인 게시글 {len(posts) - len(remaining)}건 제외")
+        return remaining
+    
+    def _mark_notified(self, posts: List[Dict]):
+        """발송 완료 게시글을 게시판별로 처리 이력에 기록"""
+        by_board: Dict[str, List[int]] = {}
+        for post in posts:
+            if post.get('post_id') is not None:
+                by_board.setdefault(post.get('board_key', self.board.key), []).append(post['post_id'])
+        for board_key, post_ids in by_board.items():
+            self.store.mark_notified(post_ids, board_key)
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """메인 실행 함수"""
-    try:
+    import argparse
+    
+    configure_logging()
+    parser = argparse.ArgumentParser(description='병무청 공지사항 크롤러')
+    parser.add_argument('--profile', action='store_true',
+                        default=os.getenv('PROFILE_CPU', 'false').lower() == 'true',
+                        help='cProfile로 실행 (pstats + collapsed stack 저장, PROFILE_CPU=true)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        default=os.getenv('PROFILE_MEMORY', 'false').lower() == 'true',
+                        help='단계마다 tracemalloc 할당 위치 기록 (PROFILE_MEMORY=true)')
+    parser.add_argument('--daemon', action='store_true',
+                        default=os.getenv('DAEMON_MODE', 'false').lower() == 'true',
+                        help='상주 실행: 적응형 간격으로 계속 조회하고 새 게시글이 있으면 바로 알림 (DAEMON_MODE=true)')
+    parser.add_argument('--profile-dir', default=os.getenv('PROFILE_DIR', 'reports/profile'),
+                        help='프로파일 저장 위치 (기본 reports/profile)')
+    args = parser.parse_args(argv)
+    
+    memory_tracer = None
+    if args.trace_memory:
+        from profiling import MemoryTracer
+        memory_tracer = MemoryTracer(args.profile_dir)
+    
+    def execute():
         crawler = MMABoardCrawler()
-        crawler.run()
+        crawler.memory_tracer = memory_tracer
+        if args.daemon:
+            crawler.run_daemon()
+        else:
+            crawler.run()
+    
+    try:
+        if args.profile:
+            from profiling import profile_call
+            profile_call(execute, args.profile_dir)
+        else:
+            execute()
     except Exception as e:
         logger.error(f"❌ 프로그램 실행 실패: {e}")
         raise
+    finally:
+        if memory_tracer is not None:
+            memory_tracer.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
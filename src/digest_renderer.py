@@ -0,0 +1,286 @@
+"""
+알림 메일 본문 렌더러
+- 템플릿은 모듈 로드 시 한 번만 준비 (CSS 블록 포함)
+- 게시글을 한 번 순회하며 텍스트/HTML 본문 조각을 함께 생성
+- HTML에 들어가는 값은 모두 이스케이프, 확인 시간은 두 본문이 같은 값 사용
+- 첨부파일이 있는 게시글은 파일 이름, 크기, 원본 링크 목록 표시
+- 수정 알림(render_revisions)은 게시글마다 바뀐 문장만 이전/이후로 표시
+"""
+import io
+from html import escape
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+# (게시판 이름, 게시판 URL, 게시글 목록)
+BoardGroup = Tuple[str, str, List[Dict]]
+
+NO_SUMMARY = '요약 정보가 없습니다.'
+SEPARATOR = '=' * 60
+NEWLINE = '\n'
+GROUP_SEPARATOR = '-' * 60
+
+TEXT_HEADER = """
+🎯 {title} 알림
+
+📅 확인 시간: {time}
+📝 새 게시글: {count}건
+
+""" + SEPARATOR + "\n"
+
+TEXT_REVISION_HEADER = """
+✏️ {title} 수정 알림
+
+📅 확인 시간: {time}
+📝 수정된 게시글: {count}건
+
+""" + SEPARATOR + "\n"
+
+TEXT_BOARD_LINK = "🔗 병무청 {label} 공지사항: {url}\n"
+
+TEXT_FOOTER = """
+※ 이 메일은 GitHub Actions를 통해 자동 발송되었습니다.
+※ 중요한 내용은 반드시 원문을 확인해주세요.
+"""
+
+HTML_STYLE = """
+        body { font-family: 'Malgun Gothic', sans-serif; line-height: 1.6; color: #333; }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; }
+        .content { background: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0; }
+        .post { background: white; margin: 15px 0; padding: 20px; border-radius: 8px; border-left: 4px solid #007bff; }
+        .post-title { color: #007bff; font-weight: bold; font-size: 16px; margin-bottom: 10px; }
+        .post-meta { color: #6c757d; font-size: 14px; margin-bottom: 15px; }
+        .post-summary { background: #e9ecef; padding: 15px; border-radius: 5px; font-size: 14px; }
+        .footer { text-align: center; color: #6c757d; font-size: 12px; margin-top: 30px; }
+        .link-button { display: inline-block; background: #28a745; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; margin: 10px 0; }
+        .post-attachments { margin-top: 10px; font-size: 14px; }
+        .post-attachments ul { margin: 5px 0; padding-left: 20px; }
+        .post-changes { background: #fff8e1; padding: 15px; border-radius: 5px; font-size: 14px; }
+        .post-changes ul { margin: 5px 0; padding-left: 20px; }
+        .change-old { color: #c0392b; text-decoration: line-through; }
+        .change-new { color: #1e8449; }
+        .board-title { color: #495057; font-size: 18px; font-weight: bold; margin: 25px 0 5px; }
+    """
+
+# CSS는 고정 문자열이라 format 대상에서 제외하고 미리 이어 붙임
+HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>""" + HTML_STYLE + """</style>
+</head>
+<body>
+"""
+
+HTML_HEADER = """    <div class="header">
+        <h2>🎯 {title} 알림</h2>
+        <p>📅 {time} | 📝 새 게시글 {count}건</p>
+    </div>
+
+    <div class="content">
+"""
+
+HTML_REVISION_HEADER = """    <div class="header">
+        <h2>✏️ {title} 수정 알림</h2>
+        <p>📅 {time} | 📝 수정된 게시글 {count}건</p>
+    </div>
+
+    <div class="content">
+"""
+
+HTML_CONTENT_END = """
+    </div>
+
+    <div class="footer">
+"""
+
+HTML_BOARD_LINK = """
+        <p>
+            <a href="{url}" target="_blank">
+                🔗 병무청 {label} 공지사항 바로가기
+            </a>
+        </p>
+"""
+
+HTML_FOOTER = """
+        <p>※ 이 메일은 GitHub Actions를 통해 자동 발송되었습니다.</p>
+        <p>※ 중요한 내용은 반드시 원문을 확인해주세요.</p>
+    </div>
+</body>
+</html>
+"""
+
+def board_title(groups: List[BoardGroup]) -> str:
+    """알림 제목용 게시판 이름 (여러 게시판이면 '병무청 공지사항')"""
+    if len(groups) == 1:
+        return f"병무청 {groups[0][0]} 공지사항"
+    return "병무청 공지사항"
+
+def format_size(size) -> str:
+    """파일 크기 표시 (1,024 단위, 크기를 모르면 빈 문자열)"""
+    if size is None:
+        return ''
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024 or unit == 'MB':
+            break
+        size /= 1024
+    return f"{size:,.0f}{unit}" if unit == 'B' else f"{size:,.1f}{unit}"
+
+def _attachment_parts(attachments: List[Dict]) -> Tuple[str, str]:
+    """첨부파일 목록의 텍스트/HTML 조각 (첨부파일이 없으면 빈 문자열)"""
+    if not attachments:
+        return '', ''
+    text_lines, html_items = [], []
+    for attachment in attachments:
+        name = attachment.get('name') or attachment['url']
+        size = format_size(attachment.get('size'))
+        suffix = f" ({size})" if size else ''
+        text_lines.append(f"- {name}{suffix}: {attachment['url']}\n")
+        html_items.append(
+            f'                    <li><a href="{escape(attachment["url"])}" target="_blank">'
+            f'{escape(name)}</a>{escape(suffix)}</li>\n'
+        )
+    text = f"\n📎 첨부파일 {len(attachments)}개:\n{''.join(text_lines)}"
+    html = (
+        f'            <div class="post-attachments">\n'
+        f'                <strong>📎 첨부파일 {len(attachments)}개</strong>\n'
+        f'                <ul>\n{"".join(html_items)}                </ul>\n'
+        f'            </div>\n'
+    )
+    return text, html
+
+def _change_parts(changes, omitted: int = 0) -> Tuple[str, str]:
+    """바뀐 문장 목록의 텍스트/HTML 조각 (changes: revisions.SentenceChange 목록)"""
+    text_lines, html_items = [], []
+    for old, new in changes:
+        if old is not None and new is not None:
+            text_lines.append(f"- 이전: {old}\n+ 이후: {new}\n")
+            html_items.append(
+                f'                    <li><span class="change-old">{escape(old)}</span><br>\n'
+                f'                        <span class="change-new">{escape(new)}</span></li>\n'
+            )
+        elif new is not None:
+            text_lines.append(f"+ 추가: {new}\n")
+            html_items.append(f'                    <li>추가: <span class="change-new">{escape(new)}</span></li>\n')
+        else:
+            text_lines.append(f"- 삭제: {old}\n")
+            html_items.append(f'                    <li>삭제: <span class="change-old">{escape(old)}</span></li>\n')
+    if omitted:
+        text_lines.append(f"(외 {omitted}문장)\n")
+        html_items.append(f'                    <li>외 {omitted}문장</li>\n')
+    text = f"🔄 바뀐 문장:\n{''.join(text_lines)}"
+    html = (
+        f'            <div class="post-changes">\n'
+        f'                <strong>🔄 바뀐 문장:</strong>\n'
+        f'                <ul>\n{"".join(html_items)}                </ul>\n'
+        f'            </div>\n'
+    )
+    return text, html
+
+def write_digest(groups: List[BoardGroup], now: datetime,
+                 write_text: Callable[[str], object], write_html: Callable[[str], object]):
+    """
+    게시글 목록을 한 번 순회하며 텍스트/HTML 본문 조각을 각각 write_text, write_html로 출력
+    - StringIO.write, list.append, 파일 write 모두 사용 가능
+    """
+    title = board_title(groups)
+    count = sum(len(group) for _, _, group in groups)
+    current_time = now.strftime('%Y-%m-%d %H:%M:%S')
+    multiple = len(groups) > 1
+
+    write_text(TEXT_HEADER.format(title=title, time=current_time, count=count))
+    write_html(HTML_HEAD)
+    write_html(HTML_HEADER.format(title=escape(title), time=current_time, count=count))
+
+    index = 0
+    for label, _, group in groups:
+        if multiple:
+            write_text(f"\n🪖 {label} ({len(group)}건)\n{GROUP_SEPARATOR}\n")
+            write_html(f'\n        <div class="board-title">🪖 {escape(label)} ({len(group)}건)</div>\n')
+        for post in group:
+            index += 1
+            post_title, date, url = post['title'], str(post['date']), post['url']
+            summary = post.get('summary', NO_SUMMARY)
+            attachments_text, attachments_html = _attachment_parts(post.get('attachments'))
+            # 게시글 템플릿은 호출이 많아 str.format 대신 f-string으로 작성
+            write_text(
+                f"\n📌 게시글 {index}\n\n제목: {post_title}\n작성일: {date}\n링크: {url}\n\n"
+                f"📋 요약:\n{summary}\n{attachments_text}\n{SEPARATOR}\n"
+            )
+            write_html(
+                f'\n        <div class="post">\n'
+                f'            <div class="post-title">📌 {escape(post_title)}</div>\n'
+                f'            <div class="post-meta">\n'
+                f'                작성일: {escape(date)} |\n'
+                f'                <a href="{escape(url)}" class="link-button" target="_blank">📖 원문 보기</a>\n'
+                f'            </div>\n'
+                f'            <div class="post-summary">\n'
+                f'                <strong>📋 요약:</strong><br>\n'
+                f'                {escape(summary).replace(NEWLINE, "<br>")}\n'
+                f'            </div>\n'
+                f'{attachments_html}'
+                f'        </div>\n'
+            )
+
+    write_text('\n\n')
+    write_html(HTML_CONTENT_END)
+    for label, url, _ in groups:
+        write_text(TEXT_BOARD_LINK.format(label=label, url=url))
+        write_html(HTML_BOARD_LINK.format(label=escape(label), url=escape(url)))
+    write_text(TEXT_FOOTER)
+    write_html(HTML_FOOTER)
+
+def render_digest(groups: List[BoardGroup], now: datetime) -> Tuple[str, str]:
+    """텍스트 본문과 HTML 본문을 한 번에 생성"""
+    text_buffer, html_buffer = io.StringIO(), io.StringIO()
+    write_digest(groups, now, text_buffer.write, html_buffer.write)
+    return text_buffer.getvalue(), html_buffer.getvalue()
+
+def render_revisions(groups: List[BoardGroup], now: datetime) -> Tuple[str, str]:
+    """
+    수정 알림 텍스트/HTML 본문 생성
+    - 게시글마다 changes(바뀐 문장)와 omitted(표시하지 않은 문장 수)만 표시하고 요약은 생략
+    """
+    text_buffer, html_buffer = io.StringIO(), io.StringIO()
+    write_text, write_html = text_buffer.write, html_buffer.write
+    title = board_title(groups)
+    count = sum(len(group) for _, _, group in groups)
+    current_time = now.strftime('%Y-%m-%d %H:%M:%S')
+    multiple = len(groups) > 1
+
+    write_text(TEXT_REVISION_HEADER.format(title=title, time=current_time, count=count))
+    write_html(HTML_HEAD)
+    write_html(HTML_REVISION_HEADER.format(title=escape(title), time=current_time, count=count))
+
+    index = 0
+    for label, _, group in groups:
+        if multiple:
+            write_text(f"\n🪖 {label} ({len(group)}건)\n{GROUP_SEPARATOR}\n")
+            write_html(f'\n        <div class="board-title">🪖 {escape(label)} ({len(group)}건)</div>\n')
+        for post in group:
+            index += 1
+            post_title, date, url = post['title'], str(post['date']), post['url']
+            changes_text, changes_html = _change_parts(post['changes'], post.get('omitted', 0))
+            write_text(
+                f"\n✏️ 게시글 {index}\n\n제목: {post_title}\n작성일: {date}\n링크: {url}\n\n"
+                f"{changes_text}\n{SEPARATOR}\n"
+            )
+            write_html(
+                f'\n        <div class="post">\n'
+                f'            <div class="post-title">✏️ {escape(post_title)}</div>\n'
+                f'            <div class="post-meta">\n'
+                f'                작성일: {escape(date)} |\n'
+                f'                <a href="{escape(url)}" class="link-button" target="_blank">📖 원문 보기</a>\n'
+                f'            </div>\n'
+                f'{changes_html}'
+                f'        </div>\n'
+            )
+
+    write_text('\n\n')
+    write_html(HTML_CONTENT_END)
+    for label, url, _ in groups:
+        write_text(TEXT_BOARD_LINK.format(label=label, url=url))
+        write_html(HTML_BOARD_LINK.format(label=escape(label), url=escape(url)))
+    write_text(TEXT_FOOTER)
+    write_html(HTML_FOOTER)
+    return text_buffer.getvalue(), html_buffer.getvalue()
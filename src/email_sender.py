@@ -1,21 +1,34 @@
 """
 Gmail SMTP를 이용한 이메일 발송
 """
-import smtplib
 import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import logging
 
-logging.basicConfig(level=logging.INFO)
+from smtp_delivery import SMTPDeliveryEngine
+from digest_renderer import render_digest, render_revisions
+from run_metrics import RunMetrics
+
 logger = logging.getLogger(__name__)
 
+# 게시판 정보가 없는 게시글의 기본값 (육군 공지사항)
+DEFAULT_BOARD_LABEL = '육군'
+DEFAULT_BOARD_URL = 'https://www.mma.go.kr/board/boardList.do?gesipan_id=69&mc=usr0000127'
+
+# RECIPIENT_EMAIL 구분자 (쉼표, 세미콜론, 공백)
+RECIPIENT_SEPARATOR = re.compile(r'[,;\s]+')
+
 class EmailSender:
     def __init__(self):
-        self.smtp_server = "smtp.gmail.com"
-        self.smtp_port = 587
+        # SMTP_SERVER/SMTP_PORT/SMTP_STARTTLS로 로컬 테스트 서버(aiosmtpd 등) 지정 가능
+        self.smtp_server = os.getenv('SMTP_SERVER', "smtp.gmail.com")
+        self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
+        self.smtp_starttls = os.getenv('SMTP_STARTTLS', 'true').lower() == 'true'
         self.sender_email = os.getenv('SENDER_EMAIL')
         self.sender_password = os.getenv('SENDER_PASSWORD')
         self.recipient_email = os.getenv('RECIPIENT_EMAIL')
@@ -23,140 +36,145 @@ class EmailSender:
         # 환경변수 검증
         if not all([self.sender_email, self.sender_password, self.recipient_email]):
             raise ValueError("이메일 설정이 완료되지 않았습니다. GitHub Secrets를 확인해주세요.")
+        
+        # 수신자 목록 (RECIPIENT_EMAIL에 여러 주소를 쉼표로 구분해 입력)
+        self.recipients = [addr for addr in RECIPIENT_SEPARATOR.split(self.recipient_email) if addr]
+        
+        # 연결을 유지하는 발송 엔진 (SMTP_POOL_SIZE개 연결)
+        self.delivery = SMTPDeliveryEngine(
+            self.smtp_server, self.smtp_port,
+            username=self.sender_email, password=self.sender_password,
+            use_starttls=self.smtp_starttls,
+            pool_size=int(os.getenv('SMTP_POOL_SIZE', '1')),
+        )
+        self._background: Optional[ThreadPoolExecutor] = None
+        # 실행 지표 (크롤러가 자신의 지표로 교체)
+        self.metrics = RunMetrics()
     
     def send_notification(self, posts: List[Dict]) -> bool:
         """
         새 게시글 알림 이메일 발송
+        - 본문은 한 번만 만들고 수신자마다 메시지를 만들어 같은 연결로 발송
+        - 모든 수신자에게 발송되면 True
         """
         if not posts:
             logger.info("발송할 게시글이 없습니다.")
             return True
         
         try:
-            # 이메일 메시지 생성
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.sender_email
-            msg['To'] = self.recipient_email
-            msg['Subject'] = self._create_subject(posts)
-            
-            # HTML과 텍스트 버전 모두 생성
-            text_body = self._create_text_body(posts)
-            html_body = self._create_html_body(posts)
-            
-            # 메시지에 추가
-            msg.attach(MIMEText(text_body, 'plain', 'utf-8'))
-            msg.attach(MIMEText(html_body, 'html', 'utf-8'))
-            
-            # SMTP 서버 연결 및 발송
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
-            
-            logger.info(f"✅ 이메일 발송 완료: {len(posts)}건")
+            subject, text_body, html_body = self.render(posts)
+        except Exception as e:
+            logger.error(f"❌ 이메일 발송 실패: {e}")
+            return False
+        
+        if self._send_all(subject, text_body, html_body):
+            logger.info(f"✅ 이메일 발송 완료: {len(posts)}건 → 수신자 {len(self.recipients)}명")
+            return True
+        return False
+    
+    def send_revisions(self, posts: List[Dict]) -> bool:
+        """수정 알림 이메일 발송 (게시글마다 바뀐 문장만), 모든 수신자에게 발송되면 True"""
+        if not posts:
+            return True
+        try:
+            subject, text_body, html_body = self.render_revisions(posts)
+        except Exception as e:
+            logger.error(f"❌ 수정 알림 발송 실패: {e}")
+            return False
+        
+        if self._send_all(subject, text_body, html_body):
+            logger.info(f"✅ 수정 알림 발송 완료: {len(posts)}건 → 수신자 {len(self.recipients)}명")
             return True
+        return False
+    
+    def _send_all(self, subject: str, text_body: str, html_body: str) -> bool:
+        """같은 메일을 모든 수신자에게 발송 (같은 연결 사용), 모두 발송되면 True"""
+        try:
+            messages = [
+                (self._build_message(recipient, subject, text_body, html_body), [recipient])
+                for recipient in self.recipients
+            ]
+            with self.metrics.stage('smtp_send'):
+                results = self.delivery.send_batch(messages)
             
         except Exception as e:
             logger.error(f"❌ 이메일 발송 실패: {e}")
             return False
+        
+        failed = [recipient for recipient, ok in zip(self.recipients, results) if not ok]
+        self.metrics.incr('emails_sent', len(results) - len(failed))
+        self.metrics.incr('emails_failed', len(failed))
+        if failed:
+            logger.error(f"❌ 이메일 발송 실패: {len(failed)}/{len(self.recipients)}명 ({', '.join(failed)})")
+            return False
+        return True
     
-    def _create_subject(self, posts: List[Dict]) -> str:
-        """이메일 제목 생성"""
-        today = datetime.now().strftime('%m/%d')
-        return f"🚨 [병무청] 육군 공지 {len(posts)}건 업데이트 ({today})"
+    def render(self, posts: List[Dict]) -> Tuple[str, str, str]:
+        """알림 메일 제목, 텍스트 본문, HTML 본문 생성 (같은 확인 시간 사용)"""
+        with self.metrics.stage('render'):
+            now = datetime.now()
+            groups = self._group_by_board(posts)
+            text_body, html_body = render_digest(groups, now)
+            return self._create_subject(posts, now), text_body, html_body
     
-    def _create_text_body(self, posts: List[Dict]) -> str:
-        """텍스트 이메일 본문 생성"""
-        body = f"""
-🎯 병무청 육군 공지사항 알림
-
-📅 확인 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-📝 새 게시글: {len(posts)}건
-
-{'='*60}
-"""
-        
-        for i, post in enumerate(posts, 1):
-            body += f"""
-📌 게시글 {i}
-
-제목: {post['title']}
-작성일: {post['date']}
-링크: {post['url']}
-
-📋 요약:
-{post.get('summary', '요약 정보가 없습니다.')}
-
-{'='*60}
-"""
-        
-        body += """
-
-🔗 병무청 육군 공지사항: https://www.mma.go.kr/board/boardList.do?gesipan_id=69&mc=usr0000127
-
-※ 이 메일은 GitHub Actions를 통해 자동 발송되었습니다.
-※ 중요한 내용은 반드시 원문을 확인해주세요.
-"""
-        return body
+    def render_revisions(self, posts: List[Dict]) -> Tuple[str, str, str]:
+        """수정 알림 메일 제목, 텍스트 본문, HTML 본문 생성"""
+        with self.metrics.stage('render'):
+            now = datetime.now()
+            groups = self._group_by_board(posts)
+            text_body, html_body = render_revisions(groups, now)
+            subject = f"✏️ [병무청] 공지 {len(posts)}건 수정 ({now.strftime('%m/%d')})"
+            return subject, text_body, html_body
     
-    def _create_html_body(self, posts: List[Dict]) -> str:
-        """HTML 이메일 본문 생성"""
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{ font-family: 'Malgun Gothic', sans-serif; line-height: 1.6; color: #333; }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; }}
-        .content {{ background: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0; }}
-        .post {{ background: white; margin: 15px 0; padding: 20px; border-radius: 8px; border-left: 4px solid #007bff; }}
-        .post-title {{ color: #007bff; font-weight: bold; font-size: 16px; margin-bottom: 10px; }}
-        .post-meta {{ color: #6c757d; font-size: 14px; margin-bottom: 15px; }}
-        .post-summary {{ background: #e9ecef; padding: 15px; border-radius: 5px; font-size: 14px; }}
-        .footer {{ text-align: center; color: #6c757d; font-size: 12px; margin-top: 30px; }}
-        .link-button {{ display: inline-block; background: #28a745; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; margin: 10px 0; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h2>🎯 병무청 육군 공지사항 알림</h2>
-        <p>📅 {current_time} | 📝 새 게시글 {len(posts)}건</p>
-    </div>
+    def send_message(self, recipient: str, subject: str, text_body: str, html_body: str) -> bool:
+        """미리 만든 메일을 수신자 1명에게 발송 (보관함 재발송용)"""
+        with self.metrics.stage('smtp_send', recipient):
+            ok = self.delivery.send(self._build_message(recipient, subject, text_body, html_body), [recipient])
+        self.metrics.incr('emails_sent' if ok else 'emails_failed')
+        return ok
     
-    <div class="content">
-"""
-        
-        for i, post in enumerate(posts, 1):
-            html += f"""
-        <div class="post">
-            <div class="post-title">📌 {post['title']}</div>
-            <div class="post-meta">
-                작성일: {post['date']} | 
-                <a href="{post['url']}" class="link-button" target="_blank">📖 원문 보기</a>
-            </div>
-            <div class="post-summary">
-                <strong>📋 요약:</strong><br>
-                {post.get('summary', '요약 정보가 없습니다.').replace(chr(10), '<br>')}
-            </div>
-        </div>
-"""
+    def send_notification_async(self, posts: List[Dict]) -> "Future[bool]":
+        """백그라운드 스레드에서 알림 발송 (결과는 Future로 확인)"""
+        if self._background is None:
+            self._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix='email')
+        return self._background.submit(self.send_notification, posts)
+    
+    def close(self):
+        """백그라운드 발송을 마치고 SMTP 연결 종료"""
+        if self._background is not None:
+            self._background.shutdown(wait=True)
+            self._background = None
+        self.delivery.close()
+    
+    def _build_message(self, recipient: str, subject: str,
+                       text_body: str, html_body: str) -> MIMEMultipart:
+        """수신자 1명에게 보낼 메시지 생성"""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = self.sender_email
+        msg['To'] = recipient
+        msg['Subject'] = subject
         
-        html += """
-    </div>
+        # 메시지에 추가
+        msg.attach(MIMEText(text_body, 'plain', 'utf-8'))
+        msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+        return msg
     
-    <div class="footer">
-        <p>
-            <a href="https://www.mma.go.kr/board/boardList.do?gesipan_id=69&mc=usr0000127" target="_blank">
-                🔗 병무청 육군 공지사항 바로가기
-            </a>
-        </p>
-        <p>※ 이 메일은 GitHub Actions를 통해 자동 발송되었습니다.</p>
-        <p>※ 중요한 내용은 반드시 원문을 확인해주세요.</p>
-    </div>
-</body>
-</html>
-"""
-        return html
\ No newline at end of file
+    @staticmethod
+    def _group_by_board(posts: List[Dict]) -> List[Tuple[str, str, List[Dict]]]:
+        """게시글을 게시판별로 묶기 (게시판 등장 순서 유지)"""
+        groups: Dict[str, Tuple[str, str, List[Dict]]] = {}
+        for post in posts:
+            label = post.get('board', DEFAULT_BOARD_LABEL)
+            if label not in groups:
+                groups[label] = (label, post.get('board_url', DEFAULT_BOARD_URL), [])
+            groups[label][2].append(post)
+        return list(groups.values())
+    
+    def _create_subject(self, posts: List[Dict], now: Optional[datetime] = None) -> str:
+        """이메일 제목 생성"""
+        today = (now or datetime.now()).strftime('%m/%d')
+        groups = self._group_by_board(posts)
+        if len(groups) == 1:
+            return f"🚨 [병무청] {groups[0][0]} 공지 {len(posts)}건 업데이트 ({today})"
+        counts = ', '.join(f"{label} {len(group)}" for label, _, group in groups)
+        return f"🚨 [병무청] 공지 {len(posts)}건 업데이트 ({counts}) ({today})"
@@ -0,0 +1,268 @@
+"""
+조건부 요청(ETag/Last-Modified) 기반 디스크 HTTP 캐시
+- 응답 본문과 검증자(ETag, Last-Modified)를 디스크에 저장
+- 다음 요청에 If-None-Match / If-Modified-Since 헤더 추가
+- 304 응답이면 디스크에 저장된 본문으로 응답 구성
+- stream=True 응답은 읽는 쪽이 받은 바이트를 StreamRecorder로 모아 다 읽은 뒤 저장
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+import logging
+from typing import Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+class HTTPCache:
+    """
+    URL별 응답 본문 디스크 저장소
+    - max_bytes: 본문 총 크기 상한 (초과 시 오래 사용하지 않은 항목부터 삭제)
+    - max_age: 마지막 검증 이후 보관 기간(초)
+    """
+
+    def __init__(self, directory: str = 'data/http_cache',
+                 max_bytes: int = 50 * 1024 * 1024,
+                 max_age: float = 30 * 24 * 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """저장된 항목의 메타데이터 조회 (만료되었으면 삭제 후 None)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get('validated_at', 0) > self.max_age:
+            self._remove(meta_path, body_path)
+            return None
+        return meta
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        """저장된 본문 읽기"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        # 최근 사용 시각 갱신 (크기 기반 제거 순서에 사용)
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        return body
+
+    def store(self, url: str, response: requests.Response, body: Optional[bytes] = None):
+        """검증자가 있는 응답 저장 (body를 주지 않으면 response.content)"""
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'headers': dict(response.headers),
+            'encoding': response.encoding,
+            'validated_at': time.time(),
+        }
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            with open(body_path, 'wb') as f:
+                f.write(response.content if body is None else body)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            self._evict()
+
+    def record(self, response: requests.Response, max_bytes: int) -> Optional['StreamRecorder']:
+        """stream=True 응답을 읽으면서 저장할 준비 (저장할 수 없는 응답이면 None)"""
+        if (getattr(response, 'from_cache', False) or response.status_code != 200
+                or not (response.headers.get('ETag') or response.headers.get('Last-Modified'))):
+            return None
+        return StreamRecorder(self, response, max_bytes)
+
+    def invalidate(self, url: str):
+        """항목 삭제 (메타데이터만 남고 본문 파일이 없어진 경우 등)"""
+        with self._lock:
+            self._remove(*self._paths(url))
+
+    def touch(self, url: str, meta: Dict):
+        """304 응답으로 재검증된 항목의 검증 시각 갱신"""
+        meta['validated_at'] = time.time()
+        meta_path, _ = self._paths(url)
+        with self._lock:
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+
+    def _evict(self):
+        """만료 항목 삭제 후, 총 크기가 상한을 넘으면 오래 사용하지 않은 순으로 삭제"""
+        entries = []
+        total = 0
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[:-len('.json')] + '.body'
+            try:
+                used_at = os.path.getmtime(meta_path)
+                size = os.path.getsize(body_path)
+            except OSError:
+                self._remove(meta_path, body_path)
+                continue
+            if now - used_at > self.max_age:
+                self._remove(meta_path, body_path)
+                continue
+            entries.append((used_at, size, meta_path, body_path))
+            total += size
+
+        entries.sort()
+        for used_at, size, meta_path, body_path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(meta_path, body_path)
+            total -= size
+
+    @staticmethod
+    def _remove(*paths: str):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+class StreamRecorder:
+    """
+    stream=True 응답을 읽는 쪽(스트리밍 추출, BoundedReader)과 함께 본문을 모아 캐시에 저장
+    - response.iter_content를 감싸 읽은 조각을 보관
+    - 읽는 쪽이 본문 영역만 읽고 멈췄으면 finish()에서 나머지를 max_bytes까지 이어 받아 저장
+      (max_bytes를 넘는 응답은 저장하지 않음, 다음 요청에서 304가 오면 저장한 본문을 사용)
+    - max_bytes를 넘으면 모은 조각을 버리고 더 모으지 않음 (읽는 쪽은 계속 스트리밍)
+    """
+
+    def __init__(self, cache: HTTPCache, response: requests.Response, max_bytes: int):
+        self.cache = cache
+        self.response = response
+        self.max_bytes = max_bytes
+        self.chunks: List[bytes] = []
+        self.size = 0
+        self.complete = False
+        self.storable = True
+        self._iter_content = response.iter_content
+        response.iter_content = self._recording_iter
+
+    def _recording_iter(self, chunk_size=1, decode_unicode=False) -> Iterator[bytes]:
+        for chunk in self._iter_content(chunk_size):
+            self.size += len(chunk)
+            if self.storable:
+                if self.size > self.max_bytes:
+                    self.storable = False
+                    self.chunks = []
+                else:
+                    self.chunks.append(chunk)
+            yield chunk
+        self.complete = True
+
+    def finish(self, chunk_size: int = 16 * 1024) -> int:
+        """남은 본문을 받아 캐시에 저장, 추가로 받은 바이트 수 반환"""
+        read = self.size
+        if not self.complete and self.storable:
+            for _ in self._recording_iter(chunk_size):
+                if not self.storable:
+                    break
+        extra = self.size - read
+        if self.complete and self.storable:
+            self.cache.store(self.response.url, self.response, b''.join(self.chunks))
+        return extra
+
+class CachingAdapter(HTTPAdapter):
+    """
+    HTTPCache를 사용하는 requests 어댑터
+    - GET 요청에만 적용
+    - stream=True 요청은 304일 때 캐시 본문으로 응답하고, 새 본문은 읽는 쪽이 HTTPCache.record()로 저장
+    - 304인데 저장된 본문이 없으면 항목을 지우고 조건부 헤더 없이 다시 요청
+    - 응답에 from_cache 속성(304로 캐시 본문을 사용했는지) 추가
+    """
+
+    def __init__(self, cache: Optional[HTTPCache] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, stream=False, **kwargs):
+        if self.cache is None or request.method != 'GET':
+            response = super().send(request, stream=stream, **kwargs)
+            response.from_cache = False
+            return response
+
+        url = request.url
+        meta = self.cache.lookup(url)
+        if meta:
+            if meta.get('etag'):
+                request.headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request.headers['If-Modified-Since'] = meta['last_modified']
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and meta:
+            body = self.cache.load_body(url)
+            response.close()
+            if body is not None:
+                self.cache.touch(url, meta)
+                logger.debug(f"캐시 사용 (304): {url}")
+                return self._build_cached_response(request, response, meta, body)
+            # 본문 파일이 없으면 빈 304를 넘기지 않고 항목을 지운 뒤 조건 없이 다시 요청
+            logger.warning(f"⚠️  캐시 본문이 없어 다시 요청: {url}")
+            self.cache.invalidate(url)
+            request.headers.pop('If-None-Match', None)
+            request.headers.pop('If-Modified-Since', None)
+            response = super().send(request, stream=stream, **kwargs)
+
+        response.from_cache = False
+        if (not stream and response.status_code == 200
+                and (response.headers.get('ETag') or response.headers.get('Last-Modified'))):
+            self.cache.store(url, response)
+        return response
+
+    def _build_cached_response(self, request, not_modified, meta: Dict,
+                               body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(meta.get('headers') or {})
+        response.encoding = meta.get('encoding')
+        response.url = not_modified.url
+        response.request = request
+        response.connection = self
+        response.elapsed = not_modified.elapsed
+        response._content = body
+        response._content_consumed = True
+        response.from_cache = True
+        return response
+
+def create_cache_from_env() -> Optional[HTTPCache]:
+    """
+    환경변수로 캐시 생성
+    - HTTP_CACHE=off 이면 사용 안 함
+    - HTTP_CACHE_DIR, HTTP_CACHE_MAX_MB, HTTP_CACHE_MAX_AGE_DAYS로 설정
+    """
+    if os.getenv('HTTP_CACHE', 'on').lower() in ('off', 'false', '0'):
+        return None
+    return HTTPCache(
+        directory=os.getenv('HTTP_CACHE_DIR', 'data/http_cache'),
+        max_bytes=int(float(os.getenv('HTTP_CACHE_MAX_MB', '50')) * 1024 * 1024),
+        max_age=float(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', '30')) * 24 * 3600,
+    )
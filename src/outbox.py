@@ -0,0 +1,224 @@
+"""
+알림 메일 보관함 (SQLite)
+- 발송 전에 수신자별로 완성된 메일(제목, 본문)과 포함된 게시글을 저장
+- 발송에 실패하면 지수 백오프로 다음 시도 시각을 미루고 다음 실행에서 다시 발송
+- 수신자 + 게시글 목록으로 만든 멱등 키로 같은 메일을 두 번 보내지 않음 (수정 알림은 본문 지문 포함)
+- 발송 완료/포기한 메일은 보관 기간(retention초)이 지나면 삭제
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+SENT = 'sent'
+DEAD = 'dead'
+
+class DrainResult(NamedTuple):
+    """보관함 발송 결과"""
+    sent: int
+    failed: int
+    delivered: List[Tuple[Optional[str], int]]  # 모든 메일 발송이 끝난 (게시판, 게시글 번호)
+
+class Outbox:
+    def __init__(self, path: str = 'data/outbox.db', base_delay: float = 300,
+                 max_delay: float = 6 * 3600, max_attempts: int = 10,
+                 retention: Optional[float] = 30 * 24 * 3600):
+        self.path = path
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.retention = retention  # None이면 발송 완료/포기한 메일을 지우지 않음
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        self._create_tables()
+
+    def _create_tables(self):
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS outbox (
+                    key TEXT PRIMARY KEY,
+                    recipient TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    text_body TEXT NOT NULL,
+                    html_body TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at TEXT NOT NULL,
+                    sent_at TEXT
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS outbox_posts (
+                    key TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    board TEXT,
+                    post_id INTEGER,
+                    PRIMARY KEY (key, url)
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS outbox_posts_url ON outbox_posts (url)")
+
+    @staticmethod
+    def make_key(recipient: str, posts: Iterable[Dict]) -> str:
+        """
+        수신자와 게시글 URL 목록(순서 무관)으로 멱등 키 생성
+        - 수정 알림 게시글은 URL에 새 본문 지문(revision)을 붙여 수정될 때마다 다른 키
+        """
+        urls = sorted({post['url'] + (f"#{post['revision']}" if post.get('revision') else '') for post in posts})
+        return hashlib.sha256('\n'.join([recipient.lower()] + urls).encode('utf-8')).hexdigest()
+
+    def enqueue(self, recipient: str, subject: str, text_body: str, html_body: str,
+                posts: List[Dict]) -> Optional[str]:
+        """
+        메일 저장 (멱등 키 반환)
+        - 이미 보낸 메일이면 저장하지 않고 None
+        - 발송을 포기했던 메일은 다시 대기 상태로 되돌림
+        """
+        key = self.make_key(recipient, posts)
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT status FROM outbox WHERE key = ?", (key,)).fetchone()
+            if row and row['status'] == SENT:
+                logger.info(f"📭 이미 발송한 메일이라 건너뜁니다: {recipient}")
+                return None
+            if row and row['status'] == PENDING:
+                return key
+            if row:
+                self.conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = ? WHERE key = ?",
+                    (PENDING, now, key)
+                )
+                return key
+
+            self.conn.execute("""
+                INSERT INTO outbox (key, recipient, subject, text_body, html_body, status,
+                                    next_attempt_at, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, recipient, subject, text_body, html_body, PENDING, now,
+                  datetime.now().isoformat(timespec='seconds')))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO outbox_posts (key, url, board, post_id) VALUES (?, ?, ?, ?)",
+                [(key, post['url'], post.get('board_key'), post.get('post_id')) for post in posts]
+            )
+        return key
+
+    def due(self, now: Optional[float] = None) -> List[Dict]:
+        """지금 발송할 차례인 메일 (오래된 순)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM outbox WHERE status = ? AND next_attempt_at <= ? ORDER BY created_at, key",
+                (PENDING, now)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) AS n FROM outbox WHERE status = ?", (PENDING,)
+            ).fetchone()
+        return row['n']
+
+    def queued_urls(self) -> Set[str]:
+        """발송 대기 중인 메일에 들어 있는 게시글 URL"""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT DISTINCT p.url FROM outbox_posts p JOIN outbox o ON o.key = p.key
+                WHERE o.status = ?
+            """, (PENDING,)).fetchall()
+        return {row['url'] for row in rows}
+
+    def mark_sent(self, key: str) -> List[Tuple[Optional[str], int]]:
+        """발송 완료 표시, 더 보낼 메일이 남지 않은 (게시판, 게시글 번호) 반환"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE outbox SET status = ?, sent_at = ?, last_error = NULL WHERE key = ?",
+                (SENT, datetime.now().isoformat(timespec='seconds'), key)
+            )
+            rows = self.conn.execute("""
+                SELECT p.board, p.post_id FROM outbox_posts p
+                WHERE p.key = ? AND p.post_id IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM outbox_posts q JOIN outbox o ON o.key = q.key
+                    WHERE q.url = p.url AND o.status = ?
+                )
+            """, (key, PENDING)).fetchall()
+        return [(row['board'], row['post_id']) for row in rows]
+
+    def mark_failed(self, key: str, error: str):
+        """발송 실패 기록, 다음 시도 시각을 지수 백오프로 연기"""
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT attempts FROM outbox WHERE key = ?", (key,)).fetchone()
+            attempts = (row['attempts'] if row else 0) + 1
+            if attempts >= self.max_attempts:
+                status, next_attempt_at = DEAD, time.time()
+                logger.error(f"❌ 발송을 {attempts}번 실패해 포기합니다 ({key[:12]}): {error}")
+            else:
+                delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+                status, next_attempt_at = PENDING, time.time() + delay
+                logger.warning(f"⚠️  발송 실패 {attempts}회 ({key[:12]}), {delay:.0f}초 뒤 재시도: {error}")
+            self.conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? WHERE key = ?",
+                (status, attempts, next_attempt_at, error, key)
+            )
+
+    def drain(self, send: Callable[[Dict], bool]) -> DrainResult:
+        """
+        발송할 차례인 메일을 모두 발송
+        - send(메일)가 False를 반환하거나 예외를 던지면 실패로 기록
+        """
+        sent = failed = 0
+        delivered: List[Tuple[Optional[str], int]] = []
+        for message in self.due():
+            try:
+                ok = send(message)
+                error = '발송 실패'
+            except Exception as e:
+                ok = False
+                error = str(e)
+            if ok:
+                sent += 1
+                delivered.extend(self.mark_sent(message['key']))
+            else:
+                failed += 1
+                self.mark_failed(message['key'], error)
+        if sent or failed:
+            logger.info(f"📮 보관함 발송: 성공 {sent}건, 실패 {failed}건, 대기 {self.pending_count()}건")
+        self.purge()
+        return DrainResult(sent, failed, delivered)
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """
+        보관 기간이 지난 발송 완료(발송 시각 기준)/포기(포기한 시각 기준) 메일 삭제, 삭제한 수 반환
+        - 삭제한 메일은 멱등 키 기록도 사라지지만, 그 게시글은 처리 이력에 발송 완료로 남아 다시 조회되지 않음
+        """
+        if self.retention is None:
+            return 0
+        cutoff = (time.time() if now is None else now) - self.retention
+        with self._lock, self.conn:
+            deleted = self.conn.execute(
+                "DELETE FROM outbox WHERE (status = ? AND sent_at < ?) OR (status = ? AND next_attempt_at < ?)",
+                (SENT, datetime.fromtimestamp(cutoff).isoformat(timespec='seconds'), DEAD, cutoff)
+            ).rowcount
+            if deleted:
+                self.conn.execute("DELETE FROM outbox_posts WHERE key NOT IN (SELECT key FROM outbox)")
+        if deleted:
+            logger.info(f"🧹 보관 기간이 지난 메일 {deleted}건 삭제")
+        return deleted
+
+    def close(self):
+        self.conn.close()
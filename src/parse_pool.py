@@ -0,0 +1,109 @@
+"""
+상세 페이지 본문 추출 + 요약 프로세스 풀 (대량 백필/재처리용)
+- BeautifulSoup(html.parser) 파싱과 요약은 CPU를 쓰면서 GIL을 잡고 있어 스레드로는 코어 1개만 사용
+  → 작업자 프로세스로 나눠 코어 수만큼 동시에 처리
+- 작업자에는 응답 바이트와 인코딩만 보내고 결과는 본문, 선택자, 첨부 링크만 돌려받음
+  (soup 같은 파싱 트리는 프로세스 밖으로 나가지 않음)
+- 요약은 메인 프로세스가 요약 캐시를 확인한 뒤 캐시에 없는 본문만 summarize()로 작업자에 보냄
+- 추출기(기억한 선택자 사본)와 요약기는 작업자마다 한 번만 생성
+- chunksize건씩 묶어 보내 프로세스 간 통신 횟수를 줄이고, 결과는 입력 순서대로 반환
+"""
+import time
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Pattern, Tuple
+
+class DetailJob(NamedTuple):
+    """작업자에 보내는 상세 페이지 1건"""
+    body: bytes  # 응답 바이트 (요청 실패면 b'')
+    encoding: Optional[str]
+    board_key: str
+    link_pattern: Optional[Pattern] = None  # 첨부 링크 패턴 (None이면 링크를 찾지 않음)
+
+class ParsedDetail(NamedTuple):
+    """작업자가 돌려주는 추출 결과 (본문을 찾지 못하면 text가 None)"""
+    text: Optional[str]
+    selector: str = ''
+    method: str = ''
+    confidence: float = 0.0
+    links: Tuple[Tuple[str, str], ...] = ()
+    extract_seconds: float = 0.0
+
+# 작업자 프로세스 전역 (초기화 함수에서 한 번만 생성)
+_extractor = None
+_summarizer = None
+
+def _init_worker(hints: Dict[str, str], min_length: int, max_length: int, mode: str,
+                 corpus_stats_path: Optional[str]):
+    global _extractor, _summarizer
+    from content_extractor import ContentExtractor
+    from text_summarizer import SimpleTextSummarizer
+
+    # 선택자는 메인 프로세스가 기억하므로 작업자는 파일에 쓰지 않음
+    _extractor = ContentExtractor(hints_path=None, min_length=min_length)
+    _extractor.hints.update(hints)
+    corpus_stats = None
+    if mode != 'keyword' and corpus_stats_path:
+        from corpus_ranker import CorpusStats
+        corpus_stats = CorpusStats(corpus_stats_path)
+    _summarizer = SimpleTextSummarizer(max_length=max_length, mode=mode, corpus_stats=corpus_stats)
+
+def parse_detail(job: DetailJob) -> ParsedDetail:
+    """작업자에서 실행: 본문 추출, 첨부 링크 수집"""
+    if not job.body:
+        return ParsedDetail(None)
+    started = time.perf_counter()
+    html = job.body.decode(job.encoding or 'utf-8', errors='replace')
+    result = _extractor.extract(html, board_key=job.board_key)
+    if result is None:
+        return ParsedDetail(None, extract_seconds=time.perf_counter() - started)
+    links = ()
+    if job.link_pattern is not None:
+        from stream_extractor import find_links
+        links = tuple(dict.fromkeys(find_links(html, job.link_pattern)))
+    return ParsedDetail(
+        text=result.text, selector=result.selector, method=result.method,
+        confidence=result.confidence, links=links, extract_seconds=time.perf_counter() - started,
+    )
+
+def summarize_text(text: str) -> Tuple[str, float]:
+    """작업자에서 실행: 본문 요약, (요약, 소요 시간) 반환"""
+    started = time.perf_counter()
+    summary = _summarizer.summarize(text)
+    return summary, time.perf_counter() - started
+
+class ParsePool:
+    """
+    본문 추출/요약 작업자 프로세스 풀
+    - 작업자는 spawn으로 시작 (상세 요청 스레드가 도는 중에 fork하지 않도록)
+    - map()은 입력을 읽는 대로 chunksize건씩 작업자에 보내므로 상세 요청과 파싱이 겹침
+    """
+
+    def __init__(self, workers: int, chunksize: int = 8, hints: Optional[Dict[str, str]] = None,
+                 min_length: int = 100, max_length: int = 300, mode: str = 'keyword',
+                 corpus_stats_path: Optional[str] = None):
+        self.workers = max(1, workers)
+        self.chunksize = max(1, chunksize)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(dict(hints or {}), min_length, max_length, mode, corpus_stats_path),
+        )
+
+    def map(self, jobs: Iterable[DetailJob]) -> Iterator[ParsedDetail]:
+        """입력 순서대로 결과 반환"""
+        return self._executor.map(parse_detail, jobs, chunksize=self.chunksize)
+
+    def summarize(self, text: str) -> 'Future[Tuple[str, float]]':
+        """요약 캐시에 없는 본문 요약 요청 (결과는 (요약, 소요 시간))"""
+        return self._executor.submit(summarize_text, text)
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
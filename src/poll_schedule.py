@@ -0,0 +1,108 @@
+"""
+상주 실행(--daemon) 폴링 간격
+- 최근 새 게시글이 있었으면(active_window 이내) 가장 촘촘하게 (active)
+- 한국시간 평일 업무시간에는 business, 그 밖에는 idle 간격에서 시작
+- 새 게시글이 없는 조회가 이어지면 backoff배씩 늘림
+  (업무시간에는 idle 간격, 업무시간 밖에는 max_interval까지)
+- 업무시간 밖에 길게 쉬더라도 다음 업무 시작 시각은 넘기지 않음
+- 요청이 몰리지 않도록 ±jitter 비율만큼 무작위로 조정
+"""
+import os
+import math
+import random
+from datetime import datetime, time as dtime, timedelta, timezone
+from typing import Optional, Tuple
+
+# 한국 표준시 (일광 절약 시간 없음)
+KST = timezone(timedelta(hours=9), 'KST')
+
+class PollSchedule:
+    def __init__(self, active: float = 60, business: float = 120, idle: float = 900,
+                 max_interval: float = 3600, backoff: float = 1.5, active_window: float = 1800,
+                 business_hours: Tuple[int, int] = (9, 18), jitter: float = 0.1,
+                 rng: Optional[random.Random] = None):
+        self.active = active
+        self.business = business
+        self.idle = idle
+        self.max_interval = max(max_interval, idle)
+        self.backoff = max(1.0, backoff)
+        self.active_window = active_window
+        self.business_hours = business_hours
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+
+        self.idle_polls = 0  # 새 게시글 없이 연속으로 조회한 횟수
+        # 가장 짧은 시작 간격도 max_interval에 닿는 횟수, 그 뒤로는 세지 않음 (backoff ** idle_polls 오버플로 방지)
+        start = min(business, idle)
+        self.max_idle_polls = (math.ceil(math.log(self.max_interval / start) / math.log(self.backoff))
+                               if self.backoff > 1 and 0 < start < self.max_interval else 0)
+        self.last_activity: Optional[datetime] = None
+
+    def is_business_hours(self, now: datetime) -> bool:
+        """한국시간 평일 업무시간인지 (공휴일은 구분하지 않음)"""
+        local = now.astimezone(KST)
+        start, end = self.business_hours
+        return local.weekday() < 5 and start <= local.hour < end
+
+    def next_business_start(self, now: datetime) -> datetime:
+        """now 이후 가장 가까운 업무 시작 시각"""
+        local = now.astimezone(KST)
+        candidate = datetime.combine(local.date(), dtime(self.business_hours[0]), KST)
+        if candidate <= local:
+            candidate += timedelta(days=1)
+        while candidate.weekday() >= 5:
+            candidate += timedelta(days=1)
+        return candidate
+
+    def record(self, new_posts: int, now: datetime):
+        """조회 결과 반영 (새 게시글이 있으면 간격을 처음으로 되돌림)"""
+        if new_posts:
+            self.idle_polls = 0
+            self.last_activity = now
+        else:
+            self.idle_polls = min(self.idle_polls + 1, self.max_idle_polls)
+
+    def phase(self, now: datetime) -> str:
+        if self.last_activity is not None and (now - self.last_activity).total_seconds() < self.active_window:
+            return 'active'
+        return 'business' if self.is_business_hours(now) else 'off_hours'
+
+    def next_interval(self, now: datetime) -> float:
+        """다음 조회까지 기다릴 시간(초)"""
+        phase = self.phase(now)
+        if phase == 'active':
+            interval = self.active
+        elif phase == 'business':
+            interval = min(self.business * self.backoff ** self.idle_polls, self.idle)
+        else:
+            interval = min(self.idle * self.backoff ** self.idle_polls, self.max_interval)
+            until_business = (self.next_business_start(now) - now).total_seconds()
+            interval = min(interval, max(until_business, self.active))
+
+        if self.jitter:
+            interval *= 1 + self.rng.uniform(-self.jitter, self.jitter)
+        return max(1.0, interval)
+
+def _parse_hours(value: str) -> Tuple[int, int]:
+    start, _, end = value.partition('-')
+    return int(start), int(end)
+
+def create_schedule_from_env() -> PollSchedule:
+    """
+    환경변수로 폴링 간격 설정 (단위: 초)
+    - DAEMON_INTERVAL_ACTIVE: 새 게시글 직후 (기본 60, DAEMON_ACTIVE_WINDOW=1800초 동안)
+    - DAEMON_INTERVAL_BUSINESS: 업무시간 시작 간격 (기본 120)
+    - DAEMON_INTERVAL_IDLE: 업무시간 밖 시작 간격, 업무시간 최대 간격 (기본 900)
+    - DAEMON_INTERVAL_MAX: 최대 간격 (기본 3600)
+    - DAEMON_BACKOFF: 새 게시글이 없을 때 간격 증가 배수 (기본 1.5)
+    - DAEMON_BUSINESS_HOURS: 한국시간 업무시간 (기본 9-18)
+    """
+    return PollSchedule(
+        active=float(os.getenv('DAEMON_INTERVAL_ACTIVE', '60')),
+        business=float(os.getenv('DAEMON_INTERVAL_BUSINESS', '120')),
+        idle=float(os.getenv('DAEMON_INTERVAL_IDLE', '900')),
+        max_interval=float(os.getenv('DAEMON_INTERVAL_MAX', '3600')),
+        backoff=float(os.getenv('DAEMON_BACKOFF', '1.5')),
+        active_window=float(os.getenv('DAEMON_ACTIVE_WINDOW', '1800')),
+        business_hours=_parse_hours(os.getenv('DAEMON_BUSINESS_HOURS', '9-18')),
+    )
@@ -0,0 +1,220 @@
+"""
+처리한 게시글 저장소 (SQLite)
+- boardView.do 게시글 번호(gsgeul_no) 기준으로 처리/발송 이력 보관
+  (gsgeul_no는 게시판과 관계없이 사이트 전체에서 하나씩 증가하는 번호이므로 게시판 구분 없이 키로 사용,
+   게시판은 board 컬럼에 기록)
+- 게시판별로 마지막으로 알림을 보낸 게시글 번호(워터마크) 관리
+- 첨부파일 정보(이름, 링크, 크기, sha256)는 JSON으로 함께 보관
+- 수정 감지용 본문 지문과 마지막으로 알린 본문 보관 (revisions.py)
+"""
+import os
+import json
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 게시판 구분 전 저장소는 육군 공지사항(gesipan_id=69)만 기록
+LEGACY_BOARD_KEY = '69'
+
+class PostStore:
+    def __init__(self, path: str = 'data/posts.db'):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 게시판별 수집이 여러 스레드에서 실행되므로 연결을 공유하고 잠금으로 보호
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        self._create_tables()
+
+    def _create_tables(self):
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS posts (
+                    post_id INTEGER PRIMARY KEY,
+                    board TEXT,
+                    title TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    date TEXT,
+                    summary TEXT,
+                    content_length INTEGER DEFAULT 0,
+                    attachments TEXT,
+                    fingerprint TEXT,
+                    content TEXT,
+                    revisions INTEGER DEFAULT 0,
+                    processed_at TEXT,
+                    notified_at TEXT,
+                    revised_at TEXT
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            # 게시판 구분 컬럼이 없던 저장소 업그레이드
+            columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(posts)")}
+            if 'board' not in columns:
+                self.conn.execute("ALTER TABLE posts ADD COLUMN board TEXT")
+            # 첨부파일 컬럼이 없던 저장소 업그레이드
+            if 'attachments' not in columns:
+                self.conn.execute("ALTER TABLE posts ADD COLUMN attachments TEXT")
+            # 수정 감지 컬럼이 없던 저장소 업그레이드 (기존 게시글은 처음 확인할 때 지문 기록)
+            for column, definition in (('fingerprint', 'TEXT'), ('content', 'TEXT'),
+                                       ('revisions', 'INTEGER DEFAULT 0'), ('revised_at', 'TEXT')):
+                if column not in columns:
+                    self.conn.execute(f"ALTER TABLE posts ADD COLUMN {column} {definition}")
+            self._migrate_legacy_board()
+
+    def _migrate_legacy_board(self):
+        """게시판 구분 전 기록(게시판 없는 게시글, 'watermark' 키)을 육군 게시판 기록으로 이전"""
+        self.conn.execute("UPDATE posts SET board = ? WHERE board IS NULL", (LEGACY_BOARD_KEY,))
+        legacy = self.conn.execute("SELECT value FROM meta WHERE key = 'watermark'").fetchone()
+        if legacy is None:
+            return
+        # 게시판별 워터마크가 이미 있으면 그 값을 유지
+        self.conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+            (self._watermark_key(LEGACY_BOARD_KEY), legacy['value'])
+        )
+        self.conn.execute("DELETE FROM meta WHERE key = 'watermark'")
+        logger.info(f"📦 이전 워터마크 {legacy['value']}를 게시판 {LEGACY_BOARD_KEY} 워터마크로 이전")
+
+    @staticmethod
+    def _watermark_key(board_key: Optional[str]) -> str:
+        # 게시판을 지정하지 않으면 육군 게시판
+        return f'watermark:{board_key or LEGACY_BOARD_KEY}'
+
+    def get_watermark(self, board_key: Optional[str] = None) -> Optional[int]:
+        """게시판에서 마지막으로 알림을 보낸 게시글 번호 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (self._watermark_key(board_key),)
+            ).fetchone()
+        return int(row['value']) if row else None
+
+    def advance_watermark(self, post_id: int, board_key: Optional[str] = None):
+        """워터마크를 post_id까지 전진 (뒤로 가지 않음)"""
+        with self._lock:
+            current = self.get_watermark(board_key)
+            if current is not None and post_id <= current:
+                return
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (self._watermark_key(board_key), str(post_id))
+                )
+        logger.info(f"📌 워터마크 갱신 ({board_key}): {current} → {post_id}")
+
+    def get_last_revalidation(self) -> Optional[float]:
+        """마지막으로 최근 게시글 수정을 확인한 시각 (epoch 초, 없으면 None)"""
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'revalidated_at'").fetchone()
+        return float(row['value']) if row else None
+
+    def set_last_revalidation(self, timestamp: float):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('revalidated_at', ?)", (str(timestamp),)
+            )
+
+    def is_notified(self, post_id: int) -> bool:
+        """알림 발송이 끝난 게시글인지 확인"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT notified_at FROM posts WHERE post_id = ?", (post_id,)
+            ).fetchone()
+        return bool(row and row['notified_at'])
+
+    def get_processed(self, post_id: int) -> Optional[Dict]:
+        """이미 요약까지 끝난 게시글 조회 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM posts WHERE post_id = ? AND processed_at IS NOT NULL",
+                (post_id,)
+            ).fetchone()
+        if not row:
+            return None
+        post = dict(row)
+        post['attachments'] = json.loads(post['attachments']) if post['attachments'] else []
+        return post
+
+    def save_processed(self, post: Dict):
+        """요약이 끝난 게시글 저장"""
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO posts (post_id, board, title, url, date, summary, content_length, attachments,
+                                   fingerprint, content, processed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(post_id) DO UPDATE SET
+                    board = excluded.board,
+                    title = excluded.title,
+                    url = excluded.url,
+                    date = excluded.date,
+                    summary = excluded.summary,
+                    content_length = excluded.content_length,
+                    attachments = excluded.attachments,
+                    fingerprint = excluded.fingerprint,
+                    content = excluded.content,
+                    processed_at = excluded.processed_at
+            """, (
+                post['post_id'], post.get('board_key'), post['title'], post['url'], post['date'],
+                post.get('summary'), post.get('content_length', 0),
+                json.dumps(post.get('attachments') or [], ensure_ascii=False),
+                post.get('fingerprint'), post.get('content'),
+                datetime.now().isoformat(timespec='seconds'),
+            ))
+
+    def recent_notified(self, since: str, limit: int) -> List[Dict]:
+        """작성일이 since(YYYY-MM-DD) 이후이고 알림을 보낸 게시글 (최신 게시글부터 limit건, 수정 확인용)"""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT post_id, board, title, url, date, summary, fingerprint, content, revisions
+                FROM posts
+                WHERE notified_at IS NOT NULL AND date >= ?
+                ORDER BY post_id DESC LIMIT ?
+            """, (since, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def save_revision(self, post_id: int, fingerprint: str, content: str,
+                      summary: Optional[str] = None, revised: bool = True):
+        """
+        다시 확인한 본문 저장
+        - revised=False면 지문이 없던 게시글의 기준 본문만 기록 (수정 횟수 유지)
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self.conn:
+            self.conn.execute("""
+                UPDATE posts SET
+                    fingerprint = ?,
+                    content = ?,
+                    content_length = ?,
+                    summary = COALESCE(?, summary),
+                    revisions = revisions + ?,
+                    revised_at = CASE WHEN ? THEN ? ELSE revised_at END
+                WHERE post_id = ?
+            """, (fingerprint, content, len(content), summary, int(revised), int(revised), now, post_id))
+
+    def mark_notified(self, post_ids: Iterable[int], board_key: Optional[str] = None):
+        """알림 발송 완료 표시 및 게시판 워터마크 전진"""
+        post_ids = list(post_ids)
+        if not post_ids:
+            return
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "UPDATE posts SET notified_at = ? WHERE post_id = ?",
+                [(now, post_id) for post_id in post_ids]
+            )
+        self.advance_watermark(max(post_ids), board_key)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,140 @@
+"""
+실행 프로파일링 (선택 사항)
+- CPU: cProfile로 실행 전체를 측정해 pstats 파일과 플레임그래프용 collapsed stack 파일 저장
+- 메모리: tracemalloc으로 단계 경계마다 할당 위치 상위 항목과 이전 단계 대비 증가량 기록
+
+collapsed stack 파일은 flamegraph.pl, speedscope 등에서 바로 열 수 있습니다.
+cProfile은 호출 관계(호출자 → 피호출자)만 기록하므로, 스택별 시간은 호출 관계의
+누적 시간 비율로 나눠 추정한 값입니다.
+"""
+import os
+import cProfile
+import pstats
+import tracemalloc
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# pstats 함수 키: (파일, 줄 번호, 함수 이름)
+FunctionKey = Tuple[str, int, str]
+
+def profile_call(func: Callable, output_dir: str = 'reports/profile', name: str = 'crawler'):
+    """
+    func()를 cProfile로 실행하고 결과 저장
+    - <name>.pstats: python -m pstats, snakeviz 등으로 분석
+    - <name>.collapsed: 플레임그래프용 collapsed stack (마이크로초)
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        os.makedirs(output_dir, exist_ok=True)
+        stats_path = os.path.join(output_dir, f'{name}.pstats')
+        collapsed_path = os.path.join(output_dir, f'{name}.collapsed')
+        profiler.dump_stats(stats_path)
+        stats = pstats.Stats(profiler)
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            for stack, micros in collapse_stats(stats):
+                f.write(f"{stack} {micros}\n")
+        logger.info(f"🔬 CPU 프로파일 저장: {stats_path}, {collapsed_path}")
+
+def _label(func: FunctionKey) -> str:
+    filename, line, name = func
+    if filename == '~':
+        # 내장 함수 (예: <method 'join' of 'str' objects>)
+        return name.replace(';', ',').replace(' ', '_')
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(';', ',').replace(' ', '_')
+
+def collapse_stats(stats: pstats.Stats, max_depth: int = 64,
+                   min_micros: int = 1) -> List[Tuple[str, int]]:
+    """
+    pstats 호출 관계를 collapsed stack 목록으로 변환
+    - 루트(호출자가 없는 함수)부터 내려가며 각 함수의 자체 시간을 스택 경로에 배분
+    - 하위 함수로 가는 시간은 (호출 관계의 누적 시간 / 하위 함수 전체 누적 시간) 비율로 배분
+    - 재귀 호출은 경로에 이미 있는 함수에서 중단
+    """
+    raw = stats.stats  # func -> (cc, nc, tt, ct, callers)
+    children: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = {}
+    for callee, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((callee, edge[3]))
+
+    totals: Dict[str, float] = {}
+
+    def walk(func: FunctionKey, share: float, path: List[str], seen: set):
+        _, _, self_time, cumulative, _ = raw[func]
+        path.append(_label(func))
+        stack = ';'.join(path)
+        totals[stack] = totals.get(stack, 0.0) + self_time * share
+        if len(path) < max_depth:
+            for child, edge_time in children.get(func, []):
+                if child in seen or child not in raw:
+                    continue
+                child_total = raw[child][3]
+                if child_total <= 0 or edge_time <= 0:
+                    continue
+                seen.add(child)
+                walk(child, share * min(1.0, edge_time / child_total), path, seen)
+                seen.discard(child)
+        path.pop()
+
+    roots = [func for func, value in raw.items() if not value[4]]
+    for root in roots:
+        walk(root, 1.0, [], {root})
+
+    collapsed = []
+    for stack, seconds in totals.items():
+        micros = int(seconds * 1_000_000)
+        if micros >= min_micros:
+            collapsed.append((stack, micros))
+    collapsed.sort()
+    return collapsed
+
+class MemoryTracer:
+    """
+    tracemalloc 단계별 스냅샷
+    - checkpoint(단계)마다 할당 위치 상위 top개와 이전 단계 대비 증가량을 로그와 파일로 기록
+    """
+
+    def __init__(self, output_dir: str = 'reports/profile', top: int = 15, frames: int = 1):
+        self.output_dir = output_dir
+        self.top = top
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._index = 0
+        tracemalloc.start(frames)
+        os.makedirs(output_dir, exist_ok=True)
+        self.report_path = os.path.join(output_dir, 'memory.txt')
+        with open(self.report_path, 'w', encoding='utf-8'):
+            pass
+
+    def checkpoint(self, stage: str):
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*'),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        self._index += 1
+
+        lines = [f"== {self._index}. {stage}: 현재 {current / 1024:.1f}KB, 최대 {peak / 1024:.1f}KB"]
+        lines.append("-- 할당 위치 상위")
+        for stat in snapshot.statistics('lineno')[:self.top]:
+            lines.append(f"  {stat}")
+        if self._previous is not None:
+            lines.append("-- 이전 단계 대비 증가")
+            growth = [stat for stat in snapshot.compare_to(self._previous, 'lineno') if stat.size_diff > 0]
+            for stat in growth[:self.top]:
+                lines.append(f"  {stat}")
+        self._previous = snapshot
+
+        with open(self.report_path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n\n')
+        snapshot.dump(os.path.join(self.output_dir, f'memory_{self._index:02d}_{stage}.snapshot'))
+        logger.info(f"🧠 메모리 [{stage}]: 현재 {current / 1024:.1f}KB, 최대 {peak / 1024:.1f}KB")
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        logger.info(f"🧠 메모리 프로파일 저장: {self.report_path}")
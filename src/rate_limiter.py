@@ -0,0 +1,110 @@
+"""
+호스트별 적응형 토큰 버킷 요청 제한기
+"""
+import threading
+import time
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+class _HostBucket:
+    """호스트 하나에 대한 토큰 버킷 상태"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.latency_ewma: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+class AdaptiveRateLimiter:
+    """
+    호스트별 토큰 버킷 기반 요청 제한기
+    - acquire()로 토큰을 얻은 뒤 요청
+    - record()로 응답 상태와 지연시간을 보고하면 속도를 조절 (AIMD)
+      * 429/5xx: 속도 절반으로 감소 + Retry-After 동안 대기
+      * 응답 지연이 목표치보다 크면 소폭 감소
+      * 정상 응답이면 최대 속도까지 서서히 증가
+    """
+
+    def __init__(self, rate: float = 2.0, burst: float = 2.0,
+                 min_rate: float = 0.2, max_rate: float = 5.0,
+                 target_latency: float = 2.0):
+        self.initial_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.target_latency = target_latency
+
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url: str) -> _HostBucket:
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = _HostBucket(self.initial_rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str):
+        """토큰을 얻을 때까지 대기"""
+        bucket = self._bucket(url)
+        while True:
+            with bucket.lock:
+                now = time.monotonic()
+                bucket.refill(now)
+                if now < bucket.blocked_until:
+                    wait = bucket.blocked_until - now
+                elif bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                else:
+                    wait = (1 - bucket.tokens) / bucket.rate
+            time.sleep(wait)
+
+    def record(self, url: str, status: Optional[int], latency: float,
+               retry_after: Optional[float] = None):
+        """응답 결과를 반영해 호스트별 속도 조절"""
+        bucket = self._bucket(url)
+        with bucket.lock:
+            if bucket.latency_ewma is None:
+                bucket.latency_ewma = latency
+            else:
+                bucket.latency_ewma = 0.7 * bucket.latency_ewma + 0.3 * latency
+
+            if status is None or status == 429 or status >= 500:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+                if retry_after:
+                    bucket.blocked_until = max(bucket.blocked_until,
+                                               time.monotonic() + retry_after)
+                logger.warning(f"⚠️  요청 속도 감소: {urlsplit(url).netloc} "
+                               f"(상태 {status}) → {bucket.rate:.2f}회/초")
+            elif bucket.latency_ewma > self.target_latency:
+                bucket.rate = max(self.min_rate, bucket.rate * 0.8)
+            else:
+                bucket.rate = min(self.max_rate, bucket.rate + 0.25)
+
+    def current_rate(self, url: str) -> float:
+        """현재 허용 속도 (회/초)"""
+        return self._bucket(url).rate
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 단위)를 파싱"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+병무청 사이트 기록/재생 도구
+- capture: 실제 사이트의 목록/상세 페이지를 fixtures/mma 아래에 저장
+- serve: 저장한 페이지(또는 합성 게시글)를 돌려주는 로컬 대체 서버
+  지연시간, 오류 주입, 합성 게시글 수천 건 규모 확장 지원
+  합성 게시글의 첨부파일(download.do)은 Range 요청과 응답 끊김 주입 지원
+
+크롤러는 MMA_BASE_URL(또는 MMABoardCrawler(base_url=...))로 대체 서버를 바라보게 합니다.
+
+사용법:
+    python src/replay_server.py capture --pages 2
+    python src/replay_server.py serve --port 8080 --latency 0.2 --error-rate 0.05
+    python src/replay_server.py serve --synthetic-posts 5000
+    python src/replay_server.py serve --synthetic-posts 100 --truncate-rate 0.3
+"""
+import os
+import time
+import random
+import hashlib
+import argparse
+import threading
+import logging
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, quote, urljoin, urlsplit
+
+from board_config import BoardConfig, load_boards
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://www.mma.go.kr'
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'mma')
+PAGE_SIZE = 10
+
+def fixture_key(url: str) -> Optional[str]:
+    """
+    요청 URL을 fixture 상대 경로로 변환 (목록/상세 페이지만, 나머지는 None)
+    - list/<gesipan_id>/<pageIndex>.html, view/<gesipan_id>/<gsgeul_no>.html
+    - 검색 조건 등 다른 파라미터는 무시
+    """
+    parts = urlsplit(url)
+    params = parse_qs(parts.query)
+    name = parts.path.rsplit('/', 1)[-1]
+    board_id = params.get('gesipan_id', [''])[0]
+    if not board_id.isdigit():
+        return None
+    if name == 'boardList.do':
+        page = params.get('pageIndex', ['1'])[0]
+        return f"list/{board_id}/{int(page) if page.isdigit() else 1}.html"
+    if name == 'boardView.do':
+        post_id = params.get('gsgeul_no', [''])[0]
+        if post_id.isdigit():
+            return f"view/{board_id}/{post_id}.html"
+    return None
+
+# ----------------------------------------------------------------------------
+# 기록
+# ----------------------------------------------------------------------------
+
+def capture(output_dir: str = DEFAULT_FIXTURE_DIR, boards: Optional[List[BoardConfig]] = None,
+            pages: int = 1, base_url: str = DEFAULT_BASE_URL, delay: float = 1.0) -> int:
+    """
+    게시판별 목록 pages쪽과 목록에 나온 상세 페이지를 저장
+    - 사이트 부담을 줄이기 위해 요청 사이에 delay초 대기
+    - 저장한 파일 수 반환
+    """
+    import requests
+    from board_parser import parse_board
+
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+
+    def save(url: str) -> bytes:
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+        path = os.path.join(output_dir, fixture_key(url))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        logger.info(f"💾 {url} → {os.path.relpath(path, output_dir)} ({len(response.content):,} bytes)")
+        time.sleep(delay)
+        return response.content
+
+    saved = 0
+    for board in boards or load_boards():
+        for page in range(1, pages + 1):
+            list_url = base_url + board.list_path + (f'&pageIndex={page}' if page > 1 else '')
+            html = save(list_url).decode('utf-8', errors='replace')
+            saved += 1
+            for row in parse_board(html, lambda href: urljoin(list_url, href)):
+                if fixture_key(row.url) is None:
+                    continue
+                save(row.url)
+                saved += 1
+    logger.info(f"✅ fixture {saved}개 저장: {output_dir}")
+    return saved
+
+# ----------------------------------------------------------------------------
+# 합성 게시글
+# ----------------------------------------------------------------------------
+
+SYNTHETIC_SENTENCES = [
+    "{year}년 {month}월 입영 육군 기술행정병을 다음과 같이 모집하오니 많은 지원 바랍니다.",
+    "접수기간: {year}-{month:02d}-{day:02d} 10:00 ~ {year}-{month:02d}-{day2:02d} 14:00",
+    "지원자격은 18세 이상 28세 이하 현역병입영 대상자입니다.",
+    "제출서류는 반드시 접수 마감일까지 제출하시기 바랍니다.",
+    "선발 결과는 {month}월 {day2}일 병무청 누리집에서 확인할 수 있습니다.",
+    "자세한 사항은 첨부파일을 참고하시기 바랍니다.",
+    "문의: 병무청 민원상담소 1588-9090",
+    "면접 일정은 개별 통보하며, 신분증을 지참하여야 합니다.",
+    "모집 인원은 {count}명이며 전공 및 자격 보유자를 우대합니다.",
+    "입영일자는 {year}년 {month}월 {day}일이며 입영부대는 추후 안내합니다.",
+]
+
+SYNTHETIC_TITLES = [
+    "{year}년 {month}월 입영 육군 기술행정병 모집 안내",
+    "{year}년 {month}월 전문특기병 지원 접수 일정 변경 안내",
+    "{year}년도 현역병 입영 일자 본인선택 안내",
+    "{month}월 병역판정검사 일정 공지",
+    "[필독] {year}년 모집병 선발 결과 발표 안내",
+]
+
+# 여러 공지에 같은 파일이 붙는 서식 (이름, 크기)
+SYNTHETIC_FORMS = [
+    ('입영_지원서_양식.hwp', 180 * 1024),
+    ('개인정보_수집이용_동의서.pdf', 96 * 1024),
+]
+
+def synthetic_file(name: str, size: int) -> bytes:
+    """이름으로 시드를 고정한 파일 내용 (같은 이름이면 같은 내용)"""
+    return random.Random(name).randbytes(size)
+
+class SyntheticBoard:
+    """
+    게시판 하나의 합성 게시글 (시드 고정, 요청마다 같은 내용)
+    - 게시글 번호는 start_id부터 1씩 감소, 하루 posts_per_day건씩 과거로
+    """
+
+    def __init__(self, gesipan_id: str, total: int, start_id: int = 1_600_000,
+                 posts_per_day: int = 3, seed: int = 0):
+        self.gesipan_id = gesipan_id
+        self.total = total
+        self.start_id = start_id
+        self.posts_per_day = max(1, posts_per_day)
+        self.seed = seed
+        self.today = date.today()
+
+    def _post(self, index: int) -> Dict:
+        rng = random.Random(f"{self.seed}:{self.gesipan_id}:{index}")
+        post_date = self.today - timedelta(days=index // self.posts_per_day)
+        values = {
+            'year': post_date.year + 1, 'month': rng.randint(1, 12), 'day': rng.randint(1, 20),
+            'day2': rng.randint(21, 28), 'count': rng.randint(10, 500),
+        }
+        return {
+            'post_id': self.start_id - index,
+            'title': f"{rng.choice(SYNTHETIC_TITLES).format(**values)} ({index})",
+            'date': post_date.isoformat(),
+            'views': rng.randint(10, 5000),
+            'attachment': rng.random() < 0.5,
+            'sentences': [s.format(**values) for s in rng.sample(SYNTHETIC_SENTENCES, rng.randint(4, 8))],
+            # 첨부파일의 60%는 공통 서식, 나머지는 게시글마다 다른 파일
+            'file': (rng.choice(SYNTHETIC_FORMS) if rng.random() < 0.6
+                     else (f'붙임_{self.start_id - index}.hwp', rng.randint(20, 300) * 1024)),
+        }
+
+    def list_page(self, page: int) -> str:
+        """목록 페이지 (마지막 페이지를 넘으면 실제 사이트처럼 빈 목록)"""
+        start = max(0, (page - 1) * PAGE_SIZE)
+        rows = []
+        for index in range(start, min(start + PAGE_SIZE, self.total)):
+            post = self._post(index)
+            rows.append(
+                f'<tr><td class="ta_l"><a href="boardView.do?gesipan_id={self.gesipan_id}'
+                f'&gsgeul_no={post["post_id"]}">{post["title"]}</a></td>'
+                f'<td>{"<img src=/images/file.gif alt=첨부>" if post["attachment"] else ""}</td>'
+                f'<td>{post["date"]}</td><td>{post["views"]:,}</td></tr>'
+            )
+        return (
+            '<!DOCTYPE html><html><head><meta charset="UTF-8"><title>공지사항</title></head><body>'
+            '<div id="header"><ul class="gnb"><li><a href="/">홈</a></li><li><a href="/contents.do">병역이행안내</a></li></ul></div>'
+            '<div id="content"><table class="board_list"><caption>목록</caption>'
+            '<thead><tr><th>제목</th><th>첨부</th><th>작성일</th><th>조회수</th></tr></thead>'
+            f'<tbody>{"".join(rows)}</tbody></table></div>'
+            '<div id="footer"><p>병무청 민원상담 1588-9090</p></div></body></html>'
+        )
+
+    def view_page(self, post_id: int) -> Optional[str]:
+        index = self.start_id - post_id
+        if not 0 <= index < self.total:
+            return None
+        post = self._post(index)
+        body = ''.join(f'<p>{sentence}</p>' for sentence in post['sentences'])
+        attachment = (
+            f'<tr><th>첨부파일</th><td><a href="/download.do?gesipan_id={self.gesipan_id}'
+            f'&gsgeul_no={post_id}&fileNo=1">{post["file"][0]}</a></td></tr>'
+            if post['attachment'] else ''
+        )
+        return (
+            '<!DOCTYPE html><html><head><meta charset="UTF-8"><title>공지사항</title></head><body>'
+            '<div id="header"><ul class="gnb"><li><a href="/">홈</a></li><li><a href="/contents.do">병역이행안내</a></li></ul></div>'
+            '<div id="content"><table class="board_view"><tbody>'
+            f'<tr><th>제목</th><td>{post["title"]}</td></tr>'
+            f'<tr><th>작성일</th><td>{post["date"]}</td></tr>{attachment}'
+            f'<tr><td colspan="2" class="bbs_content">{body}</td></tr>'
+            '</tbody></table></div>'
+            '<div id="footer"><p>병무청 민원상담 1588-9090</p></div></body></html>'
+        )
+
+    def attachment(self, post_id: int) -> Optional[Dict]:
+        """게시글 첨부파일 (name, body), 첨부가 없으면 None"""
+        index = self.start_id - post_id
+        if not 0 <= index < self.total:
+            return None
+        post = self._post(index)
+        if not post['attachment']:
+            return None
+        name, size = post['file']
+        return {'name': name, 'body': synthetic_file(name, size)}
+
+# ----------------------------------------------------------------------------
+# 대체 서버
+# ----------------------------------------------------------------------------
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server: "ReplayServer"
+
+    def do_GET(self):
+        replay = self.server
+        replay.count('requests')
+        if replay.latency or replay.jitter:
+            time.sleep(replay.latency + random.uniform(0, replay.jitter))
+
+        if replay.error_rate and replay.rng.random() < replay.error_rate:
+            replay.count(f'status_{replay.error_status}')
+            self.send_response(replay.error_status)
+            if replay.retry_after is not None:
+                self.send_header('Retry-After', str(replay.retry_after))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if urlsplit(self.path).path.endswith('/download.do'):
+            self._send_download(replay)
+            return
+
+        body = replay.lookup(self.path)
+        if body is None:
+            replay.count('status_404')
+            self.send_error(404)
+            return
+
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            replay.count('status_304')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        replay.count('status_200')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_download(self, replay: "ReplayServer"):
+        """
+        첨부파일 응답
+        - Range: bytes=N- 요청은 If-Range가 현재 ETag와 같을 때만 206 부분 응답
+        - truncate_rate 비율의 응답은 본문 절반만 보내고 연결을 끊음 (이어 받기 확인용)
+        """
+        attachment = replay.lookup_attachment(self.path)
+        if attachment is None:
+            replay.count('status_404')
+            self.send_error(404)
+            return
+        body = attachment['body']
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+
+        start = 0
+        range_header = self.headers.get('Range', '')
+        if range_header.startswith('bytes=') and self.headers.get('If-Range', etag) == etag:
+            first = range_header[len('bytes='):].split('-', 1)[0]
+            start = int(first) if first.isdigit() else 0
+            if start >= len(body):
+                replay.count('status_416')
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(body)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+        status = 206 if start else 200
+        replay.count(f'status_{status}')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quote(attachment['name'])}")
+        self.send_header('Content-Length', str(len(body) - start))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', etag)
+        if start:
+            self.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+        self.end_headers()
+
+        if replay.truncate_rate and replay.rng.random() < replay.truncate_rate:
+            replay.count('truncated')
+            self.wfile.write(body[start:start + (len(body) - start) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    저장한 fixture와 합성 게시글을 돌려주는 로컬 서버
+    - synthetic_posts > 0이면 목록은 합성 게시글로 만들고, 상세는 fixture가 없을 때 합성
+    - error_rate 비율의 요청에 error_status 응답 (Retry-After 선택)
+    - truncate_rate 비율의 첨부파일 응답은 중간에 끊음
+    """
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 fixture_dir: Optional[str] = DEFAULT_FIXTURE_DIR, synthetic_posts: int = 0,
+                 boards: Optional[List[BoardConfig]] = None, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, error_status: int = 503,
+                 retry_after: Optional[int] = None, truncate_rate: float = 0.0, seed: int = 0):
+        super().__init__((host, port), ReplayHandler)
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.truncate_rate = truncate_rate
+        self.rng = random.Random(seed)
+        self.synthetic: Dict[str, SyntheticBoard] = {}
+        if synthetic_posts > 0:
+            for offset, board in enumerate(boards or load_boards()):
+                self.synthetic[board.gesipan_id] = SyntheticBoard(
+                    board.gesipan_id, synthetic_posts, start_id=1_600_000 - offset * 100_000, seed=seed
+                )
+        self.stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str):
+        with self._stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def lookup(self, path: str) -> Optional[bytes]:
+        key = fixture_key(path)
+        if key is None:
+            return None
+        kind, board_id, number = key[:-len('.html')].split('/')
+        synthetic = self.synthetic.get(board_id)
+
+        if synthetic and kind == 'list':
+            return synthetic.list_page(int(number)).encode('utf-8')
+
+        if self.fixture_dir:
+            try:
+                with open(os.path.join(self.fixture_dir, key), 'rb') as f:
+                    return f.read()
+            except OSError:
+                pass
+
+        if synthetic and kind == 'view':
+            html = synthetic.view_page(int(number))
+            return html.encode('utf-8') if html is not None else None
+        return None
+
+    def lookup_attachment(self, path: str) -> Optional[Dict]:
+        """download.do 요청의 합성 첨부파일 (fixture에는 첨부파일을 저장하지 않음)"""
+        params = parse_qs(urlsplit(path).query)
+        synthetic = self.synthetic.get(params.get('gesipan_id', [''])[0])
+        post_id = params.get('gsgeul_no', [''])[0]
+        if synthetic is None or not post_id.isdigit():
+            return None
+        return synthetic.attachment(int(post_id))
+
+    def start(self) -> str:
+        """백그라운드 스레드에서 서버 시작, base_url 반환"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='병무청 사이트 기록/재생 도구')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    capture_parser = subparsers.add_parser('capture', help='실제 사이트 페이지 저장')
+    capture_parser.add_argument('--output', default=DEFAULT_FIXTURE_DIR)
+    capture_parser.add_argument('--pages', type=int, default=1, help='게시판별 목록 페이지 수')
+    capture_parser.add_argument('--delay', type=float, default=1.0, help='요청 간격(초)')
+    capture_parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+
+    serve_parser = subparsers.add_parser('serve', help='로컬 대체 서버 실행')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8080)
+    serve_parser.add_argument('--fixtures', default=DEFAULT_FIXTURE_DIR)
+    serve_parser.add_argument('--synthetic-posts', type=int, default=0, help='게시판별 합성 게시글 수')
+    serve_parser.add_argument('--latency', type=float, default=0.0, help='응답 지연(초)')
+    serve_parser.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 최대값(초)')
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    serve_parser.add_argument('--error-status', type=int, default=503)
+    serve_parser.add_argument('--retry-after', type=int, default=None, help='오류 응답의 Retry-After(초)')
+    serve_parser.add_argument('--truncate-rate', type=float, default=0.0,
+                              help='첨부파일 응답을 중간에 끊는 비율 (0~1)')
+    serve_parser.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args()
+    if args.command == 'capture':
+        capture(args.output, pages=args.pages, base_url=args.base_url, delay=args.delay)
+        return
+
+    server = ReplayServer(
+        args.host, args.port, fixture_dir=args.fixtures, synthetic_posts=args.synthetic_posts,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        error_status=args.error_status, retry_after=args.retry_after,
+        truncate_rate=args.truncate_rate, seed=args.seed,
+    )
+    logger.info(f"🛰️  대체 서버 실행: {server.base_url} (MMA_BASE_URL={server.base_url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"📊 요청 통계: {server.stats}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+요청 재시도와 회로 차단기
+- RetryPolicy: urllib3 Retry 확장 (지터를 넣은 지수 백오프, Retry-After 상한, 재시도 로그/콜백)
+  HTTPAdapter(max_retries=...)로 세션에 연결해 연결 오류와 429/5xx 응답을 자동 재시도
+- CircuitBreaker: 호스트별 연속 실패 횟수가 임계값에 도달하면 일정 시간 요청을 차단하고
+  CircuitOpenError를 발생시켜 실행을 실패로 처리 (사이트 장애를 "새 게시글 없음"으로 오인하지 않도록)
+"""
+import os
+import time
+import random
+import threading
+import logging
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 응답 상태 (요청 제한, 일시적 서버 오류)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class RetryPolicy(Retry):
+    """
+    urllib3 Retry 확장
+    - 백오프: 0 ~ backoff_factor * 2^(재시도 횟수 - 1) 사이 무작위 대기 (full jitter, 최대 jitter_backoff_max초)
+    - Retry-After 헤더는 따르되 retry_after_max초로 제한 (Actions 실행 시간 보호)
+    - 재시도할 때마다 로그를 남기고 on_retry(url, 재시도 횟수, 원인) 호출
+    """
+
+    def __init__(self, *args, on_retry: Optional[Callable[[str, int, str], None]] = None,
+                 retry_after_max: float = 60.0, jitter_backoff_max: float = 30.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_retry = on_retry
+        self.retry_after_max = retry_after_max
+        self.jitter_backoff_max = jitter_backoff_max
+
+    def new(self, **kw):
+        # increment()가 새 객체를 만들 때 확장 설정 유지
+        kw.setdefault('on_retry', self.on_retry)
+        kw.setdefault('retry_after_max', self.retry_after_max)
+        kw.setdefault('jitter_backoff_max', self.jitter_backoff_max)
+        return super().new(**kw)
+
+    def get_backoff_time(self) -> float:
+        # increment() 뒤에 호출되므로 history에는 이번 실패까지 들어 있음
+        retries = len(self.history)
+        if retries == 0 or self.backoff_factor <= 0:
+            return 0.0
+        ceiling = min(self.jitter_backoff_max, self.backoff_factor * (2 ** (retries - 1)))
+        return random.uniform(0, ceiling)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.retry_after_max)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        attempt = len(new_retry.history)
+        if response is not None and response.status:
+            reason = f"상태 {response.status}"
+        else:
+            reason = type(error).__name__ if error else '알 수 없음'
+        if _pool is not None and url and url.startswith('/'):
+            port = f":{_pool.port}" if _pool.port else ''
+            full_url = f"{_pool.scheme}://{_pool.host}{port}{url}"
+        else:
+            full_url = url or ''
+        logger.warning(f"🔁 재시도 {attempt}/{self._max_attempts()}: {full_url} ({reason})")
+        if self.on_retry:
+            self.on_retry(full_url, attempt, reason)
+        return new_retry
+
+    def _max_attempts(self) -> str:
+        return str(self.total) if isinstance(self.total, int) else '-'
+
+def create_retry_from_env(on_retry: Optional[Callable[[str, int, str], None]] = None) -> RetryPolicy:
+    """
+    환경변수로 재시도 정책 생성
+    - HTTP_RETRIES: 최대 재시도 횟수 (기본 3, 0이면 재시도 안 함)
+    - HTTP_BACKOFF: 백오프 기본 시간(초, 기본 1)
+    - HTTP_BACKOFF_MAX: 백오프 최대 시간(초, 기본 30)
+    - HTTP_RETRY_AFTER_MAX: Retry-After 최대 대기 시간(초, 기본 60)
+    """
+    retries = int(os.getenv('HTTP_RETRIES', '3'))
+    return RetryPolicy(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=float(os.getenv('HTTP_BACKOFF', '1')),
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=True,
+        # 재시도 후에도 실패한 응답은 그대로 반환 (상태 코드를 지표와 속도 제한기에 기록)
+        raise_on_status=False,
+        on_retry=on_retry,
+        retry_after_max=float(os.getenv('HTTP_RETRY_AFTER_MAX', '60')),
+        jitter_backoff_max=float(os.getenv('HTTP_BACKOFF_MAX', '30')),
+    )
+
+def attempts_of(response: requests.Response) -> int:
+    """응답을 받기까지 시도한 횟수 (캐시 응답 등 기록이 없으면 1)"""
+    retries = getattr(getattr(response, 'raw', None), 'retries', None)
+    history = getattr(retries, 'history', None)
+    return len(history) + 1 if history else 1
+
+class CircuitOpenError(requests.RequestException):
+    """회로 차단기가 열려 요청을 보내지 않음"""
+
+class _HostCircuit:
+    """호스트 하나의 회로 상태"""
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_progress = False
+
+class CircuitBreaker:
+    """
+    호스트별 회로 차단기
+    - 닫힘: 요청 허용, 연속 실패 failure_threshold회에 열림
+    - 열림: cooldown초 동안 요청 즉시 거부 (CircuitOpenError)
+    - 반열림: cooldown이 지나면 요청 1건만 시험, 성공하면 닫히고 실패하면 다시 열림
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 60.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._circuits: Dict[str, _HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, host: str) -> _HostCircuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = _HostCircuit()
+            self._circuits[host] = circuit
+        return circuit
+
+    def before_request(self, url: str):
+        """요청 전 확인, 회로가 열려 있으면 CircuitOpenError"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.opened_at is None:
+                return
+            remaining = circuit.opened_at + self.cooldown - time.monotonic()
+            if remaining > 0 or circuit.trial_in_progress:
+                raise CircuitOpenError(
+                    f"{host} 회로 차단 중 (연속 실패 {circuit.failures}회, {max(0.0, remaining):.0f}초 후 재시도)"
+                )
+            circuit.trial_in_progress = True
+            logger.info(f"🔌 회로 반열림: {host} 시험 요청")
+
+    def record_success(self, url: str):
+        host = urlsplit(url).netloc
+        with self._lock:
+            circuit = self._circuit(host)
+            if circuit.opened_at is not None:
+                logger.info(f"🔌 회로 닫힘: {host} 정상 응답")
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.trial_in_progress = False
+
+    def record_failure(self, url: str) -> bool:
+        """실패 기록, 이번 실패로 회로가 열렸으면 True"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            circuit = self._circuit(host)
+            circuit.failures += 1
+            reopened = circuit.trial_in_progress
+            circuit.trial_in_progress = False
+            if reopened or (circuit.opened_at is None and circuit.failures >= self.failure_threshold):
+                circuit.opened_at = time.monotonic()
+                logger.error(f"🚨 회로 열림: {host} 연속 실패 {circuit.failures}회 - "
+                             f"{self.cooldown:.0f}초 동안 요청 차단")
+                return True
+            return False
+
+    def is_open(self, url: str) -> bool:
+        host = urlsplit(url).netloc
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return circuit is not None and circuit.opened_at is not None
+
+def create_breaker_from_env() -> CircuitBreaker:
+    """
+    환경변수로 회로 차단기 생성
+    - CIRCUIT_BREAKER_THRESHOLD: 회로를 여는 연속 실패 횟수 (기본 5, 재시도 후 최종 실패 기준)
+    - CIRCUIT_BREAKER_COOLDOWN: 차단 유지 시간(초, 기본 60)
+    """
+    return CircuitBreaker(
+        failure_threshold=int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '5')),
+        cooldown=float(os.getenv('CIRCUIT_BREAKER_COOLDOWN', '60')),
+    )
@@ -0,0 +1,87 @@
+"""
+게시글 수정 감지
+- 추출한 본문의 지문(공백을 뺀 텍스트의 sha256)을 처리 이력에 저장하고,
+  최근 게시글을 다시 확인해 지문이 바뀐 게시글만 찾음 (상세 페이지가 304면 추출도 하지 않음)
+- 바뀐 게시글은 이전 본문과 문장 단위로 비교해 바뀐 문장만 알림 (전체 재발송 없음)
+"""
+import os
+import re
+import hashlib
+from typing import List, NamedTuple, Optional
+
+from text_summarizer import SENTENCE_SPLIT_PATTERN
+
+# 줄바꿈도 문장 경계로 취급 (표, 목록 항목)
+LINE_SPLIT_PATTERN = re.compile(r'\n+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+class SentenceChange(NamedTuple):
+    """바뀐 문장 1건 (추가면 old가 None, 삭제면 new가 None)"""
+    old: Optional[str]
+    new: Optional[str]
+
+def content_fingerprint(text: Optional[str]) -> Optional[str]:
+    """
+    본문 지문 (본문이 없으면 None)
+    - 스트리밍 추출과 전체 분석의 공백/줄바꿈 차이로 수정으로 오인하지 않도록 공백을 모두 제거
+    """
+    if not text:
+        return None
+    return hashlib.sha256(''.join(text.split()).encode('utf-8')).hexdigest()
+
+def split_sentences(text: Optional[str]) -> List[str]:
+    """비교용 문장 목록 (줄, 문장 단위로 나누고 공백 정리, 빈 문장 제외)"""
+    sentences = []
+    for line in LINE_SPLIT_PATTERN.split(text or ''):
+        for sentence in SENTENCE_SPLIT_PATTERN.split(line):
+            sentence = WHITESPACE_PATTERN.sub(' ', sentence).strip()
+            if sentence:
+                sentences.append(sentence)
+    return sentences
+
+def diff_sentences(old_text: Optional[str], new_text: Optional[str]) -> List[SentenceChange]:
+    """
+    이전 본문과 새 본문의 바뀐 문장 (본문 순서)
+    - 같은 자리에서 바뀐 문장은 (이전, 이후) 한 쌍으로, 남는 문장은 추가/삭제로 표시
+    """
+    # 수정된 게시글이 있을 때만 필요하므로 새 게시글이 없는 실행에서는 import하지 않음
+    import difflib
+
+    old, new = split_sentences(old_text), split_sentences(new_text)
+    changes = []
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+        removed, added = old[i1:i2], new[j1:j2]
+        paired = min(len(removed), len(added))
+        changes.extend(SentenceChange(a, b) for a, b in zip(removed[:paired], added[:paired]))
+        changes.extend(SentenceChange(a, None) for a in removed[paired:])
+        changes.extend(SentenceChange(None, b) for b in added[paired:])
+    return changes
+
+class RevalidationConfig(NamedTuple):
+    """수정 확인 범위"""
+    days: int        # 작성일이 최근 days일 이내인 게시글 (0이면 확인 안 함)
+    limit: int       # 한 번에 확인할 최대 게시글 수 (최신 게시글부터)
+    interval: float  # 자동/상주 실행에서 확인 간격(초)
+    max_changes: int  # 알림에 표시할 게시글당 최대 문장 수
+
+    @property
+    def enabled(self) -> bool:
+        return self.days > 0 and self.limit > 0
+
+def create_revalidation_from_env() -> RevalidationConfig:
+    """
+    환경변수로 수정 확인 설정
+    - REVALIDATE_DAYS: 최근 며칠 안에 작성된 게시글을 확인할지 (기본 14, 0이면 끔)
+    - REVALIDATE_LIMIT: 한 번에 확인할 최대 게시글 수 (기본 30)
+    - REVALIDATE_INTERVAL: 자동/상주 실행에서 확인 간격(초, 기본 3600, 마지막 확인 시각은 처리 이력에 저장)
+    - REVISION_MAX_CHANGES: 게시글당 알림에 넣을 최대 문장 수 (기본 10)
+    """
+    return RevalidationConfig(
+        days=int(os.getenv('REVALIDATE_DAYS', '14')),
+        limit=int(os.getenv('REVALIDATE_LIMIT', '30')),
+        interval=float(os.getenv('REVALIDATE_INTERVAL', '3600')),
+        max_changes=int(os.getenv('REVISION_MAX_CHANGES', '10')),
+    )
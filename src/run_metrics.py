@@ -0,0 +1,208 @@
+"""
+실행 지표 수집
+- 단계별 소요 시간(횟수, 합계, 최대와 가장 느린 대상), 다운로드 바이트, HTTP 상태별 응답 수,
+  재시도 횟수, 게시글 수(발견/처리/건너뜀/수정 확인/수정), 첨부파일 수(다운로드/중복/기존), 상주 실행 조회 수, 캐시 적중률
+- 실행이 끝나면 JSON 보고서와 OpenMetrics 텍스트로 저장 (워크플로 아티팩트/수집용)
+"""
+import os
+import json
+import time
+import threading
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = 'mma_crawler'
+
+class StageStats:
+    """단계 하나의 누적 소요 시간"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.slowest: Optional[str] = None
+
+    def add(self, seconds: float, label: Optional[str] = None):
+        self.count += 1
+        self.total += seconds
+        if seconds >= self.max:
+            self.max = seconds
+            self.slowest = label
+
+    def to_dict(self) -> Dict:
+        data = {'count': self.count, 'total_seconds': round(self.total, 6), 'max_seconds': round(self.max, 6)}
+        if self.slowest:
+            data['slowest'] = self.slowest
+        return data
+
+class RunMetrics:
+    """
+    실행 1회의 지표 (여러 스레드에서 기록 가능)
+    - stage(): with 블록 소요 시간을 단계별로 누적
+    - incr(): 횟수 지표 증가 (downloaded_bytes, http_retries, posts_found 등)
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self.stages: Dict[str, StageStats] = {}
+        self.counters: Dict[str, int] = {
+            'downloaded_bytes': 0,
+            'http_requests': 0,
+            'http_errors': 0,
+            'http_cache_hits': 0,
+            'http_retries': 0,
+            'posts_found': 0,
+            'posts_processed': 0,
+            'posts_skipped': 0,
+            'posts_revalidated': 0,
+            'posts_revised': 0,
+            'emails_sent': 0,
+            'emails_failed': 0,
+            'smtp_reconnects': 0,
+            'attachments_downloaded': 0,
+            'attachments_deduplicated': 0,
+            'attachments_cached': 0,
+            'attachments_failed': 0,
+            'polls': 0,
+            'poll_failures': 0,
+        }
+        self.http_status: Dict[str, int] = {}
+        self.caches: Dict[str, Dict] = {}
+        self.info: Dict[str, str] = {}
+        self.success: Optional[bool] = None
+
+    @contextmanager
+    def stage(self, name: str, label: Optional[str] = None) -> Iterator[None]:
+        """with 블록 소요 시간을 name 단계에 기록 (label은 가장 느린 대상 표시용)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_duration(name, time.perf_counter() - started, label)
+
+    def add_duration(self, name: str, seconds: float, label: Optional[str] = None):
+        with self._lock:
+            self.stages.setdefault(name, StageStats()).add(seconds, label)
+
+    def incr(self, name: str, value: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def record_response(self, status: Optional[int], size: int = 0, from_cache: bool = False):
+        """HTTP 응답 1건 기록 (status가 None이면 연결 오류)"""
+        with self._lock:
+            key = str(status) if status is not None else 'error'
+            self.http_status[key] = self.http_status.get(key, 0) + 1
+            self.counters['http_requests'] += 1
+            if status is None or status >= 400:
+                self.counters['http_errors'] += 1
+            if from_cache:
+                self.counters['http_cache_hits'] += 1
+            else:
+                self.counters['downloaded_bytes'] += size
+
+    def set_cache(self, name: str, hits: int, misses: int):
+        """캐시 적중/미스 횟수 기록"""
+        total = hits + misses
+        with self._lock:
+            self.caches[name] = {
+                'hits': hits, 'misses': misses,
+                'hit_rate': round(hits / total, 4) if total else None,
+            }
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            http_total = self.counters['http_requests']
+            caches = dict(self.caches)
+            caches.setdefault('http', {
+                'hits': self.counters['http_cache_hits'],
+                'misses': http_total - self.counters['http_cache_hits'],
+                'hit_rate': round(self.counters['http_cache_hits'] / http_total, 4) if http_total else None,
+            })
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'duration_seconds': round(time.monotonic() - self._started, 3),
+                'success': self.success,
+                'info': dict(self.info),
+                'stages': {name: stats.to_dict() for name, stats in self.stages.items()},
+                'counters': dict(self.counters),
+                'http_status': dict(self.http_status),
+                'caches': caches,
+            }
+
+    def to_openmetrics(self) -> str:
+        """OpenMetrics 텍스트 형식 (Prometheus로 수집 가능)"""
+        data = self.to_dict()
+        lines: List[str] = []
+
+        def family(name: str, metric_type: str, help_text: str,
+                   samples: List[Tuple[str, Dict[str, str], float]]):
+            full = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# TYPE {full} {metric_type}")
+            lines.append(f"# HELP {full} {help_text}")
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+                lines.append(f"{full}{suffix}{{{label_text}}} {value}" if label_text else f"{full}{suffix} {value}")
+
+        family('run_duration_seconds', 'gauge', 'Wall time of the run.',
+               [('', {}, data['duration_seconds'])])
+        family('run_success', 'gauge', '1 if notifications were delivered.',
+               [('', {}, 1 if data['success'] else 0)])
+        family('stage_seconds', 'counter', 'Time spent per stage.',
+               [('_total', {'stage': name}, stats['total_seconds']) for name, stats in data['stages'].items()])
+        family('stage_calls', 'counter', 'Executions per stage.',
+               [('_total', {'stage': name}, stats['count']) for name, stats in data['stages'].items()])
+        family('stage_max_seconds', 'gauge', 'Slowest single execution per stage.',
+               [('', {'stage': name}, stats['max_seconds']) for name, stats in data['stages'].items()])
+        family('http_responses', 'counter', 'HTTP responses by status.',
+               [('_total', {'status': status}, count) for status, count in data['http_status'].items()])
+        family('downloaded_bytes', 'counter', 'Response bytes downloaded (cache hits excluded).',
+               [('_total', {}, data['counters']['downloaded_bytes'])])
+        family('retries', 'counter', 'Retried operations.',
+               [('_total', {'kind': 'http'}, data['counters']['http_retries']),
+                ('_total', {'kind': 'smtp_reconnect'}, data['counters']['smtp_reconnects'])])
+        family('posts', 'counter', 'Posts by outcome.',
+               [('_total', {'state': state}, data['counters'][f'posts_{state}'])
+                for state in ('found', 'processed', 'skipped', 'revalidated', 'revised')])
+        family('emails', 'counter', 'Notification emails by outcome.',
+               [('_total', {'state': 'sent'}, data['counters']['emails_sent']),
+                ('_total', {'state': 'failed'}, data['counters']['emails_failed'])])
+        family('attachments', 'counter', 'Attachments by outcome.',
+               [('_total', {'state': state}, data['counters'][f'attachments_{state}'])
+                for state in ('downloaded', 'deduplicated', 'cached', 'failed')])
+        family('polls', 'counter', 'Daemon board polls by outcome.',
+               [('_total', {'state': 'ok'}, data['counters']['polls'] - data['counters']['poll_failures']),
+                ('_total', {'state': 'failed'}, data['counters']['poll_failures'])])
+        family('cache_hit_ratio', 'gauge', 'Cache hit ratio.',
+               [('', {'cache': name}, stats['hit_rate']) for name, stats in data['caches'].items()
+                if stats['hit_rate'] is not None])
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, directory: str = 'reports') -> Tuple[str, str]:
+        """JSON 보고서와 OpenMetrics 파일 저장, 경로 반환"""
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, 'run_report.json')
+        metrics_path = os.path.join(directory, 'run_metrics.prom')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(metrics_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_openmetrics())
+        logger.info(f"📊 실행 보고서 저장: {json_path}, {metrics_path}")
+        return json_path, metrics_path
+
+    def log_summary(self):
+        """단계별 소요 시간 한 줄 요약 로그"""
+        with self._lock:
+            parts = [f"{name} {stats.total:.2f}초" for name, stats in self.stages.items()]
+        if parts:
+            logger.info(f"⏱️  단계별 소요 시간: {', '.join(parts)}")
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
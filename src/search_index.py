@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+게시글 전문 검색 색인 (SQLite FTS5, trigram 토크나이저)
+- 처리한 게시글의 제목, 작성일, 요약, 본문을 저장하고 process_posts에서 새 게시글마다 추가
+- trigram은 형태소 분석 없이 한국어 부분 문자열(3글자 이상)을 찾을 수 있음
+  2글자 검색어(예: 모집)는 색인을 쓸 수 없어 instr()로 찾은 범위를 거름
+- 결과는 bm25 점수(제목 > 요약 > 본문 가중치) 순서, 검색어 주변 본문 조각 포함
+  (순위를 먼저 정하고 상위 결과에만 snippet()을 계산, 짧은 검색어만 있으면 최신 게시글부터 찾아 limit건에서 중단)
+
+사용법:
+    python src/search_index.py "기술행정병 접수기간" --since 2026-07-01 --until 2026-09-30
+    python src/search_index.py "모집 안내" --board 69 --limit 5 --json
+"""
+import os
+import re
+import time
+import sqlite3
+import threading
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# bm25 열 가중치 (title, summary, content, 나머지 UNINDEXED 열)
+BM25_WEIGHTS = (10.0, 3.0, 1.0, 0.0, 0.0, 0.0)
+# trigram 색인을 쓸 수 있는 최소 검색어 길이
+MIN_TERM_LENGTH = 3
+SNIPPET_TOKENS = 40
+HIGHLIGHT = ('[', ']')
+
+class SearchHit(NamedTuple):
+    """검색 결과 1건"""
+    post_id: int
+    board: Optional[str]
+    title: str
+    date: Optional[str]
+    url: str
+    snippet: str
+    score: float  # bm25 (작을수록 관련도 높음, 짧은 검색어만 있으면 0)
+
+def split_terms(query: str) -> Tuple[List[str], List[str]]:
+    """검색어를 (색인 검색어, 짧은 검색어)로 분리 (큰따옴표로 묶은 구절은 한 검색어)"""
+    terms = [phrase or word for phrase, word in re.findall(r'"([^"]+)"|(\S+)', query)]
+    long_terms = [term for term in terms if len(term) >= MIN_TERM_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_TERM_LENGTH]
+    return long_terms, short_terms
+
+def _match_expression(terms: List[str]) -> str:
+    # 모든 검색어를 구절로 취급 (FTS5 연산자/특수문자가 그대로 검색되도록)
+    return ' AND '.join('"%s"' % term.replace('"', '""') for term in terms)
+
+class SearchIndex:
+    def __init__(self, path: str = 'data/search.db'):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        try:
+            self._create_tables()
+        except sqlite3.Error:
+            self.conn.close()
+            raise
+
+    def _create_tables(self):
+        with self.conn:
+            # rowid = 게시글 번호(gsgeul_no)
+            self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS notices USING fts5(
+                    title, summary, content,
+                    board UNINDEXED, date UNINDEXED, url UNINDEXED,
+                    tokenize = 'trigram'
+                )
+            """)
+            # 작성일 → 게시글 번호 (기간 검색을 rowid 범위로 좁혀 범위 밖 게시글은 순위 계산에서 제외)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS notice_dates (
+                    post_id INTEGER PRIMARY KEY,
+                    date TEXT
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS notice_dates_date ON notice_dates (date)")
+
+    def add_posts(self, posts: Iterable[Dict], replace: bool = True) -> int:
+        """
+        게시글 색인 (게시글 번호가 없는 게시글은 제외), 추가한 건수 반환
+        - replace=False면 이미 색인된 게시글은 그대로 둠 (본문 없이 저장소에서 불러온 게시글용)
+        """
+        rows = [
+            (post['post_id'], post['title'], post.get('summary') or '', post.get('content') or '',
+             post.get('board_key'), str(post['date']) if post.get('date') else None, post['url'])
+            for post in posts if post.get('post_id') is not None
+        ]
+        if not rows:
+            return 0
+        added = 0
+        with self._lock, self.conn:
+            for row in rows:
+                exists = self.conn.execute("SELECT 1 FROM notices WHERE rowid = ?", (row[0],)).fetchone()
+                if exists and not replace:
+                    continue
+                if exists:
+                    self.conn.execute("DELETE FROM notices WHERE rowid = ?", (row[0],))
+                self.conn.execute("""
+                    INSERT INTO notices (rowid, title, summary, content, board, date, url)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, row)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO notice_dates (post_id, date) VALUES (?, ?)", (row[0], row[5])
+                )
+                added += 1
+        return added
+
+    def search(self, query: str, limit: int = 10, board: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None) -> List[SearchHit]:
+        """
+        검색어가 모두 들어 있는 게시글을 관련도 순으로 반환
+        - since/until: 작성일 범위 (YYYY-MM-DD, 양 끝 포함)
+        - 3글자 이상 검색어가 없으면 최근 게시글 순 (게시글 번호 역순)
+        """
+        long_terms, short_terms = split_terms(query)
+        if not long_terms and not short_terms:
+            return []
+
+        conditions, params = [], []
+        if long_terms:
+            conditions.append("notices MATCH ?")
+            params.append(_match_expression(long_terms))
+        for term in short_terms:
+            conditions.append("(instr(title, ?) > 0 OR instr(summary, ?) > 0 OR instr(content, ?) > 0)")
+            params.extend([term, term, term])
+        if board:
+            conditions.append("board = ?")
+            params.append(board)
+        if since or until:
+            bounds = self._rowid_bounds(since, until)
+            if bounds is None:
+                return []
+            conditions.append("rowid BETWEEN ? AND ?")
+            params.extend(bounds)
+        if since:
+            conditions.append("date >= ?")
+            params.append(since)
+        if until:
+            conditions.append("date <= ?")
+            params.append(until)
+
+        where = ' AND '.join(conditions)
+        with self._lock:
+            if long_terms:
+                # snippet()을 ORDER BY와 함께 쓰면 일치한 모든 게시글에서 계산하므로 순위만 먼저 구함
+                weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+                ranked = self.conn.execute(
+                    f"SELECT rowid, bm25(notices, {weights}) AS score FROM notices "
+                    f"WHERE {where} ORDER BY score LIMIT ?", params + [limit]
+                ).fetchall()
+                rows = []
+                for post_id, score in ranked:
+                    row = self.conn.execute(
+                        f"SELECT board, title, date, url, snippet(notices, -1, ?, ?, '…', {SNIPPET_TOKENS}) "
+                        f"AS snippet FROM notices WHERE notices MATCH ? AND rowid = ?",
+                        list(HIGHLIGHT) + [params[0], post_id]
+                    ).fetchone()
+                    rows.append((post_id, score, row))
+            else:
+                # 게시글 번호는 작성 순서이므로 번호 역순으로 훑다가 limit건을 찾으면 중단
+                rows = [
+                    (row['rowid'], 0.0, row) for row in self.conn.execute(
+                        f"SELECT rowid, board, title, date, url, summary, content FROM notices "
+                        f"WHERE {where} ORDER BY rowid DESC LIMIT ?", params + [limit]
+                    )
+                ]
+
+        hits = []
+        for post_id, score, row in rows:
+            if long_terms:
+                snippet = row['snippet']
+            else:
+                # 검색어가 들어 있는 첫 열 (본문 → 요약 → 제목)
+                text = next((row[column] for column in ('content', 'summary', 'title')
+                             if row[column] and any(term in row[column] for term in short_terms)), row['title'])
+                snippet = make_snippet(text, short_terms)
+            hits.append(SearchHit(
+                post_id=post_id, board=row['board'], title=row['title'], date=row['date'],
+                url=row['url'], snippet=' '.join(snippet.split()), score=round(score, 6),
+            ))
+        return hits
+
+    def _rowid_bounds(self, since: Optional[str], until: Optional[str]) -> Optional[Tuple[int, int]]:
+        """작성일 범위에 든 게시글 번호의 최소/최대 (해당 게시글이 없으면 None)"""
+        with self._lock:
+            low, high = self.conn.execute(
+                "SELECT min(post_id), max(post_id) FROM notice_dates WHERE date >= ? AND date <= ?",
+                (since or '', until or '9999-12-31')
+            ).fetchone()
+        return None if low is None else (low, high)
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT count(*) FROM notices").fetchone()[0]
+
+    def optimize(self):
+        """색인 세그먼트 병합 (대량 색인 후 검색 속도 개선)"""
+        with self._lock, self.conn:
+            self.conn.execute("INSERT INTO notices (notices) VALUES ('optimize')")
+
+    def close(self):
+        self.conn.close()
+
+def make_snippet(text: str, terms: List[str], width: int = SNIPPET_TOKENS) -> str:
+    """첫 번째 검색어 주변 텍스트 조각 (snippet()을 쓸 수 없는 짧은 검색어용)"""
+    position = min((index for index in (text.find(term) for term in terms) if index >= 0), default=0)
+    start = max(0, position - width // 2)
+    end = min(len(text), start + width)
+    fragment = text[start:end]
+    for term in terms:
+        fragment = fragment.replace(term, f"{HIGHLIGHT[0]}{term}{HIGHLIGHT[1]}")
+    return ('…' if start else '') + fragment + ('…' if end < len(text) else '')
+
+def create_index_from_env() -> Optional[SearchIndex]:
+    """
+    SEARCH_INDEX_PATH (기본 data/search.db, 비우면 색인하지 않음)
+    - SQLite에 FTS5 trigram 토크나이저가 없으면(3.34 미만 등) 경고만 남기고 색인하지 않음
+    """
+    path = os.getenv('SEARCH_INDEX_PATH', 'data/search.db')
+    if not path:
+        return None
+    try:
+        return SearchIndex(path)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"⚠️  전문 검색 색인을 만들 수 없어 색인하지 않음 (SQLite {sqlite3.sqlite_version}): {e}")
+        return None
+
+def main(argv: Optional[List[str]] = None):
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(description='수집한 공지사항 전문 검색')
+    parser.add_argument('query', help='검색어 (공백으로 구분하면 모두 포함, "..."는 구절)')
+    parser.add_argument('--since', help='작성일 시작 (YYYY-MM-DD)')
+    parser.add_argument('--until', help='작성일 끝 (YYYY-MM-DD)')
+    parser.add_argument('--board', help='게시판 번호 (gesipan_id)')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--index', default=os.getenv('SEARCH_INDEX_PATH') or 'data/search.db', help='색인 파일')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.index):
+        parser.error(f"색인 파일이 없습니다: {args.index} (크롤러를 한 번 실행하면 만들어집니다)")
+    index = SearchIndex(args.index)
+    started = time.perf_counter()
+    hits = index.search(args.query, limit=args.limit, board=args.board, since=args.since, until=args.until)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps([hit._asdict() for hit in hits], ensure_ascii=False, indent=2))
+    else:
+        print(f"🔎 '{args.query}' 검색 결과 {len(hits)}건 ({elapsed_ms:.1f}ms, 색인 {index.count():,}건)")
+        for rank, hit in enumerate(hits, 1):
+            print(f"\n{rank}. [{hit.date}] {hit.title}")
+            print(f"   {hit.snippet}")
+            print(f"   {hit.url}")
+    index.close()
+
+if __name__ == "__main__":
+    main()
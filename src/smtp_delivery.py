@@ -0,0 +1,139 @@
+"""
+SMTP 발송 엔진
+- 인증된 연결을 열어 둔 채 여러 메시지를 연속 발송 (메시지마다 TLS/로그인 반복 안 함)
+- 연결이 끊기면 자동으로 다시 연결해 재시도
+- pool_size개의 연결을 두고 백그라운드 스레드에서 발송 가능
+"""
+import queue
+import smtplib
+import threading
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.message import Message
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 연결을 다시 맺으면 해결될 수 있는 오류
+# (SMTPConnectError는 SMTPResponseException 하위 클래스이므로 응답 오류보다 먼저 확인)
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError)
+
+class SMTPDeliveryEngine:
+    def __init__(self, host: str, port: int, username: Optional[str] = None,
+                 password: Optional[str] = None, use_starttls: bool = True,
+                 timeout: float = 30, pool_size: int = 1, max_attempts: int = 3):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_starttls = use_starttls
+        self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.max_attempts = max(1, max_attempts)
+
+        # 유휴 연결 (None은 아직 열지 않은 자리)
+        self._idle: "queue.Queue[Optional[smtplib.SMTP]]" = queue.Queue()
+        for _ in range(self.pool_size):
+            self._idle.put(None)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        self.sent = 0
+        self.reconnects = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        server.ehlo()
+        if self.use_starttls:
+            server.starttls()
+            server.ehlo()
+        if self.username and self.password:
+            if server.has_extn('auth'):
+                server.login(self.username, self.password)
+            else:
+                logger.warning(f"⚠️  {self.host}:{self.port} 서버가 AUTH를 지원하지 않아 로그인을 건너뜁니다.")
+        logger.info(f"📡 SMTP 연결: {self.host}:{self.port}")
+        return server
+
+    def send(self, msg: Message, to_addrs: Optional[Sequence[str]] = None) -> bool:
+        """
+        메시지 1건 발송 (유휴 연결 재사용)
+        - 연결 끊김이면 다시 연결해 최대 max_attempts번 시도
+        - 수신 거부 등 SMTP 응답 오류는 재시도하지 않음
+        """
+        server = self._idle.get()
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    if server is None:
+                        server = self._connect()
+                    server.send_message(msg, to_addrs=to_addrs)
+                    self.sent += 1
+                    return True
+                except RECONNECT_ERRORS as e:
+                    error = e
+                except smtplib.SMTPResponseException as e:
+                    logger.error(f"❌ 발송 거부 ({msg['To']}): {e.smtp_code} {e.smtp_error!r}")
+                    return False
+                except smtplib.SMTPRecipientsRefused as e:
+                    logger.error(f"❌ 수신자 거부: {list(e.recipients)}")
+                    return False
+                except OSError as e:
+                    # 시간 초과, TLS 오류 등 소켓 오류 (SMTP 응답 오류도 OSError라 마지막에 확인)
+                    error = e
+                logger.warning(f"⚠️  SMTP 연결 오류 ({attempt}/{self.max_attempts}): {error}")
+                self._discard(server)
+                server = None
+                self.reconnects += 1
+            return False
+        finally:
+            self._idle.put(server)
+
+    def send_batch(self, messages: Sequence[Tuple[Message, Optional[Sequence[str]]]]) -> List[bool]:
+        """
+        여러 메시지 발송 (입력 순서대로 결과 반환)
+        - pool_size가 2 이상이면 연결별로 나눠 동시에 발송
+        """
+        if self.pool_size == 1 or len(messages) <= 1:
+            return [self.send(msg, to_addrs) for msg, to_addrs in messages]
+        futures = [self.submit(msg, to_addrs) for msg, to_addrs in messages]
+        return [future.result() for future in futures]
+
+    def submit(self, msg: Message, to_addrs: Optional[Sequence[str]] = None) -> "Future[bool]":
+        """백그라운드 스레드에서 발송 (결과는 Future로 확인)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.pool_size,
+                                                    thread_name_prefix='smtp')
+        return self._executor.submit(self.send, msg, to_addrs)
+
+    @staticmethod
+    def _discard(server: Optional[smtplib.SMTP]):
+        if server is None:
+            return
+        try:
+            server.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """백그라운드 발송을 마치고 모든 연결 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+        for _ in range(self.pool_size):
+            server = self._idle.get()
+            if server is not None:
+                try:
+                    server.quit()
+                except Exception:
+                    self._discard(server)
+            self._idle.put(None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
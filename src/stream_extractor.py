@@ -0,0 +1,282 @@
+"""
+스트리밍 본문 추출기
+- 응답을 받는 동안 조각 단위로 HTMLParser.feed, 전체 문서를 메모리에 올리거나 트리를 만들지 않음
+- 기억한 본문 선택자(태그, 태그.클래스, 태그#아이디) 영역의 텍스트만 모으고 영역이 닫히면 읽기 중단
+- 응답 크기 상한(max_bytes)을 넘으면 중단
+- 텍스트는 BeautifulSoup get_text(separator='\n', strip=True)와 같은 형태로 합침
+- link_pattern을 주면 href가 맞는 링크(첨부파일)를 문서 어디에 있든 함께 수집
+"""
+import re
+import codecs
+import logging
+from html.parser import HTMLParser
+from typing import List, Optional, Pattern, Tuple
+
+import requests
+
+from content_extractor import SKIP_TAGS, ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# 스트리밍으로 찾을 수 있는 선택자: 태그, 태그.클래스, 태그#아이디 (nth-of-type 경로 등은 전체 분석)
+SIMPLE_SELECTOR = re.compile(r'^([a-z][a-z0-9]*)(?:([.#])([\w-]+))?$', re.I)
+
+# 닫는 태그가 없는 요소 (태그 스택에 넣지 않음)
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+}
+
+CHUNK_SIZE = 16 * 1024
+
+def parse_selector(selector: Optional[str]) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    """단순 선택자를 (태그, 클래스, 아이디)로 변환 (지원하지 않으면 None)"""
+    if not selector:
+        return None
+    match = SIMPLE_SELECTOR.match(selector.strip())
+    if not match:
+        return None
+    tag, kind, name = match.groups()
+    return tag.lower(), name if kind == '.' else None, name if kind == '#' else None
+
+class _LinkParser(HTMLParser):
+    """href가 link_pattern에 맞는 링크의 (href, 링크 텍스트)를 모으는 HTMLParser"""
+
+    def __init__(self, link_pattern: Optional[Pattern] = None):
+        super().__init__(convert_charrefs=True)
+        self.link_pattern = link_pattern
+        self.links: List[Tuple[str, str]] = []
+        self._link_href: Optional[str] = None
+        self._link_text: List[str] = []
+
+    def _link_start(self, tag: str, attrs):
+        if self.link_pattern is None or tag != 'a':
+            return
+        href = dict(attrs).get('href') or ''
+        if self.link_pattern.search(href):
+            self._link_href = href
+            self._link_text = []
+
+    def _link_data(self, data: str):
+        if self._link_href is not None:
+            self._link_text.append(data)
+
+    def _link_end(self, tag: str):
+        if tag == 'a' and self._link_href is not None:
+            self.links.append((self._link_href, ' '.join(''.join(self._link_text).split())))
+            self._link_href = None
+
+    def handle_starttag(self, tag: str, attrs):
+        self._link_start(tag, attrs)
+
+    def handle_data(self, data: str):
+        self._link_data(data)
+
+    def handle_endtag(self, tag: str):
+        self._link_end(tag)
+
+def find_links(html: str, link_pattern: Pattern) -> List[Tuple[str, str]]:
+    """문서 전체에서 href가 link_pattern에 맞는 링크 (href, 링크 텍스트) 목록"""
+    parser = _LinkParser(link_pattern)
+    parser.feed(html)
+    parser.close()
+    return parser.links
+
+class _RegionParser(_LinkParser):
+    """선택자에 맞는 첫 요소의 텍스트를 모으는 HTMLParser (링크 수집은 영역이 닫힌 뒤에도 계속)"""
+
+    def __init__(self, tag: str, class_name: Optional[str], element_id: Optional[str],
+                 link_pattern: Optional[Pattern] = None):
+        super().__init__(link_pattern)
+        self.tag = tag
+        self.class_name = class_name
+        self.element_id = element_id
+
+        self.stack: List[str] = []
+        self.region_depth: Optional[int] = None  # 영역 요소의 스택 위치
+        self.done = False
+        self.skip_depth = 0   # 열린 script/style 등 개수
+        self.link_depth = 0   # 열린 a 개수
+        self.strings: List[str] = []
+        self.total_length = 0
+        self._pending: List[str] = []
+
+    # 텍스트 노드가 feed 경계에서 나뉘어 들어올 수 있으므로 태그를 만날 때 합쳐서 처리
+    def handle_data(self, data: str):
+        self._link_data(data)
+        if not self.done:
+            self._pending.append(data)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = ''.join(self._pending).strip()
+        self._pending.clear()
+        if not text or self.skip_depth:
+            return
+        if not self.link_depth:
+            self.total_length += len(text)
+        if self.region_depth is not None:
+            self.strings.append(text)
+
+    def _matches(self, tag: str, attrs) -> bool:
+        if tag != self.tag:
+            return False
+        values = dict(attrs)
+        if self.element_id is not None and values.get('id') != self.element_id:
+            return False
+        if self.class_name is not None and self.class_name not in (values.get('class') or '').split():
+            return False
+        return True
+
+    def handle_starttag(self, tag: str, attrs):
+        self._link_start(tag, attrs)
+        if self.done:
+            return
+        self._flush()
+        if self.region_depth is None and self._matches(tag, attrs):
+            self.region_depth = len(self.stack)
+        if tag in VOID_TAGS:
+            return
+        self.stack.append(tag)
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag == 'a':
+            self.link_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs):
+        if not self.done:
+            self._flush()
+
+    def handle_endtag(self, tag: str):
+        self._link_end(tag)
+        if self.done:
+            return
+        self._flush()
+        # 짝이 맞는 가장 가까운 열린 태그까지 닫음 (짝이 없으면 무시)
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index] == tag:
+                break
+        else:
+            return
+        for closed in self.stack[index:]:
+            if closed in SKIP_TAGS:
+                self.skip_depth -= 1
+            elif closed == 'a':
+                self.link_depth -= 1
+        del self.stack[index:]
+        if self.region_depth is not None and index <= self.region_depth:
+            self.done = True
+
+    def handle_comment(self, data: str):
+        if not self.done:
+            self._flush()
+
+    def finish(self, complete: bool = True):
+        """complete=False(중간에 읽기 중단)이면 남은 미완성 태그를 텍스트로 처리하지 않음"""
+        if complete and not self.done:
+            self.close()
+        self._flush()
+
+class StreamingExtractor:
+    """
+    응답 1건을 스트리밍으로 읽어 본문 영역 추출
+    - consume(response): 크롤러 _fetch의 consume 콜백, 읽은 바이트 수 반환
+    - result(): 추출 결과 (영역을 찾지 못했거나 min_length 미만이면 None)
+    - links: link_pattern에 맞는 링크, need_links=True면 링크를 찾을 때까지 영역이 닫힌 뒤에도 계속 읽음
+    """
+
+    def __init__(self, selector: str, max_bytes: int = 2 * 1024 * 1024,
+                 chunk_size: int = CHUNK_SIZE, min_length: int = 100,
+                 link_pattern: Optional[Pattern] = None, need_links: bool = False):
+        parsed = parse_selector(selector)
+        if parsed is None:
+            raise ValueError(f"스트리밍으로 찾을 수 없는 선택자: {selector}")
+        self.selector = selector
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.min_length = min_length
+        self._parser = _RegionParser(*parsed, link_pattern=link_pattern)
+        self.need_links = need_links and link_pattern is not None
+        self.bytes_read = 0
+        self.truncated = False  # 크기 상한으로 중단
+
+    @staticmethod
+    def supports(selector: Optional[str]) -> bool:
+        return parse_selector(selector) is not None
+
+    def feed(self, chunk: bytes, decoder) -> bool:
+        """조각 1개 처리, 더 읽을 필요가 없으면(영역이 닫히고 필요한 링크를 찾음) True"""
+        self.bytes_read += len(chunk)
+        self._parser.feed(decoder.decode(chunk))
+        return self._parser.done and not (self.need_links and not self._parser.links)
+
+    def consume(self, response: requests.Response) -> int:
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        for chunk in response.iter_content(self.chunk_size):
+            remaining = self.max_bytes - self.bytes_read
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+                self.truncated = True
+            if self.feed(chunk, decoder):
+                break
+            if self.truncated:
+                logger.warning(f"⚠️  응답 크기 상한({self.max_bytes:,} bytes) 도달 - 읽기 중단: {response.url}")
+                break
+        self._parser.finish(complete=not self.truncated)
+        return self.bytes_read
+
+    @property
+    def closed(self) -> bool:
+        """본문 영역이 닫힐 때까지 읽었는지"""
+        return self._parser.done
+
+    @property
+    def links(self) -> List[Tuple[str, str]]:
+        return self._parser.links
+
+    def result(self) -> Optional[ExtractionResult]:
+        parser = self._parser
+        if parser.region_depth is None:
+            return None
+        text = '\n'.join(parser.strings)
+        if len(text) < self.min_length:
+            return None
+        length = sum(len(string) for string in parser.strings)
+        # 영역이 닫힌 뒤는 읽지 않으므로 신뢰도는 읽은 부분의 텍스트 기준
+        confidence = round(min(1.0, length / parser.total_length), 2) if parser.total_length else 0.0
+        return ExtractionResult(
+            text=text, selector=self.selector, score=float(length),
+            confidence=confidence, method='stream',
+        )
+
+class BoundedReader:
+    """
+    응답을 max_bytes까지만 읽어 문자열로 반환 (스트리밍 추출을 쓸 수 없을 때 전체 분석용)
+    - body(바이트)와 encoding도 보관 (프로세스 풀 작업자에는 디코딩하지 않고 바이트로 전달)
+    """
+
+    def __init__(self, max_bytes: int = 2 * 1024 * 1024, chunk_size: int = CHUNK_SIZE):
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.truncated = False
+        self.body = b''
+        self.encoding: Optional[str] = None
+
+    @property
+    def html(self) -> str:
+        return self.body.decode(self.encoding or 'utf-8', errors='replace')
+
+    def consume(self, response: requests.Response) -> int:
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(self.chunk_size):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_bytes:
+                self.truncated = True
+                logger.warning(f"⚠️  응답 크기 상한({self.max_bytes:,} bytes) 도달 - 앞부분만 분석: {response.url}")
+                break
+        self.body = b''.join(chunks)[:self.max_bytes]
+        self.encoding = response.encoding
+        return size
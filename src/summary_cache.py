@@ -0,0 +1,168 @@
+"""
+요약 결과 캐시
+- 정규화한 본문 해시 + 요약기 설정(max_length, 방식, 알고리즘 버전)을 키로 사용
+  (tfidf/textrank는 코퍼스 통계 해시도 포함해 코퍼스가 바뀌면 다시 요약)
+- 메모리 LRU → 디스크(SQLite) 2단계, 디스크는 총 크기 기준으로 오래 안 쓴 항목부터 삭제
+- 적중/미스 횟수와 절약한 계산 시간 집계
+"""
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+class SummaryCache:
+    def __init__(self, path: Optional[str] = 'data/summary_cache.db',
+                 memory_size: int = 256, max_bytes: int = 10 * 1024 * 1024):
+        self.memory_size = memory_size
+        self.max_bytes = max_bytes
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+        # path가 비어 있으면 메모리 캐시만 사용
+        self.conn = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            with self.conn:
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS summaries (
+                        key TEXT PRIMARY KEY,
+                        summary TEXT NOT NULL,
+                        compute_seconds REAL NOT NULL,
+                        size INTEGER NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """)
+
+    @staticmethod
+    def make_key(content: str, summarizer) -> str:
+        """정규화한 본문과 요약기 설정으로 캐시 키 생성"""
+        normalized = WHITESPACE_PATTERN.sub(' ', content).strip()
+        params = f"{summarizer.max_length}|{summarizer.mode}|{summarizer.VERSION}"
+        if summarizer.mode != 'keyword':
+            params += f"|{summarizer.corpus_stats.fingerprint()}"
+        return hashlib.sha256(f"{params}\n{normalized}".encode('utf-8')).hexdigest()
+
+    def summarize(self, content: str, summarizer) -> str:
+        """캐시에 있으면 저장된 요약, 없으면 요약 후 저장"""
+        key = self.make_key(content, summarizer)
+
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        summary = summarizer.summarize(content)
+        elapsed = time.perf_counter() - started
+        self._put(key, summary, elapsed)
+        return summary
+
+    def lookup(self, content: str, summarizer) -> Optional[str]:
+        """저장된 요약 조회 (없으면 None, 미스로 집계), 요약은 다른 프로세스에서 계산할 때 사용"""
+        return self._get(self.make_key(content, summarizer))
+
+    def add(self, content: str, summarizer, summary: str, compute_seconds: float) -> str:
+        """
+        lookup()에서 찾지 못해 다른 프로세스(parse_pool 작업자)에서 계산한 요약 저장, 저장된 요약 반환
+        - 미스는 lookup()에서 집계했으므로 다시 세지 않음
+        """
+        self._put(self.make_key(content, summarizer), summary, compute_seconds)
+        return summary
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                self.time_saved += entry[1]
+                return entry[0]
+
+            if self.conn is not None:
+                row = self.conn.execute(
+                    "SELECT summary, compute_seconds FROM summaries WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    with self.conn:
+                        self.conn.execute(
+                            "UPDATE summaries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                        )
+                    self._remember(key, row[0], row[1])
+                    self.disk_hits += 1
+                    self.time_saved += row[1]
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def _put(self, key: str, summary: str, compute_seconds: float):
+        with self._lock:
+            self._remember(key, summary, compute_seconds)
+            if self.conn is None:
+                return
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO summaries (key, summary, compute_seconds, size, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, summary, compute_seconds, len(summary.encode('utf-8')), time.time())
+                )
+            self._evict()
+
+    def _remember(self, key: str, summary: str, compute_seconds: float):
+        self._memory[key] = (summary, compute_seconds)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """디스크 총 크기가 상한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute(
+            "SELECT key, size FROM summaries ORDER BY accessed_at"
+        ).fetchall()
+        expired = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        with self.conn:
+            self.conn.executemany("DELETE FROM summaries WHERE key = ?", expired)
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def stats(self) -> Dict:
+        """적중/미스 통계"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'time_saved_seconds': round(self.time_saved, 4),
+        }
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
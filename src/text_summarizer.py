@@ -2,11 +2,74 @@
 텍스트 요약기 - 외부 API 없이 간단한 추출 요약
 """
 import re
-from typing import Optional
+import logging
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# NumPy가 없어 키워드 요약으로 대체한다는 경고는 프로세스당 한 번만
+_fallback_warned = False
+
+# 전처리/문장 분할 패턴 (모듈 로드 시 한 번만 컴파일)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+BULLET_PATTERN = re.compile(r'[■●○▶▷◆◇★☆]')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]\s+|(?<=[다음양함임됨니다])\s+')
+
+# 중요 문장 키워드 (패턴마다 문장당 2점)
+# 앞의 두 날짜 패턴은 숫자가 있어야만 매치되므로 숫자 검사 뒤에만 확인
+IMPORTANT_KEYWORDS = [
+    # 날짜/기간 관련
+    r'\d{4}[\-\.]\d{1,2}[\-\.]\d{1,2}',  # 날짜
+    r'\d{1,2}월\s*\d{1,2}일',  # 한국식 날짜
+    r'접수기간|마감|신청|모집',
+    
+    # 중요 정보
+    r'지원자격|모집인원|선발기준',
+    r'합격|발표|결과',
+    r'제출|준비|구비',
+    r'입영|훈련|복무',
+    
+    # 주의사항
+    r'유의|주의|반드시|필수',
+    r'제외|불가|금지'
+]
+
+# 요약 방식
+# - keyword: 고정 키워드 가중치 (앞 20문장)
+# - tfidf / textrank: 코퍼스 통계 기반 문장 순위 (전체 문장, NumPy 필요)
+SUMMARY_MODES = ('keyword', 'tfidf', 'textrank')
 
 class SimpleTextSummarizer:
-    def __init__(self, max_length: int = 300):
+    # 요약 결과가 바뀌는 수정을 하면 올려서 요약 캐시를 무효화
+    VERSION = '1'
+    
+    def __init__(self, max_length: int = 300, mode: str = 'keyword', corpus_stats=None):
+        if mode not in SUMMARY_MODES:
+            raise ValueError(f"지원하지 않는 요약 방식입니다: {mode}")
         self.max_length = max_length
+        self.mode = mode
+        
+        # 코퍼스 기반 순위는 NumPy가 필요하므로 해당 방식일 때만 로드
+        # (NumPy가 없으면 경고 후 키워드 방식으로 요약, 요약 캐시 키도 키워드 방식 기준)
+        self._ranker = None
+        self.corpus_stats = corpus_stats
+        if mode != 'keyword':
+            from corpus_ranker import CorpusStats, SentenceRanker
+            self.corpus_stats = corpus_stats or CorpusStats(path=None)
+            try:
+                self._ranker = SentenceRanker(self.corpus_stats, method=mode)
+            except ImportError as e:
+                global _fallback_warned
+                if not _fallback_warned:
+                    logger.warning(f"⚠️  {e} - {mode} 대신 키워드 요약을 사용합니다.")
+                    _fallback_warned = True
+                self.mode = 'keyword'
+        
+        # 키워드 패턴은 생성 시 한 번만 컴파일
+        compiled = [re.compile(keyword) for keyword in IMPORTANT_KEYWORDS]
+        self._date_patterns = compiled[:2]
+        self._keyword_patterns = compiled[2:]
+        self._digit_pattern = re.compile(r'\d')
     
     def summarize(self, text: str) -> str:
         """
@@ -27,72 +90,78 @@ class SimpleTextSummarizer:
             return text[:self.max_length] + "..." if len(text) > self.max_length else text
         
         # 중요한 문장 추출
-        important_sentences = self._extract_important_sentences(sentences)
+        if self._ranker is not None:
+            important_sentences = self._rank_sentences(sentences)
+        else:
+            important_sentences = self._extract_important_sentences(sentences)
         
         # 요약문 생성
         summary = self._build_summary(important_sentences)
         
         return summary
     
+    def summarize_many(self, texts: Iterable[Optional[str]]) -> List[str]:
+        """
+        여러 게시글 일괄 요약 (백필 등 대량 처리용)
+        - 컴파일된 패턴을 재사용하며 입력 순서대로 결과 반환
+        """
+        summarize = self.summarize
+        return [summarize(text) for text in texts]
+    
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
         # 연속된 공백, 탭, 줄바꿈 정리
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         # 특수 문자 정리
-        text = re.sub(r'[■●○▶▷◆◇★☆]', '', text)
+        text = BULLET_PATTERN.sub('', text)
         return text.strip()
     
     def _split_sentences(self, text: str) -> list:
         """문장 단위로 분할"""
         # 한국어 문장 구분
-        sentences = re.split(r'[.!?]\s+|(?<=[다음양함임됨니다])\s+', text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         return [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
     
-    def _extract_important_sentences(self, sentences: list) -> list:
-        """중요한 문장 추출"""
-        important_keywords = [
-            # 날짜/기간 관련
-            r'\d{4}[\-\.]\d{1,2}[\-\.]\d{1,2}',  # 날짜
-            r'\d{1,2}월\s*\d{1,2}일',  # 한국식 날짜
-            r'접수기간|마감|신청|모집',
-            
-            # 중요 정보
-            r'지원자격|모집인원|선발기준',
-            r'합격|발표|결과',
-            r'제출|준비|구비',
-            r'입영|훈련|복무',
-            
-            # 주의사항
-            r'유의|주의|반드시|필수',
-            r'제외|불가|금지'
-        ]
+    def _score_sentence(self, sentence: str) -> int:
+        """문장 점수 계산"""
+        # 키워드 점수 계산
+        score = 0
+        for pattern in self._keyword_patterns:
+            if pattern.search(sentence):
+                score += 2
         
-        scored_sentences = []
+        # 문장 길이 보정 (너무 짧거나 긴 문장 페널티)
+        if 20 <= len(sentence) <= 100:
+            score += 1
+        elif len(sentence) > 200:
+            score -= 1
         
-        for sentence in sentences[:20]:  # 처음 20개 문장만 분석
-            score = 0
-            
-            # 키워드 점수 계산
-            for keyword_pattern in important_keywords:
-                if re.search(keyword_pattern, sentence):
+        # 숫자 포함 문장 우대 (날짜, 인원수 등), 날짜 키워드는 숫자가 있을 때만 검사
+        if self._digit_pattern.search(sentence):
+            score += 1
+            for pattern in self._date_patterns:
+                if pattern.search(sentence):
                     score += 2
-            
-            # 문장 길이 보정 (너무 짧거나 긴 문장 페널티)
-            if 20 <= len(sentence) <= 100:
-                score += 1
-            elif len(sentence) > 200:
-                score -= 1
-            
-            # 숫자 포함 문장 우대 (날짜, 인원수 등)
-            if re.search(r'\d+', sentence):
-                score += 1
-            
-            scored_sentences.append((sentence, score))
+        
+        return score
+    
+    def _extract_important_sentences(self, sentences: list) -> list:
+        """중요한 문장 추출"""
+        # 처음 20개 문장만 분석
+        scored_sentences = [
+            (sentence, self._score_sentence(sentence)) for sentence in sentences[:20]
+        ]
         
         # 점수순 정렬하여 상위 문장 선택
         scored_sentences.sort(key=lambda x: x[1], reverse=True)
         return [sentence for sentence, score in scored_sentences[:5] if score > 0]
     
+    def _rank_sentences(self, sentences: list) -> list:
+        """코퍼스 기반 점수 상위 5문장을 원문 순서대로 반환"""
+        scores = self._ranker.rank(sentences)
+        top = sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True)[:5]
+        return [sentences[i] for i in sorted(top) if scores[i] > 0]
+    
     def _build_summary(self, sentences: list) -> str:
         """요약문 구성"""
         if not sentences:
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+첨부파일 다운로드 테스트 (가짜 fetch, 네트워크 없음)
+- 같은 내용의 파일은 URL이 달라도 objects/에 한 번만 저장
+- 같은 강한 ETag와 크기의 파일이 있으면 본문을 받지 않음
+- 이미 받은 URL은 요청하지 않음
+"""
+import io
+import os
+import hashlib
+
+import pytest
+import requests
+
+from attachments import AttachmentDownloader, AttachmentStore
+
+PDF = b'%PDF-1.4 ' + '2027년도 모집계획 붙임 서식'.encode('utf-8') * 200
+
+class FakeFetch:
+    """url별 (본문, ETag, 파일 이름)을 stream 응답으로 consume에 넘기는 크롤러 _fetch 대역"""
+
+    def __init__(self, files):
+        self.files = files
+        self.requested = []
+        self.bytes_read = 0
+
+    def __call__(self, url, stage='attachment', consume=None, headers=None):
+        self.requested.append(url)
+        body, etag, name = self.files[url]
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.headers['Content-Length'] = str(len(body))
+        response.headers['Content-Disposition'] = f"attachment; filename*=UTF-8''{requests.utils.quote(name)}"
+        if etag:
+            response.headers['ETag'] = etag
+        response.raw = io.BytesIO(body)
+        self.bytes_read += consume(response)
+        return response
+
+@pytest.fixture
+def store(tmp_path):
+    store = AttachmentStore(str(tmp_path / 'attachments'))
+    yield store
+    store.close()
+
+def make_downloader(store, files):
+    events = []
+    fetch = FakeFetch(files)
+    return AttachmentDownloader(store, fetch, max_workers=1, on_event=events.append), fetch, events
+
+def objects(store):
+    return [name for _, _, names in os.walk(store.objects_dir) for name in names]
+
+def test_same_content_stored_once(store):
+    # 다른 게시글에 같은 서식 파일이 다른 URL, 다른 ETag로 붙어 있는 경우
+    downloader, fetch, events = make_downloader(store, {
+        'https://www.mma.go.kr/download.do?gsgeul_no=1': (PDF, '"a"', '지원서.pdf'),
+        'https://www.mma.go.kr/download.do?gsgeul_no=2': (PDF, '"b"', '지원서(재공지).pdf'),
+    })
+    first = downloader.download('https://www.mma.go.kr/download.do?gsgeul_no=1')
+    second = downloader.download('https://www.mma.go.kr/download.do?gsgeul_no=2')
+
+    sha256 = hashlib.sha256(PDF).hexdigest()
+    assert first['sha256'] == second['sha256'] == sha256
+    assert first['path'] == second['path'] == store.object_path(sha256)
+    assert (first['name'], second['name']) == ('지원서.pdf', '지원서(재공지).pdf')
+    assert events == ['downloaded', 'deduplicated']
+    assert objects(store) == [sha256]
+    with open(first['path'], 'rb') as f:
+        assert f.read() == PDF
+    # 임시 파일은 남지 않음
+    assert os.listdir(store.partial_dir) == []
+
+def test_same_etag_skips_body(store):
+    downloader, fetch, events = make_downloader(store, {
+        'https://www.mma.go.kr/download.do?gsgeul_no=1': (PDF, '"same"', '지원서.pdf'),
+        'https://www.mma.go.kr/download.do?gsgeul_no=2': (PDF, '"same"', '지원서.pdf'),
+    })
+    downloader.download('https://www.mma.go.kr/download.do?gsgeul_no=1')
+    info = downloader.download('https://www.mma.go.kr/download.do?gsgeul_no=2')
+
+    assert fetch.bytes_read == len(PDF)
+    assert events == ['downloaded', 'deduplicated']
+    assert info['sha256'] == hashlib.sha256(PDF).hexdigest()
+    assert store.by_url('https://www.mma.go.kr/download.do?gsgeul_no=2')['sha256'] == info['sha256']
+
+def test_weak_etag_downloads_again(store):
+    downloader, fetch, events = make_downloader(store, {
+        'https://www.mma.go.kr/download.do?gsgeul_no=1': (PDF, 'W/"same"', '지원서.pdf'),
+        'https://www.mma.go.kr/download.do?gsgeul_no=2': (PDF, 'W/"same"', '지원서.pdf'),
+    })
+    downloader.download('https://www.mma.go.kr/download.do?gsgeul_no=1')
+    downloader.download('https://www.mma.go.kr/download.do?gsgeul_no=2')
+
+    # 약한 ETag는 내용이 같다는 보장이 없어 받은 뒤 해시로 중복 확인
+    assert fetch.bytes_read == 2 * len(PDF)
+    assert events == ['downloaded', 'deduplicated']
+    assert len(objects(store)) == 1
+
+def test_known_url_is_not_requested(store):
+    url = 'https://www.mma.go.kr/download.do?gsgeul_no=1'
+    downloader, fetch, events = make_downloader(store, {url: (PDF, '"a"', '지원서.pdf')})
+    attachments = [{'url': url, 'name': '지원서.pdf'}, {'url': url, 'name': '지원서.pdf'}]
+    downloader.download_all(attachments)
+    downloader.download(url)
+
+    assert fetch.requested == [url]
+    assert events == ['downloaded', 'cached']
+    assert attachments[0]['sha256'] == attachments[1]['sha256'] == hashlib.sha256(PDF).hexdigest()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+백필 조회 테스트 (대체 서버의 합성 게시글, 하루 3건)
+- 목록 순회는 cutoff 이전 게시글이나 빈 페이지를 만나면 중단
+- 목록 요청/파싱 시간은 fetch_list/parse_list 단계로 기록
+- BACKFILL_SINCE(YYYY-MM-DD) 이후 게시글만 발송하고 처리 이력에 기록
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from replay_server import ReplayServer
+
+def list_pages(crawler):
+    """요청한 목록 페이지 번호를 기록하도록 _fetch 감싸기"""
+    requested = []
+    fetch = crawler._fetch
+
+    def recording_fetch(url, *args, **kwargs):
+        if 'boardList.do' in url:
+            requested.append(int(url.split('pageIndex=')[1]) if 'pageIndex=' in url else 1)
+        return fetch(url, *args, **kwargs)
+
+    crawler._fetch = recording_fetch
+    return requested
+
+def make_crawler(server):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    crawler = MMABoardCrawler(use_cache=False, base_url=server.base_url)
+    crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+    return crawler
+
+def test_stops_at_cutoff_date(crawler_env):
+    cutoff = date.today() - timedelta(days=4)
+    with ReplayServer(fixture_dir=None, synthetic_posts=60) as server:
+        crawler = make_crawler(server)
+        requested = list_pages(crawler)
+        posts = crawler.get_posts_since(cutoff, max_pages=10)
+
+    # 오늘부터 4일 전까지 5일 x 3건
+    assert len(posts) == 15
+    assert all(post['post_date'] >= cutoff for post in posts)
+    assert [post['post_id'] for post in posts] == list(range(1_600_000, 1_600_000 - 15, -1))
+    # 2페이지에서 cutoff에 도달 (3페이지는 미리 요청만 하고 파싱하지 않음)
+    assert max(requested) <= 3
+
+def test_stops_at_empty_page(crawler_env):
+    with ReplayServer(fixture_dir=None, synthetic_posts=25) as server:
+        crawler = make_crawler(server)
+        requested = list_pages(crawler)
+        posts = crawler.get_posts_since(date(2000, 1, 1), max_pages=10)
+
+    assert len(posts) == 25
+    # 4페이지가 빈 목록이라 중단 (5페이지는 미리 요청만 함)
+    assert 4 in requested
+    assert max(requested) <= 5
+
+def test_stops_at_max_pages(crawler_env):
+    with ReplayServer(fixture_dir=None, synthetic_posts=100) as server:
+        crawler = make_crawler(server)
+        requested = list_pages(crawler)
+        posts = crawler.get_posts_since(date(2000, 1, 1), max_pages=2)
+
+    assert len(posts) == 20
+    assert sorted(set(requested)) == [1, 2]
+    # 목록 요청과 파싱 시간은 목록 단계로 기록
+    stages = crawler.metrics.stages
+    assert stages['fetch_list'].count == 2
+    assert stages['parse_list'].count == 2
+    assert 'fetch_detail' not in stages
+
+def test_run_uses_backfill_since(mailbox, monkeypatch):
+    since = date.today() - timedelta(days=1)
+    monkeypatch.setenv('BACKFILL_SINCE', since.isoformat())
+    with ReplayServer(fixture_dir=None, synthetic_posts=30) as server:
+        crawler = make_crawler(server)
+        crawler.run()
+
+    assert crawler.metrics.info['mode'] == 'backfill'
+    assert len(mailbox.messages) == 1
+    assert '6건' in mailbox.subjects[0]
+    # 백필 발송도 처리 이력에 기록 (다음 자동 실행에서 다시 보내지 않음)
+    assert all(crawler.store.is_notified(1_600_000 - index) for index in range(6))
+    assert not crawler.store.is_notified(1_600_000 - 6)
+
+@pytest.mark.parametrize('value', ['2024/01/01', '20240101', 'yesterday'])
+def test_invalid_backfill_since_fails_before_requests(mailbox, monkeypatch, value):
+    monkeypatch.setenv('BACKFILL_SINCE', value)
+    with ReplayServer(fixture_dir=None, synthetic_posts=30) as server:
+        crawler = make_crawler(server)
+        with pytest.raises(ValueError):
+            crawler.run()
+
+    assert server.stats.get('requests', 0) == 0
+    assert mailbox.messages == []
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+게시판 목록 파서 테스트
+- fixtures/mma/list/69/1.html (boardList.do 1페이지, replay_server.py capture와 같은 위치)
+"""
+import os
+from datetime import date
+
+from board_parser import latest_post_id, parse_board
+from replay_server import DEFAULT_FIXTURE_DIR, ReplayServer
+
+LIST_PATH = os.path.join(DEFAULT_FIXTURE_DIR, 'list', '69', '1.html')
+
+def load_list_page() -> str:
+    with open(LIST_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def test_parses_post_id_title_and_date():
+    rows = parse_board(load_list_page())
+
+    assert len(rows) == 10
+    first = rows[0]
+    assert first.post_id == 1520541
+    assert first.title == '2027년도 1월 입영 육군 기술행정병 모집계획 공고'
+    assert first.date == '2026-10-16'
+    assert first.post_date == date(2026, 10, 16)
+    assert first.has_attachment
+    assert first.views == 3412
+
+    third = rows[2]
+    assert (third.post_id, third.title, third.post_date) == (
+        1520538, '육군 어학병(영어·중국어) 어학성적 제출기한 변경 안내', date(2026, 10, 15)
+    )
+    assert not third.has_attachment
+    # 목록은 최신 게시글부터
+    assert [row.post_id for row in rows] == sorted((row.post_id for row in rows), reverse=True)
+
+def test_skips_navigation_and_paging_links():
+    html = load_list_page()
+    rows = parse_board(html)
+    assert all('boardView.do' in row.url for row in rows)
+    assert latest_post_id(html) == 1520541
+
+def test_crawler_builds_detail_urls(crawler_env):
+    from crawler import MMABoardCrawler
+
+    with ReplayServer(synthetic_posts=0) as server:
+        crawler = MMABoardCrawler(use_cache=False, base_url=server.base_url)
+        posts = crawler.get_latest_posts(2)
+
+    assert [post['post_id'] for post in posts] == [1520541, 1520540]
+    assert posts[0]['url'].startswith(server.base_url + '/board/boardView.do?gesipan_id=69&gsgeul_no=1520541')
+    assert posts[1]['date'] == '2026-10-16'
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+본문 추출기 테스트
+- 기억한 선택자가 맞으면 후보 채점 없이 추출
+- 선택자가 사라졌거나 본문이 너무 짧으면 전체 채점으로 다시 찾고 새 선택자 기억
+"""
+import pytest
+from bs4 import BeautifulSoup
+
+from content_extractor import ContentExtractor
+from replay_server import SyntheticBoard
+
+BOARD = SyntheticBoard('69', 10)
+
+def view_page(index: int = 0) -> str:
+    return BOARD.view_page(BOARD.start_id - index)
+
+def learned_extractor(tmp_path) -> ContentExtractor:
+    extractor = ContentExtractor(hints_path=str(tmp_path / 'hints.json'))
+    result = extractor.extract(view_page(), board_key='69')
+    assert result.method == 'scan'
+    assert extractor.hints['69'] == 'td.bbs_content'
+    return extractor
+
+def test_hint_path_skips_scoring(tmp_path, monkeypatch):
+    extractor = learned_extractor(tmp_path)
+    scan = extractor.extract(view_page(1), board_key='other')
+
+    def fail(soup):
+        raise AssertionError("기억한 선택자가 맞는데 후보를 채점함")
+
+    monkeypatch.setattr(extractor, '_score_candidates', fail)
+    result = extractor.extract(view_page(1), board_key='69')
+
+    assert result.method == 'hint'
+    assert result.selector == 'td.bbs_content'
+    assert result.text == scan.text
+    # 신뢰도는 채점 경로와 같은 기준(링크, script 제외 텍스트)으로 계산
+    assert result.confidence == scan.confidence
+
+def test_stale_hint_falls_back_to_scan(tmp_path):
+    extractor = learned_extractor(tmp_path)
+    # 사이트 개편: 본문 칸의 class가 바뀜
+    html = view_page(2).replace('class="bbs_content"', 'class="view_cont"')
+
+    result = extractor.extract(html, board_key='69')
+
+    assert result.method == 'scan'
+    assert result.selector == 'td.view_cont'
+    assert extractor.hints['69'] == 'td.view_cont'
+    # 다음 추출부터는 새 선택자 사용
+    assert extractor.extract(html, board_key='69').method == 'hint'
+    # 파일에도 기록되어 다음 실행에서 사용
+    assert ContentExtractor(hints_path=extractor.hints_path).hints['69'] == 'td.view_cont'
+
+def test_short_hint_result_falls_back_to_scan(tmp_path):
+    extractor = learned_extractor(tmp_path)
+    # 기억한 선택자가 본문이 아닌 짧은 칸을 가리키게 된 경우
+    soup = BeautifulSoup(view_page(3), 'html.parser')
+    soup.select_one('td.bbs_content')['class'] = ['bbs_body']
+    soup.find('div', id='footer').append(soup.new_tag('div', attrs={'class': 'bbs_content'}))
+    soup.select_one('div.bbs_content').string = '짧은 안내'
+
+    result = extractor.extract_from_soup(soup, board_key='69')
+
+    assert result.method == 'scan'
+    assert result.selector == 'td.bbs_body'
+    assert len(result.text) >= extractor.min_length
+
+@pytest.mark.parametrize('html', ['', '<html><body><p>짧은 글</p></body></html>'])
+def test_no_content_returns_none(tmp_path, html):
+    extractor = learned_extractor(tmp_path)
+    assert extractor.extract(html, board_key='69') is None
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+코퍼스 기반 요약(tfidf/textrank) 테스트
+- 고정된 작은 코퍼스로 IDF, 문장 점수, 요약 결과를 확인
+- NumPy가 없으면 경고 후 키워드 요약으로 대체되는지 확인
+"""
+import logging
+
+import pytest
+
+from corpus_ranker import CorpusStats, SentenceRanker, tokenize
+from text_summarizer import SimpleTextSummarizer
+
+CORPUS = [
+    "육군 기술행정병 모집계획을 공고합니다. 지원서 접수는 병무청 누리집에서 합니다.",
+    "해군 일반병 모집계획을 공고합니다. 접수 기간을 확인하시기 바랍니다.",
+    "공군 전문특기병 모집 결과를 안내합니다. 합격자는 입영 일자를 확인하시기 바랍니다.",
+    "사회복무요원 소집 일정을 안내합니다. 복무기관은 추후 통보합니다.",
+]
+
+SENTENCES = [
+    "병무청 누리집에서 확인하시기 바랍니다.",
+    "드론 운용 특기병은 자격증 소지자를 우대합니다.",
+    "모집계획을 공고합니다.",
+]
+
+TEXT = (
+    "2027년도 육군 드론 운용 특기병 모집계획을 공고합니다. 지원 자격은 드론 관련 자격증 소지자입니다. "
+    "접수 기간은 2026년 11월 2일부터 11월 13일까지입니다. 병무청 누리집에서 확인하시기 바랍니다. "
+    "드론 운용 특기병 합격자는 2027년 1월에 입영합니다."
+)
+
+CORPUS_SUMMARY = '2027년도 육군 드론 운용 특기병 모집계획을 공고합니다 지원 자격은 드론 관련 자격증 소지자입니다'
+KEYWORD_SUMMARY = '드론 운용 특기병 합격자는 2027년 1월에 입영합니다. 2027년도 육군 드론 운용 특기병 모집계획을 공고합니다'
+
+@pytest.fixture
+def stats():
+    stats = CorpusStats(path=None)
+    stats.add_documents(CORPUS)
+    stats.save()
+    return stats
+
+def test_tokenize_uses_hangul_bigrams():
+    assert tokenize("모집계획 공고 2027 MMA 병") == ['모집', '집계', '계획', '공고', '2027', 'mma']
+
+def test_idf_from_fixed_corpus(stats):
+    assert stats.doc_count == 4
+    assert stats.df['모집'] == 3
+    assert stats.idf['모집'] == pytest.approx(1.2231, abs=1e-4)
+    # 코퍼스에 없는 토큰은 가장 희귀한 토큰과 같은 IDF
+    assert '드론' not in stats.idf
+    assert stats.default_idf() == pytest.approx(2.6094, abs=1e-4)
+
+def test_stats_round_trip(tmp_path):
+    path = str(tmp_path / 'corpus_stats.json')
+    stats = CorpusStats(path)
+    stats.add_documents(CORPUS)
+    stats.save()
+
+    loaded = CorpusStats(path)
+    assert loaded.doc_count == stats.doc_count
+    assert loaded.df == stats.df
+    assert loaded.idf == pytest.approx(stats.idf)
+
+@pytest.mark.parametrize('method, expected', [
+    ('tfidf', [0.5896, 0.5992, 0.6123]),
+    ('textrank', [0.2625, 0.3243, 0.4132]),
+])
+def test_rank_fixed_sentences(stats, method, expected):
+    scores = SentenceRanker(stats, method=method).rank(SENTENCES)
+    assert list(scores) == pytest.approx(expected, abs=1e-4)
+
+@pytest.mark.parametrize('mode', ['tfidf', 'textrank'])
+def test_corpus_summary_golden(stats, mode):
+    summarizer = SimpleTextSummarizer(max_length=80, mode=mode, corpus_stats=stats)
+    assert summarizer.summarize(TEXT) == CORPUS_SUMMARY
+
+def test_falls_back_to_keyword_without_numpy(stats, monkeypatch, caplog):
+    import corpus_ranker
+    import text_summarizer
+
+    monkeypatch.setattr(corpus_ranker, 'np', None)
+    monkeypatch.setattr(text_summarizer, '_fallback_warned', False)
+    with caplog.at_level(logging.WARNING, logger='text_summarizer'):
+        summarizer = SimpleTextSummarizer(max_length=80, mode='textrank', corpus_stats=stats)
+        SimpleTextSummarizer(max_length=80, mode='tfidf', corpus_stats=stats)
+
+    assert summarizer.mode == 'keyword'
+    # 경고는 한 번만
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
+    assert 'NumPy' in caplog.text
+    assert summarizer.summarize(TEXT) == KEYWORD_SUMMARY
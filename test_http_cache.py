@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+조건부 요청 디스크 캐시 테스트 (가짜 원 서버 어댑터, 네트워크 없음)
+- 200 응답 저장 → 다음 요청에 검증자 전송 → 304면 저장된 본문으로 응답 구성
+- 총 크기 상한을 넘으면 오래 사용하지 않은 항목부터 삭제, 보관 기간이 지나면 삭제
+- 304인데 본문 파일이 없으면 조건부 헤더 없이 다시 요청
+- stream=True로 받은 상세 페이지도 저장해 다음 실행에서 304, 첨부파일은 저장하지 않음 (대체 서버)
+"""
+import io
+import os
+import json
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import CachingAdapter, HTTPCache
+
+URL = 'https://www.mma.go.kr/board/boardList.do?gesipan_id=69'
+
+class OriginStub(HTTPAdapter):
+    """
+    원 서버 대역: pages[url] = (본문, ETag)
+    - If-None-Match가 현재 ETag와 같으면 304
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.pages = {}
+        self.requests = []
+
+    def send(self, request, stream=False, **kwargs):
+        self.requests.append(dict(request.headers))
+        body, etag = self.pages[request.url]
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        if etag:
+            response.headers['ETag'] = etag
+        if etag and request.headers.get('If-None-Match') == etag:
+            response.status_code = 304
+            response._content = b''
+        else:
+            response.status_code = 200
+            response.headers['Content-Type'] = 'text/html;charset=UTF-8'
+            response._content = body
+        response._content_consumed = True
+        return response
+
+class StubCachingAdapter(CachingAdapter, OriginStub):
+    """CachingAdapter의 super().send()가 원 서버 대역으로 가도록 연결"""
+
+def make_session(cache):
+    adapter = StubCachingAdapter(cache)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session, adapter
+
+def test_200_store_304_rebuild(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    session, origin = make_session(cache)
+    origin.pages[URL] = ('<html>공지 목록</html>'.encode('utf-8'), '"v1"')
+
+    first = session.get(URL)
+    assert first.status_code == 200 and not first.from_cache
+    assert 'If-None-Match' not in origin.requests[0]
+    validated_at = cache.lookup(URL)['validated_at']
+
+    second = session.get(URL)
+    assert origin.requests[1]['If-None-Match'] == '"v1"'
+    assert second.status_code == 200
+    assert second.from_cache
+    assert second.text == '<html>공지 목록</html>'
+    assert second.headers['Content-Type'] == 'text/html;charset=UTF-8'
+    # 304로 재검증하면 검증 시각 갱신
+    assert cache.lookup(URL)['validated_at'] >= validated_at
+
+def test_changed_page_replaces_entry(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    session, origin = make_session(cache)
+    origin.pages[URL] = (b'old', '"v1"')
+    session.get(URL)
+
+    origin.pages[URL] = (b'new', '"v2"')
+    changed = session.get(URL)
+    assert not changed.from_cache and changed.content == b'new'
+    assert cache.lookup(URL)['etag'] == '"v2"'
+    assert session.get(URL).from_cache
+
+def test_response_without_validator_is_not_stored(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    session, origin = make_session(cache)
+    origin.pages[URL] = (b'no validator', None)
+    session.get(URL)
+    assert cache.lookup(URL) is None
+    assert 'If-None-Match' not in origin.requests[-1]
+
+def test_missing_body_refetches_without_validators(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    session, origin = make_session(cache)
+    origin.pages[URL] = (b'body', '"v1"')
+    session.get(URL)
+    # 메타데이터만 남고 본문 파일이 사라진 경우
+    os.remove(cache._paths(URL)[1])
+
+    response = session.get(URL)
+    assert response.status_code == 200
+    assert response.content == b'body'
+    assert not response.from_cache
+    assert origin.requests[-2]['If-None-Match'] == '"v1"'
+    assert 'If-None-Match' not in origin.requests[-1]
+    # 다시 받은 본문을 저장해 다음 요청은 304
+    assert cache.load_body(URL) == b'body'
+    assert session.get(URL).from_cache
+
+def set_used_at(cache, url, seconds_ago):
+    meta_path, _ = cache._paths(url)
+    used_at = time.time() - seconds_ago
+    os.utime(meta_path, (used_at, used_at))
+
+def test_evicts_least_recently_used_over_size_limit(tmp_path):
+    cache = HTTPCache(str(tmp_path), max_bytes=2500)
+    session, origin = make_session(cache)
+    first, second, third = (f'{URL}&pageIndex={page}' for page in range(1, 4))
+    for url, seconds_ago in ((first, 300), (second, 200)):
+        origin.pages[url] = (b'x' * 1000, f'"{url}"')
+        session.get(url)
+        set_used_at(cache, url, seconds_ago)
+
+    # 가장 오래된 1페이지를 다시 사용 → 2페이지가 가장 오래 사용하지 않은 항목
+    cache.load_body(first)
+    origin.pages[third] = (b'x' * 1000, '"p3"')
+    session.get(third)
+
+    assert cache.lookup(first) is not None
+    assert cache.lookup(second) is None
+    assert cache.lookup(third) is not None
+
+def test_expired_entry_is_dropped(tmp_path):
+    cache = HTTPCache(str(tmp_path), max_age=60)
+    session, origin = make_session(cache)
+    origin.pages[URL] = (b'body', '"v1"')
+    session.get(URL)
+    meta_path, body_path = cache._paths(URL)
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    meta['validated_at'] = time.time() - 120
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    assert cache.lookup(URL) is None
+    assert not os.path.exists(body_path)
+    # 만료되었으므로 조건부 요청 없이 다시 받음
+    assert not session.get(URL).from_cache
+    assert 'If-None-Match' not in origin.requests[-1]
+
+def stream_response(url: str, body: bytes, etag: str = '"v1"') -> requests.Response:
+    """아직 읽지 않은 stream=True 응답 (raw에서 조금씩 읽음)"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.encoding = 'utf-8'
+    response.headers['ETag'] = etag
+    response.raw = io.BytesIO(body)
+    return response
+
+def test_stream_recorder_completes_partial_read(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    body = b''.join(b'<p>line %d</p>' % i for i in range(500))
+    response = stream_response(URL, body)
+    recorder = cache.record(response, max_bytes=len(body))
+
+    # 본문 영역만 읽고 멈추는 소비자
+    first = next(iter(response.iter_content(1024)))
+    assert recorder.finish(chunk_size=1024) == len(body) - len(first)
+    assert cache.load_body(URL) == body
+    assert cache.lookup(URL)['etag'] == '"v1"'
+
+def test_stream_recorder_skips_oversized_body(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    body = b'x' * 5000
+    response = stream_response(URL, body)
+    recorder = cache.record(response, max_bytes=2000)
+    for _ in response.iter_content(1024):
+        pass
+    recorder.finish(chunk_size=1024)
+    assert cache.lookup(URL) is None
+    # 상한을 넘은 뒤로는 조각을 모으지 않음
+    assert not recorder.storable
+    assert recorder.chunks == []
+    assert recorder.size == len(body)
+
+def test_attachment_is_not_cached(crawler_env):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+    from replay_server import ReplayServer
+
+    with ReplayServer(fixture_dir=None, synthetic_posts=10) as server:
+        crawler = MMABoardCrawler(base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        board = server.synthetic['69']
+        post_id = next(board.start_id - index for index in range(board.total)
+                       if board.attachment(board.start_id - index))
+        url = f'{server.base_url}/download.do?gesipan_id=69&gsgeul_no={post_id}&fileNo=1'
+        response = crawler._fetch(url, stage='attachment',
+                              consume=lambda response: sum(map(len, response.iter_content(1024))))
+
+    assert response.status_code == 200
+    assert crawler.http_cache.lookup(url) is None
+    assert os.listdir(crawler.http_cache.directory) == []
+
+def test_detail_page_revalidated_on_next_run(crawler_env):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+    from replay_server import ReplayServer
+
+    def make_crawler(server):
+        crawler = MMABoardCrawler(base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        return crawler
+
+    with ReplayServer(fixture_dir=None, synthetic_posts=5) as server:
+        first_run = make_crawler(server)
+        urls = [post['url'] for post in first_run.get_latest_posts(3)]
+        # 선택자를 모를 때는 전체 분석, 기억한 뒤에는 스트리밍 추출, 프로세스 풀 작업은 바이트로 받기
+        methods = [first_run.extract_post(urls[0]).method, first_run.extract_post(urls[1]).method]
+        job = first_run._fetch_detail_job({'url': urls[2], 'board_key': '69'})
+        assert methods[1] == 'stream'
+        before = server.stats.get('status_304', 0)
+
+        second_run = make_crawler(server)
+        texts = [second_run.extract_post(url).text for url in urls[:2]]
+        cached_job = second_run._fetch_detail_job({'url': urls[2], 'board_key': '69'})
+
+    assert server.stats['status_304'] - before == 3
+    assert all(texts)
+    assert cached_job.body == job.body
+    assert second_run.metrics.counters['http_cache_hits'] == 3
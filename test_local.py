@@ -12,7 +12,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def test_crawler():
     """크롤러 테스트 (이메일 발송 제외)"""
-    from crawler import MMABoardCrawler
+    from crawler import MMABoardCrawler, configure_logging
+    configure_logging()
     
     print("="*60)
     print("🧪 크롤러 로컬 테스트")
@@ -45,7 +45,8 @@ def test_manual_mode():
     # 수동 모드 설정
     os.environ['MANUAL_MODE'] = 'true'
     
-    from crawler import MMABoardCrawler
+    from crawler import MMABoardCrawler, configure_logging
+    configure_logging()
     
     try:
         print("\n🚀 크롤러 실행 중...")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+발송 보관함 테스트
+- 멱등 키: 수신자(대소문자 무관) + 게시글 목록(순서 무관), 수정 알림은 revision마다 다른 키
+- 발송 실패 시 지수 백오프, max_attempts번 실패하면 포기(dead)
+- 보관 기간이 지난 발송 완료/포기 메일 삭제
+- 백필 실행도 발송 대기 중인 게시글은 다시 넣지 않음
+"""
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from outbox import DEAD, PENDING, SENT, Outbox
+from replay_server import ReplayServer
+
+POSTS = [
+    {'url': 'https://www.mma.go.kr/board/boardView.do?gesipan_id=69&gsgeul_no=1', 'board_key': '69', 'post_id': 1},
+    {'url': 'https://www.mma.go.kr/board/boardView.do?gesipan_id=69&gsgeul_no=2', 'board_key': '69', 'post_id': 2},
+]
+
+@pytest.fixture
+def outbox(tmp_path):
+    outbox = Outbox(str(tmp_path / 'outbox.db'), base_delay=10, max_delay=60, max_attempts=4,
+                    retention=7 * 24 * 3600)
+    yield outbox
+    outbox.close()
+
+def enqueue(outbox, recipient='user@example.com', posts=POSTS):
+    return outbox.enqueue(recipient, '제목', '본문', '<p>본문</p>', posts)
+
+def status(outbox, key):
+    row = outbox.conn.execute("SELECT status, attempts, next_attempt_at FROM outbox WHERE key = ?",
+                              (key,)).fetchone()
+    return dict(row) if row else None
+
+def test_idempotency_key_dedup(outbox):
+    key = enqueue(outbox)
+    # 같은 수신자(대소문자 무관)와 같은 게시글(순서 무관)이면 같은 메일
+    assert enqueue(outbox, 'User@Example.com', POSTS[::-1]) == key
+    assert outbox.pending_count() == 1
+    assert enqueue(outbox, 'other@example.com') != key
+
+    outbox.mark_sent(key)
+    assert enqueue(outbox) is None
+    assert status(outbox, key)['status'] == SENT
+
+def test_revision_gets_new_key(outbox):
+    key = enqueue(outbox)
+    outbox.mark_sent(key)
+    revised = [dict(POSTS[0], revision='a1b2c3d4e5f60718')]
+    revision_key = enqueue(outbox, posts=revised)
+    assert revision_key not in (None, key)
+    assert enqueue(outbox, posts=[dict(POSTS[0], revision='ffffffffffffffff')]) != revision_key
+
+def test_backoff_schedule(outbox):
+    key = enqueue(outbox)
+    delays = []
+    for _ in range(3):
+        started = time.time()
+        outbox.mark_failed(key, 'SMTP 오류')
+        delays.append(status(outbox, key)['next_attempt_at'] - started)
+        # 다음 시도 시각 전에는 발송 대상이 아님
+        assert outbox.due() == []
+        assert len(outbox.due(now=time.time() + 60)) == 1
+
+    # 10초, 20초, 40초 (max_delay 60초 이하)
+    assert delays == pytest.approx([10, 20, 40], abs=1)
+    assert status(outbox, key)['status'] == PENDING
+
+def test_backoff_capped_at_max_delay(tmp_path):
+    outbox = Outbox(str(tmp_path / 'outbox.db'), base_delay=10, max_delay=15, max_attempts=10)
+    key = enqueue(outbox)
+    for _ in range(3):
+        started = time.time()
+        outbox.mark_failed(key, 'SMTP 오류')
+    assert status(outbox, key)['next_attempt_at'] - started == pytest.approx(15, abs=1)
+    outbox.close()
+
+def test_dead_after_max_attempts(outbox):
+    key = enqueue(outbox)
+    result = None
+    for _ in range(4):
+        result = outbox.drain(lambda message: False)
+        outbox.conn.execute("UPDATE outbox SET next_attempt_at = 0 WHERE key = ?", (key,))
+
+    assert result.failed == 1
+    assert status(outbox, key)['status'] == DEAD
+    assert outbox.due() == []
+    assert outbox.pending_count() == 0
+    assert outbox.queued_urls() == set()
+
+    # 포기한 메일을 다시 넣으면 처음부터 재시도
+    assert enqueue(outbox) == key
+    assert status(outbox, key)['status'] == PENDING
+    assert status(outbox, key)['attempts'] == 0
+
+def test_drain_reports_delivered_posts(outbox):
+    enqueue(outbox)
+    enqueue(outbox, 'other@example.com')
+    calls = []
+
+    def send(message):
+        calls.append(message['recipient'])
+        return message['recipient'] == 'user@example.com'
+
+    result = outbox.drain(send)
+    assert (result.sent, result.failed) == (1, 1)
+    # 다른 수신자에게 아직 보내지 못했으므로 처리 완료 게시글 없음
+    assert result.delivered == []
+    assert outbox.queued_urls() == {post['url'] for post in POSTS}
+
+def test_purge_removes_old_sent_and_dead(outbox):
+    sent_key = enqueue(outbox)
+    outbox.mark_sent(sent_key)
+    dead_key = enqueue(outbox, 'dead@example.com')
+    for _ in range(4):
+        outbox.mark_failed(dead_key, 'SMTP 오류')
+    pending_key = enqueue(outbox, 'pending@example.com')
+
+    # 보관 기간 안에서는 그대로
+    assert outbox.purge() == 0
+    assert outbox.purge(now=time.time() + 8 * 24 * 3600) == 2
+
+    assert status(outbox, sent_key) is None
+    assert status(outbox, dead_key) is None
+    assert status(outbox, pending_key)['status'] == PENDING
+    keys = {row[0] for row in outbox.conn.execute("SELECT DISTINCT key FROM outbox_posts")}
+    assert keys == {pending_key}
+
+def test_backfill_skips_queued_posts(crawler_env, mailbox, monkeypatch):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    monkeypatch.setenv('OUTBOX_PATH', str(crawler_env / 'outbox.db'))
+    monkeypatch.setenv('BACKFILL_SINCE', (date.today() - timedelta(days=1)).isoformat())
+    with ReplayServer(fixture_dir=None, synthetic_posts=30) as server:
+        crawler = MMABoardCrawler(use_cache=False, base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        # 이전 실행에서 발송에 실패해 재시도를 기다리는 최신 게시글 1건
+        latest = crawler.get_latest_posts(1)[0]
+        queued_url = latest['url']
+        key = crawler.outbox.enqueue('user@example.com', '이전 알림', '본문', '<p>본문</p>', [latest])
+        crawler.outbox.mark_failed(key, 'SMTP 오류')
+        crawler.run()
+
+    assert len(mailbox.messages) == 1
+    assert '5건' in mailbox.subjects[0]
+    assert queued_url not in mailbox.texts()[0]
+    assert crawler.metrics.counters['posts_skipped'] == 1
+    assert crawler.outbox.pending_count() == 1
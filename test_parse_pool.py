@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+본문 추출/요약 프로세스 풀 테스트 (spawn 작업자 2개)
+- 풀 결과는 한 프로세스에서 순서대로 처리한 결과와 같고 입력 순서를 유지
+- 크롤러도 PARSE_WORKERS=2일 때 순차 처리와 같은 본문, 요약, 첨부, 지문을 기록 (대체 서버)
+- 요약 캐시에 있는 본문은 작업자에 요약을 맡기지 않음
+"""
+from datetime import date, timedelta
+
+from attachments import ATTACHMENT_LINK_PATTERN
+from content_extractor import ContentExtractor
+from parse_pool import DetailJob, ParsePool, _init_worker, parse_detail, summarize_text
+from replay_server import ReplayServer, SyntheticBoard
+
+def result_fields(result):
+    # 소요 시간은 실행마다 달라 비교에서 제외
+    return result._replace(extract_seconds=0.0)
+
+def test_pool_matches_serial():
+    board = SyntheticBoard('69', 24)
+    pages = [board.view_page(board.start_id - index).encode('utf-8') for index in range(24)]
+    learner = ContentExtractor(hints_path=None)
+    learner.extract(pages[0].decode('utf-8'), board_key='69')
+    hints = dict(learner.hints)
+    jobs = [DetailJob(page, 'utf-8', '69', ATTACHMENT_LINK_PATTERN) for page in pages]
+    jobs.insert(5, DetailJob(b'', None, '69'))  # 요청 실패한 게시글
+
+    _init_worker(hints, 100, 300, 'keyword', None)
+    serial = [result_fields(parse_detail(job)) for job in jobs]
+    serial_summaries = [summarize_text(result.text)[0] for result in serial if result.text]
+    with ParsePool(2, chunksize=4, hints=hints) as pool:
+        pooled = [result_fields(result) for result in pool.map(jobs)]
+        futures = [pool.summarize(result.text) for result in pooled if result.text]
+        pooled_summaries = [future.result()[0] for future in futures]
+
+    assert pooled == serial
+    assert pooled[5].text is None
+    assert all(result.text for index, result in enumerate(pooled) if index != 5)
+    assert pooled_summaries == serial_summaries
+    assert all(pooled_summaries)
+
+def test_crawler_pool_matches_serial(crawler_env, monkeypatch):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    monkeypatch.setenv('PARSE_POOL_MIN_POSTS', '10')
+    monkeypatch.setenv('ATTACHMENT_DIR', str(crawler_env / 'attachments'))
+
+    def process(server, workers):
+        monkeypatch.setenv('PARSE_WORKERS', str(workers))
+        crawler = MMABoardCrawler(use_cache=False, base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        crawler.store = None
+        posts = crawler.get_posts_since(date.today() - timedelta(days=30), max_pages=3)
+        crawler.process_posts(posts)
+        return crawler, [
+            (post['post_id'], post['content'], post['summary'], post['fingerprint'],
+             [(item['name'], item.get('sha256')) for item in post.get('attachments', [])])
+            for post in posts
+        ]
+
+    with ReplayServer(fixture_dir=None, synthetic_posts=30) as server:
+        _, serial = process(server, 1)
+        pooled_crawler, pooled = process(server, 2)
+
+    assert len(serial) == 30
+    assert pooled == serial
+    assert 'parse_pool' in pooled_crawler.metrics.stages
+    assert any(attachments for *_, attachments in pooled)
+
+def test_pool_uses_summary_cache(crawler_env, monkeypatch):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    monkeypatch.setenv('PARSE_POOL_MIN_POSTS', '10')
+    monkeypatch.setenv('SUMMARY_CACHE_PATH', str(crawler_env / 'summary_cache.db'))
+
+    def process(server, workers):
+        monkeypatch.setenv('PARSE_WORKERS', str(workers))
+        crawler = MMABoardCrawler(use_cache=False, base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        crawler.store = None
+        posts = crawler.process_posts(crawler.get_posts_since(date.today() - timedelta(days=30), max_pages=2))
+        return crawler, [post['summary'] for post in posts]
+
+    with ReplayServer(fixture_dir=None, synthetic_posts=20) as server:
+        # 순차 처리로 요약 캐시를 채운 뒤 풀로 다시 처리
+        _, serial = process(server, 1)
+        pooled_crawler, pooled = process(server, 2)
+
+    assert pooled == serial
+    assert pooled_crawler.summary_cache.stats()['hits'] == 20
+    assert pooled_crawler.summary_cache.misses == 0
+    # 캐시에 있는 본문은 작업자에 요약을 맡기지 않음
+    assert 'parse_pool' in pooled_crawler.metrics.stages
+    assert 'summarize' not in pooled_crawler.metrics.stages
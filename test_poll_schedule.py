@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+상주 실행 폴링 간격 테스트 (jitter 0)
+- 새 게시글이 없으면 간격을 backoff배씩 늘리고(업무시간 idle, 업무시간 밖 max_interval까지)
+  새 게시글이 보이면 active 간격으로 줄임
+- 업무시간 밖에 길게 쉬어도 다음 업무 시작 시각은 넘기지 않음
+- 새 게시글 없는 조회가 수천 번 이어져도 최대 간격에서 멈춤
+- run_daemon은 조회마다 새 게시글 수를 간격 계산에 반영 (대체 서버)
+"""
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from poll_schedule import KST, PollSchedule
+from replay_server import ReplayServer
+
+# 2026-10-14(수) 한국시간
+BUSINESS = datetime(2026, 10, 14, 10, 0, tzinfo=KST)
+EVENING = datetime(2026, 10, 14, 20, 0, tzinfo=KST)
+
+def make_schedule(**kwargs) -> PollSchedule:
+    return PollSchedule(active=60, business=120, idle=900, max_interval=3600, backoff=1.5,
+                        active_window=1800, jitter=0, **kwargs)
+
+def test_business_hours_backs_off_to_idle():
+    schedule = make_schedule()
+    intervals = []
+    for _ in range(7):
+        intervals.append(schedule.next_interval(BUSINESS))
+        schedule.record(0, BUSINESS)
+    assert intervals == pytest.approx([120, 180, 270, 405, 607.5, 900, 900])
+
+def test_new_posts_shorten_interval():
+    schedule = make_schedule()
+    for _ in range(5):
+        schedule.record(0, BUSINESS)
+    assert schedule.next_interval(BUSINESS) == pytest.approx(900)
+
+    schedule.record(2, BUSINESS)
+    assert schedule.phase(BUSINESS) == 'active'
+    assert schedule.next_interval(BUSINESS) == 60
+    # 새 게시글이 없어도 active_window 동안은 active 간격
+    schedule.record(0, BUSINESS + timedelta(minutes=10))
+    assert schedule.next_interval(BUSINESS + timedelta(minutes=10)) == 60
+    # active_window가 지나면 업무시간 간격에서 다시 늘림
+    later = BUSINESS + timedelta(minutes=31)
+    assert schedule.phase(later) == 'business'
+    assert schedule.next_interval(later) == pytest.approx(180)
+
+def test_off_hours_backs_off_to_max_interval():
+    schedule = make_schedule()
+    intervals = []
+    for _ in range(5):
+        intervals.append(schedule.next_interval(EVENING))
+        schedule.record(0, EVENING)
+    assert intervals == pytest.approx([900, 1350, 2025, 3037.5, 3600])
+
+def test_long_idle_stays_capped():
+    schedule = make_schedule()
+    # 조용한 주말 내내 돌아도 간격 계산이 넘치지 않음 (1.5 ** 1800은 float 범위를 넘음)
+    for _ in range(5000):
+        schedule.record(0, EVENING)
+    assert schedule.next_interval(EVENING) == pytest.approx(3600)
+    assert schedule.next_interval(BUSINESS) == pytest.approx(900)
+    assert schedule.idle_polls == schedule.max_idle_polls
+    # 새 게시글이 보이면 처음부터
+    schedule.record(1, BUSINESS)
+    assert schedule.next_interval(BUSINESS) == 60
+
+def test_off_hours_wakes_for_business_start():
+    schedule = make_schedule()
+    for _ in range(10):
+        schedule.record(0, EVENING)
+    # 08:50이면 업무 시작(09:00)까지 10분
+    assert schedule.next_interval(datetime(2026, 10, 15, 8, 50, tzinfo=KST)) == pytest.approx(600)
+    # 금요일 밤에서 주말을 건너 월요일 업무 시작까지 기다리더라도 max_interval 이하
+    friday = datetime(2026, 10, 16, 23, 0, tzinfo=KST)
+    assert schedule.next_business_start(friday) == datetime(2026, 10, 19, 9, 0, tzinfo=KST)
+    assert schedule.next_interval(friday) == pytest.approx(3600)
+
+class RecordingSchedule(PollSchedule):
+    """조회마다 계산한 간격을 기록하고 기다리지 않음 (polls번 조회 후 종료)"""
+
+    def __init__(self, stop, polls, before_poll, **kwargs):
+        super().__init__(active=60, business=120, idle=900, active_window=0, jitter=0, **kwargs)
+        self.stop = stop
+        self.polls = polls
+        self.before_poll = before_poll
+        self.new_posts = []
+        self.intervals = []
+
+    def record(self, new_posts, now):
+        self.new_posts.append(new_posts)
+        super().record(new_posts, now)
+
+    def next_interval(self, now):
+        self.intervals.append(super().next_interval(now))
+        if len(self.intervals) == self.polls:
+            self.stop.set()
+        else:
+            self.before_poll(len(self.intervals) + 1)
+        return 0.01
+
+def test_daemon_adapts_interval(mailbox, monkeypatch):
+    import crawler as crawler_module
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return BUSINESS.astimezone(tz) if tz else BUSINESS.replace(tzinfo=None)
+
+    monkeypatch.setattr(crawler_module, 'datetime', FixedDatetime)
+    with ReplayServer(fixture_dir=None, synthetic_posts=20) as server:
+        board = server.synthetic['69']
+
+        def before_poll(poll):
+            if poll == 4:
+                # 4번째 조회 전에 새 게시글 1건
+                board.start_id += 1
+                board.total += 1
+
+        stop = threading.Event()
+        schedule = RecordingSchedule(stop, polls=5, before_poll=before_poll)
+        crawler = MMABoardCrawler(base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        crawler.run_daemon(schedule=schedule, stop=stop)
+
+    # 첫 조회는 오늘 게시글(3건)을 알리고 워터마크 초기화
+    assert schedule.new_posts == [3, 0, 0, 1, 0]
+    assert schedule.intervals == pytest.approx([120, 180, 270, 120, 180])
+    assert len(mailbox.messages) == 2
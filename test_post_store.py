@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+처리 이력 저장소와 워터마크 기반 새 게시글 선택 테스트
+- 첫 실행은 오늘 게시글만 선택, 발송 후에는 워터마크 이후 게시글만 선택
+- 이미 요약한 게시글은 상세 페이지를 다시 요청하지 않음
+"""
+from replay_server import ReplayServer, SyntheticBoard
+from post_store import PostStore
+
+def make_crawler(server):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    crawler = MMABoardCrawler(use_cache=False, base_url=server.base_url)
+    crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+    return crawler
+
+def test_watermark_only_moves_forward(tmp_path):
+    store = PostStore(str(tmp_path / 'posts.db'))
+    assert store.get_watermark('69') is None
+    store.advance_watermark(100, '69')
+    store.advance_watermark(90, '69')
+    assert store.get_watermark('69') == 100
+    store.close()
+
+    reopened = PostStore(str(tmp_path / 'posts.db'))
+    assert reopened.get_watermark('69') == 100
+    reopened.close()
+
+def test_processed_post_round_trip(tmp_path):
+    store = PostStore(str(tmp_path / 'posts.db'))
+    post = {
+        'post_id': 7, 'board_key': '69', 'title': '공지', 'url': 'https://example.com/7',
+        'date': '2026-10-17', 'summary': '요약', 'content_length': 120,
+        'attachments': [{'name': '붙임.hwp', 'url': 'https://example.com/f'}],
+    }
+    store.save_processed(post)
+    assert not store.is_notified(7)
+    store.mark_notified([7], '69')
+
+    stored = store.get_processed(7)
+    assert stored['summary'] == '요약'
+    assert stored['attachments'] == post['attachments']
+    assert store.is_notified(7)
+    assert store.get_watermark('69') == 7
+
+def test_new_posts_follow_watermark(crawler_env):
+    with ReplayServer(fixture_dir=None, synthetic_posts=30) as server:
+        crawler = make_crawler(server)
+
+        # 첫 실행: 오늘 작성된 3건
+        first = crawler.get_new_posts()
+        assert [post['post_id'] for post in first] == [1_600_000, 1_599_999, 1_599_998]
+        crawler.process_posts(first)
+        crawler._mark_notified(first)
+        assert crawler.store.get_watermark('69') == 1_600_000
+        assert crawler.get_new_posts() == []
+
+        # 새 게시글 2건 등록 → 워터마크에서 멈춤
+        server.synthetic['69'] = SyntheticBoard('69', 32, start_id=1_600_002)
+        second = crawler.get_new_posts()
+        assert [post['post_id'] for post in second] == [1_600_002, 1_600_001]
+
+def test_processed_posts_are_not_refetched(crawler_env):
+    with ReplayServer(fixture_dir=None, synthetic_posts=30) as server:
+        crawler = make_crawler(server)
+        posts = crawler.get_latest_posts(3)
+        crawler.process_posts(posts)
+        summaries = [post['summary'] for post in posts]
+        requests_before = server.stats['requests']
+
+        again = crawler.process_posts(crawler.get_latest_posts(3))
+
+        # 목록 1회만 요청하고 상세 페이지는 요청하지 않음
+        assert server.stats['requests'] == requests_before + 1
+        assert [post['summary'] for post in again] == summaries
+        assert crawler.metrics.counters['posts_skipped'] == 3
+
+def make_legacy_store(path: str, watermark: int):
+    """게시판 구분 전 형식의 저장소 (board 컬럼 없음, 'watermark' 키)"""
+    import sqlite3
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("""
+            CREATE TABLE posts (
+                post_id INTEGER PRIMARY KEY, title TEXT NOT NULL, url TEXT NOT NULL, date TEXT,
+                summary TEXT, content_length INTEGER DEFAULT 0, processed_at TEXT, notified_at TEXT
+            )
+        """)
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO posts (post_id, title, url, date, summary, content_length, processed_at, notified_at) "
+                     "VALUES (?, '공지', 'https://example.com', '2026-10-01', '요약', 120, '2026-10-01', '2026-10-01')",
+                     (watermark,))
+        conn.execute("INSERT INTO meta (key, value) VALUES ('watermark', ?)", (str(watermark),))
+    conn.close()
+
+def test_legacy_watermark_moves_to_army_board(tmp_path):
+    path = str(tmp_path / 'posts.db')
+    make_legacy_store(path, 1520532)
+
+    store = PostStore(path)
+    assert store.get_watermark('69') == 1520532
+    assert store.get_watermark() == 1520532
+    assert store.conn.execute("SELECT COUNT(*) FROM meta WHERE key = 'watermark'").fetchone()[0] == 0
+    assert store.get_processed(1520532)['board'] == '69'
+    assert store.is_notified(1520532)
+    store.close()
+
+    # 다시 열어도 그대로
+    store = PostStore(path)
+    assert store.get_watermark('69') == 1520532
+    store.close()
+
+def test_migration_keeps_existing_board_watermark(tmp_path):
+    path = str(tmp_path / 'posts.db')
+    make_legacy_store(path, 1520500)
+    store = PostStore(path)
+    store.advance_watermark(1520600, '69')
+    store.conn.execute("INSERT INTO meta (key, value) VALUES ('watermark', '1520400')")
+    store.conn.commit()
+    store.close()
+
+    store = PostStore(path)
+    assert store.get_watermark('69') == 1520600
+    store.close()
+
+def test_legacy_store_does_not_reseed(crawler_env):
+    """기존 사용자의 첫 실행이 오늘 게시글부터 다시 시작하지 않고 워터마크 이후 게시글만 선택"""
+    make_legacy_store(str(crawler_env / 'posts.db'), 1_599_998)
+    with ReplayServer(fixture_dir=None, synthetic_posts=30) as server:
+        crawler = make_crawler(server)
+        posts = crawler.get_new_posts()
+    assert [post['post_id'] for post in posts] == [1_600_000, 1_599_999]
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+적응형 요청 제한기와 동시 상세 페이지 처리 테스트
+- 429/503 응답이면 속도를 줄이고 Retry-After 동안 대기, 정상 응답이 이어지면 최대 속도까지 회복
+- 상세 페이지를 동시에 받아도 결과는 원래 게시글 순서대로 반환 (가짜 세션, 네트워크 없음)
+"""
+import time
+import threading
+
+import pytest
+import requests
+
+from rate_limiter import AdaptiveRateLimiter, parse_retry_after
+from replay_server import SyntheticBoard
+
+URL = 'https://www.mma.go.kr/board/boardList.do'
+
+def make_response(url: str, status: int = 200, body: bytes = b'', headers=None) -> requests.Response:
+    """네트워크 없이 만든 응답 (stream=True 읽기도 가능)"""
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response._content = body
+    response._content_consumed = True
+    response.encoding = 'utf-8'
+    response.headers.update(headers or {})
+    return response
+
+class FakeSession:
+    """URL별 응답을 돌려주는 세션 (요청마다 delay(url)초 지연)"""
+
+    def __init__(self, pages, delay=lambda url: 0.0, status=200, headers=None):
+        self.pages = pages
+        self.delay = delay
+        self.status = status
+        self.headers = headers
+        self.requested = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None, stream=False, headers=None):
+        with self._lock:
+            self.requested.append(url)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay(url))
+            body = self.pages.get(url, b'')
+            return make_response(url, self.status if body else 404, body, self.headers)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+def test_backs_off_on_429_and_503():
+    limiter = AdaptiveRateLimiter(rate=4.0, burst=4.0, min_rate=0.5, max_rate=4.0)
+    limiter.record(URL, 429, 0.1)
+    assert limiter.current_rate(URL) == 2.0
+    limiter.record(URL, 503, 0.1)
+    assert limiter.current_rate(URL) == 1.0
+    limiter.record(URL, None, 0.1)  # 연결 오류
+    limiter.record(URL, 503, 0.1)
+    assert limiter.current_rate(URL) == 0.5  # min_rate 아래로는 줄이지 않음
+
+def test_retry_after_blocks_host():
+    limiter = AdaptiveRateLimiter(rate=100.0, burst=100.0, max_rate=100.0)
+    limiter.record(URL, 429, 0.1, retry_after=parse_retry_after('0.3'))
+    started = time.monotonic()
+    limiter.acquire(URL)
+    assert time.monotonic() - started >= 0.25
+    # 다른 호스트는 영향 없음
+    started = time.monotonic()
+    limiter.acquire('https://example.com/')
+    assert time.monotonic() - started < 0.1
+
+def test_recovers_to_max_rate():
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=2.0, max_rate=3.0, target_latency=2.0)
+    limiter.record(URL, 503, 0.1)
+    assert limiter.current_rate(URL) == 1.0
+    for _ in range(4):
+        limiter.record(URL, 200, 0.1)
+    assert limiter.current_rate(URL) == 2.0
+    for _ in range(10):
+        limiter.record(URL, 200, 0.1)
+    assert limiter.current_rate(URL) == 3.0
+
+def test_slow_responses_reduce_rate():
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=2.0, target_latency=1.0)
+    limiter.record(URL, 200, 5.0)
+    assert limiter.current_rate(URL) == 2.0 * 0.8
+
+def test_crawler_fetch_reports_throttling(crawler_env):
+    from crawler import MMABoardCrawler
+
+    crawler = MMABoardCrawler(max_workers=1, use_cache=False)
+    crawler.rate_limiter = AdaptiveRateLimiter(rate=100.0, burst=100.0, max_rate=100.0)
+    crawler.session = FakeSession({URL: b'busy'}, status=429, headers={'Retry-After': '0'})
+    with pytest.raises(requests.HTTPError):
+        crawler._fetch(URL)
+    assert crawler.rate_limiter.current_rate(URL) == 50.0
+
+def test_concurrent_details_keep_post_order(crawler_env):
+    from crawler import MMABoardCrawler
+
+    board = SyntheticBoard('69', 12)
+    crawler = MMABoardCrawler(max_workers=4, use_cache=False)
+    crawler.store = None
+    crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+
+    posts, pages = [], {}
+    for index in range(12):
+        post_id = board.start_id - index
+        url = f"{crawler.base_url}/board/boardView.do?gesipan_id=69&gsgeul_no={post_id}"
+        pages[url] = board.view_page(post_id).encode('utf-8')
+        posts.append({'title': f'게시글 {index}', 'url': url, 'post_id': post_id, 'board_key': '69'})
+    # 앞 게시글일수록 늦게 응답해 완료 순서가 입력 순서와 반대가 되도록
+    order = {post['url']: index for index, post in enumerate(posts)}
+    crawler.session = FakeSession(pages, delay=lambda url: 0.02 * (len(posts) - order[url]))
+
+    processed = crawler.process_posts(posts)
+
+    assert processed is posts
+    assert [post['post_id'] for post in processed] == [board.start_id - i for i in range(12)]
+    assert crawler.session.max_active > 1
+    for post in processed:
+        # 각 게시글에는 자기 상세 페이지의 본문이 들어감
+        assert post['content_length'] > 0
+        assert post['content'].split()[0] in pages[post['url']].decode('utf-8')
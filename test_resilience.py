@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+회로 차단기 테스트
+- 연속 실패 failure_threshold회에 열림, cooldown 동안 요청 거부
+- cooldown이 지나면 시험 요청 1건만 허용(반열림), 성공하면 닫히고 실패하면 다시 열림
+- 크롤러 요청도 회로가 열리면 서버에 보내지 않음 (대체 서버, 항상 503)
+"""
+from urllib.parse import urlsplit
+
+import pytest
+
+import resilience
+from resilience import CircuitBreaker, CircuitOpenError
+from replay_server import ReplayServer
+
+URL = 'https://www.mma.go.kr/board/boardList.do?gesipan_id=69'
+OTHER = 'https://example.com/'
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, 'monotonic', clock)
+    return clock
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=60)
+    assert not breaker.record_failure(URL)
+    breaker.record_success(URL)  # 성공하면 연속 실패 횟수 초기화
+    assert not breaker.record_failure(URL)
+    assert not breaker.record_failure(URL)
+    assert breaker.record_failure(URL)
+
+    assert breaker.is_open(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+    # 다른 호스트는 영향 없음
+    breaker.before_request(OTHER)
+
+def test_half_open_trial_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60)
+    breaker.record_failure(URL)
+    clock.now += 59
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    clock.now += 2
+    breaker.before_request(URL)  # 시험 요청 허용
+    # 시험 요청이 끝나기 전 다른 요청은 거부
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    breaker.record_success(URL)
+    assert not breaker.is_open(URL)
+    breaker.before_request(URL)
+    breaker.before_request(URL)
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    breaker.record_failure(URL)
+    breaker.record_failure(URL)
+    clock.now += 61
+    breaker.before_request(URL)
+
+    # 반열림 시험이 실패하면 threshold와 관계없이 바로 다시 열림
+    assert breaker.record_failure(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+    clock.now += 61
+    breaker.before_request(URL)
+
+def test_crawler_stops_requesting_when_open(crawler_env, monkeypatch):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    monkeypatch.setenv('CIRCUIT_BREAKER_THRESHOLD', '2')
+    with ReplayServer(fixture_dir=None, synthetic_posts=5, error_rate=1.0) as server:
+        crawler = MMABoardCrawler(use_cache=False, base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        url = f"{server.base_url}/board/boardList.do?gesipan_id=69"
+        for _ in range(2):
+            with pytest.raises(Exception) as error:
+                crawler._fetch(url, stage='fetch_list')
+            assert not isinstance(error.value, CircuitOpenError)
+        requests_sent = server.stats['requests']
+
+        with pytest.raises(CircuitOpenError):
+            crawler._fetch(url, stage='fetch_list')
+
+    assert server.stats['requests'] == requests_sent
+    assert crawler.metrics.info['circuit_open'] == urlsplit(server.base_url).netloc
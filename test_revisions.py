@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+게시글 수정 감지 테스트 (대체 서버, 발송 보관함 사용)
+- 바뀐 문장만 이전/이후로 비교 (문장 경계나 공백만 바뀐 것은 수정이 아님)
+- 수정된 게시글은 바뀐 문장만 메일로 알리고, 멱등 키는 URL#revision(새 본문 지문)이라 수정마다 새 메일
+- 바뀌지 않은 게시글은 304로 확인만 하고 다시 알리지 않음
+- 자동 실행은 REVALIDATE_INTERVAL마다만 확인하고, HTTP 캐시가 꺼져 있으면 확인하지 않음
+"""
+import pytest
+
+from revisions import SentenceChange, content_fingerprint, diff_sentences
+from replay_server import ReplayServer
+
+def test_diff_reports_only_changed_sentences():
+    old = "접수기간은 11월 2일부터 13일까지입니다. 지원서는 누리집에서 접수합니다.\n문의: 1588-9090"
+    new = "접수기간은 11월 2일부터 20일까지입니다. 지원서는 누리집에서 접수합니다.\n문의: 1588-9090\n추가 모집은 없습니다."
+    assert diff_sentences(old, new) == [
+        # 문장 분할은 문장 사이의 마침표를 구분자로 제거
+        SentenceChange('접수기간은 11월 2일부터 13일까지입니다', '접수기간은 11월 2일부터 20일까지입니다'),
+        SentenceChange(None, '추가 모집은 없습니다.'),
+    ]
+    assert diff_sentences(new, old)[-1] == SentenceChange('추가 모집은 없습니다.', None)
+
+def test_fingerprint_ignores_whitespace():
+    assert content_fingerprint("모집 계획을\n공고합니다.") == content_fingerprint("모집  계획을 공고합니다.")
+    assert content_fingerprint("모집 계획을 공고합니다.") != content_fingerprint("모집 계획을 공고합니다!")
+    assert content_fingerprint('') is None
+
+def test_edited_notice_mails_only_changed_sentences(crawler_env, mailbox, monkeypatch):
+    from crawler import MMABoardCrawler
+    from outbox import Outbox
+    from rate_limiter import AdaptiveRateLimiter
+
+    monkeypatch.setenv('OUTBOX_PATH', str(crawler_env / 'outbox.db'))
+    with ReplayServer(fixture_dir=None, synthetic_posts=10) as server:
+        crawler = MMABoardCrawler(base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        # 첫 실행: 오늘 게시글 3건 알림, 본문과 지문 기록
+        crawler.run()
+        assert len(mailbox.messages) == 1
+
+        # 바뀐 게시글이 없으면 상세 페이지는 304, 메일 없음
+        before = server.stats.get('status_304', 0)
+        assert crawler.revalidate_posts() == 0
+        assert server.stats['status_304'] - before == 3
+        assert len(mailbox.messages) == 1
+
+        # 최신 게시글의 두 번째 문장만 수정
+        board = server.synthetic['69']
+        post_id = board.start_id
+        sentences = board._post(0)['sentences']
+        view_page = board.view_page
+        edited = '접수기간을 11월 20일까지 연장합니다.'
+        board.view_page = lambda pid: (view_page(pid).replace(f'<p>{sentences[1]}</p>', f'<p>{edited}</p>')
+                                       if pid == post_id else view_page(pid))
+
+        assert crawler.revalidate_posts() == 1
+        assert len(mailbox.messages) == 2
+        text = mailbox.texts()[1]
+        assert '수정' in mailbox.subjects[1]
+        assert sentences[1] in text and edited in text
+        # 바뀌지 않은 문장은 보내지 않음
+        for sentence in sentences[:1] + sentences[2:]:
+            assert sentence not in text
+
+        # 멱등 키는 URL#revision (새 본문 지문 앞 16자리)
+        stored = next(post for post in crawler.store.recent_notified('2000-01-01', 10)
+                      if post['post_id'] == post_id)
+        revision = stored['fingerprint'][:16]
+        expected_key = Outbox.make_key('user@example.com', [{'url': stored['url'], 'revision': revision}])
+        keys = [row[0] for row in crawler.outbox.conn.execute("SELECT key FROM outbox ORDER BY created_at")]
+        assert expected_key in keys
+        assert len(keys) == 2
+        revision_urls = [row[0] for row in crawler.outbox.conn.execute(
+            "SELECT url FROM outbox_posts WHERE key = ?", (expected_key,))]
+        assert revision_urls == [stored['url']]
+
+        # 같은 수정은 다시 알리지 않고, 한 번 더 고치면 새 revision 키로 알림
+        assert crawler.revalidate_posts() == 0
+        board.view_page = lambda pid: (view_page(pid).replace(f'<p>{sentences[1]}</p>', '<p>접수를 마감했습니다.</p>')
+                                       if pid == post_id else view_page(pid))
+        assert crawler.revalidate_posts() == 1
+
+    assert len(mailbox.messages) == 3
+    assert edited in mailbox.texts()[2] and '접수를 마감했습니다.' in mailbox.texts()[2]
+    keys = [row[0] for row in crawler.outbox.conn.execute("SELECT key FROM outbox")]
+    assert len(set(keys)) == 3
+
+@pytest.mark.parametrize('interval, http_cache, revalidated', [
+    ('3600', 'on', 0),  # 첫 실행에서 확인했으므로 한 시간 안에는 다시 확인하지 않음
+    ('0', 'on', 3),
+    ('0', 'off', 0),    # 304를 받을 수 없으면 확인하지 않음
+])
+def test_auto_run_revalidation_gate(crawler_env, mailbox, monkeypatch, interval, http_cache, revalidated):
+    from crawler import MMABoardCrawler
+    from rate_limiter import AdaptiveRateLimiter
+
+    def make_crawler(server):
+        crawler = MMABoardCrawler(base_url=server.base_url)
+        crawler.rate_limiter = AdaptiveRateLimiter(rate=1000.0, burst=1000.0, max_rate=1000.0)
+        return crawler
+
+    monkeypatch.setenv('REVALIDATE_INTERVAL', interval)
+    with ReplayServer(fixture_dir=None, synthetic_posts=10) as server:
+        make_crawler(server).run()
+        monkeypatch.setenv('HTTP_CACHE', http_cache)
+        # 새 게시글이 없는 다음 자동 실행
+        second = make_crawler(server)
+        second.run()
+
+    assert len(mailbox.messages) == 1
+    assert second.metrics.counters['posts_revalidated'] == revalidated
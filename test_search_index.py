@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+전문 검색 색인 테스트 (SQLite FTS5 trigram)
+- 형태소 분석 없이 조사가 붙은 한국어 부분 문자열로 해당 게시글을 찾음
+- 제목 일치가 본문 일치보다 앞, 게시판/기간으로 거름, 2글자 검색어는 instr()로 찾음
+- FTS5 trigram을 쓸 수 없는 SQLite면 색인 없이 크롤러 실행
+"""
+import sqlite3
+
+import pytest
+
+import search_index
+from search_index import SearchIndex, create_index_from_env
+
+POSTS = [
+    {'post_id': 1520541, 'board_key': '69', 'date': '2026-10-16',
+     'title': '2027년도 1월 입영 육군 기술행정병 모집계획 공고',
+     'summary': '육군 기술행정병 모집, 접수기간 11월 2일부터 13일까지',
+     'content': '2027년도 1월 입영 육군 기술행정병 모집계획을 다음과 같이 공고합니다. 접수기간은 11월 2일부터입니다.',
+     'url': 'https://www.mma.go.kr/board/boardView.do?gesipan_id=69&gsgeul_no=1520541'},
+    {'post_id': 1520530, 'board_key': '69', 'date': '2026-09-01',
+     'title': '사회복무요원 소집 일정 안내',
+     'summary': '사회복무요원 소집 일정',
+     'content': '사회복무요원 소집 통지서는 소집일 30일 전까지 발송합니다. 기술행정병과는 관련이 없습니다.',
+     'url': 'https://www.mma.go.kr/board/boardView.do?gesipan_id=69&gsgeul_no=1520530'},
+    {'post_id': 1620001, 'board_key': '70', 'date': '2026-10-10',
+     'title': '해군 일반병 모집 안내',
+     'summary': '해군 일반병 모집',
+     'content': '해군 일반병 지원서 접수는 병무청 누리집에서 합니다.',
+     'url': 'https://www.mma.go.kr/board/boardView.do?gesipan_id=70&gsgeul_no=1620001'},
+]
+
+@pytest.fixture
+def index(tmp_path):
+    try:
+        index = SearchIndex(str(tmp_path / 'search.db'))
+    except sqlite3.OperationalError as e:
+        pytest.skip(f"SQLite FTS5 trigram 토크나이저를 쓸 수 없음: {e}")
+    index.add_posts(POSTS)
+    yield index
+    index.close()
+
+def test_trigram_finds_notice_by_substring(index):
+    # '모집계획을'처럼 조사가 붙은 본문도 '모집계획'으로 찾음
+    hits = index.search('모집계획')
+    assert [hit.post_id for hit in hits] == [1520541]
+    assert hits[0].title == POSTS[0]['title']
+    assert hits[0].url == POSTS[0]['url']
+    assert '[모집계획]' in hits[0].snippet
+
+def test_title_match_ranks_first(index):
+    hits = index.search('기술행정병')
+    assert [hit.post_id for hit in hits] == [1520541, 1520530]
+    assert hits[0].score < hits[1].score
+
+def test_all_terms_must_match(index):
+    assert [hit.post_id for hit in index.search('기술행정병 사회복무요원')] == [1520530]
+    assert index.search('기술행정병 해군일반병') == []
+
+def test_board_and_date_filters(index):
+    assert [hit.post_id for hit in index.search('모집 안내', board='70')] == [1620001]
+    assert [hit.post_id for hit in index.search('기술행정병', since='2026-10-01')] == [1520541]
+    assert [hit.post_id for hit in index.search('기술행정병', until='2026-09-30')] == [1520530]
+    assert index.search('기술행정병', since='2027-01-01') == []
+
+def test_short_terms_use_instr(index):
+    # 2글자 검색어는 trigram 색인을 쓸 수 없어 최신 게시글 순으로 찾음
+    hits = index.search('모집')
+    assert [hit.post_id for hit in hits] == [1620001, 1520541]
+    assert all(hit.score == 0.0 for hit in hits)
+    assert '[모집]' in hits[0].snippet
+
+def test_replace_updates_content(index):
+    edited = dict(POSTS[0], content='접수기간을 11월 20일까지 연장합니다.')
+    index.add_posts([edited])
+    assert index.count() == len(POSTS)
+    assert [hit.post_id for hit in index.search('연장합니다')] == [1520541]
+    # replace=False면 이미 색인된 게시글은 그대로
+    index.add_posts([dict(POSTS[0], content='')], replace=False)
+    assert [hit.post_id for hit in index.search('연장합니다')] == [1520541]
+
+def test_unsupported_sqlite_disables_index(crawler_env, monkeypatch):
+    from crawler import MMABoardCrawler
+
+    def unsupported(self):
+        raise sqlite3.OperationalError('no such tokenizer: trigram')
+
+    monkeypatch.setenv('SEARCH_INDEX_PATH', str(crawler_env / 'search.db'))
+    monkeypatch.setattr(search_index.SearchIndex, '_create_tables', unsupported)
+    assert create_index_from_env() is None
+    assert MMABoardCrawler(use_cache=False).search_index is None
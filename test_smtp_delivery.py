@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+SMTP 발송 엔진 테스트 (aiosmtpd 로컬 서버, 없으면 건너뜀)
+- 연속 발송은 연결 1개를 재사용
+- 서버가 연결을 끊거나 SMTPConnectError가 나면 다시 연결해 발송
+- 수신 거부는 재시도하지 않음
+"""
+import socket
+import smtplib
+from email.mime.text import MIMEText
+
+import pytest
+
+pytest.importorskip('aiosmtpd')
+from aiosmtpd.controller import Controller
+
+from smtp_delivery import SMTPDeliveryEngine
+
+HOST = '127.0.0.1'
+
+class RecordingHandler:
+    """받은 메시지와 보낸 쪽 주소(연결마다 다른 포트)를 기록"""
+
+    def __init__(self):
+        self.messages = []
+        self.peers = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith('blocked@'):
+            return '550 mailbox unavailable'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope.content)
+        self.peers.append(session.peer)
+        return '250 Message accepted for delivery'
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+def make_message(index: int, to: str = 'user@example.com') -> MIMEText:
+    msg = MIMEText(f'본문 {index}', 'plain', 'utf-8')
+    msg['Subject'] = f'공지 {index}'
+    msg['From'] = 'bot@example.com'
+    msg['To'] = to
+    return msg
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname=HOST, port=free_port())
+    controller.start()
+    yield controller
+    if controller.loop.is_running():
+        controller.stop()
+
+def make_engine(controller, **kwargs) -> SMTPDeliveryEngine:
+    return SMTPDeliveryEngine(controller.hostname, controller.port, use_starttls=False, timeout=5, **kwargs)
+
+def test_reuses_connection(smtp_server):
+    engine = make_engine(smtp_server)
+    results = engine.send_batch([(make_message(i), None) for i in range(3)])
+    engine.close()
+
+    assert results == [True, True, True]
+    assert engine.sent == 3
+    assert engine.reconnects == 0
+    assert len(smtp_server.handler.messages) == 3
+    assert len(set(smtp_server.handler.peers)) == 1
+
+def test_reconnects_after_server_drops(smtp_server):
+    engine = make_engine(smtp_server)
+    assert engine.send(make_message(0))
+
+    # 서버를 같은 포트로 다시 시작하면 열어 둔 연결은 끊김
+    smtp_server.stop()
+    restarted = Controller(smtp_server.handler, hostname=HOST, port=smtp_server.port)
+    restarted.start()
+    try:
+        assert engine.send(make_message(1))
+        engine.close()
+    finally:
+        restarted.stop()
+
+    assert engine.reconnects == 1
+    peers = smtp_server.handler.peers
+    assert len(peers) == 2 and peers[0] != peers[1]
+
+def test_reconnects_on_connect_error(smtp_server, monkeypatch):
+    engine = make_engine(smtp_server)
+    connect = engine._connect
+    attempts = []
+
+    def busy_once():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise smtplib.SMTPConnectError(421, b'Too many connections')
+        return connect()
+
+    monkeypatch.setattr(engine, '_connect', busy_once)
+    assert engine.send(make_message(0))
+    engine.close()
+
+    assert len(attempts) == 2
+    assert engine.reconnects == 1
+    assert len(smtp_server.handler.messages) == 1
+
+def test_rejected_recipient_is_not_retried(smtp_server):
+    engine = make_engine(smtp_server)
+    assert not engine.send(make_message(0, to='blocked@example.com'))
+    assert engine.send(make_message(1))
+    engine.close()
+
+    assert engine.reconnects == 0
+    assert len(smtp_server.handler.messages) == 1
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+텍스트 요약기 골든 테스트
+- fixtures/summarizer_golden.json의 입력에 대해 요약 결과가 그대로인지 확인
+- summarize()와 summarize_many() 모두 검사
+"""
+import os
+import sys
+import json
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from text_summarizer import SimpleTextSummarizer
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'summarizer_golden.json')
+
+def load_cases():
+    with open(GOLDEN_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)['cases']
+
+def test_summarize_matches_golden():
+    for case in load_cases():
+        summarizer = SimpleTextSummarizer(max_length=case['max_length'])
+        assert summarizer.summarize(case['text']) == case['summary'], case['text'][:50]
+
+def test_summarize_many_matches_golden():
+    cases = [case for case in load_cases() if case['max_length'] == 300]
+    summarizer = SimpleTextSummarizer(max_length=300)
+    summaries = summarizer.summarize_many(case['text'] for case in cases)
+    assert summaries == [case['summary'] for case in cases]
+
+if __name__ == "__main__":
+    test_summarize_matches_golden()
+    test_summarize_many_matches_golden()
+    print(f"✅ 골든 테스트 통과: {len(load_cases())}건")
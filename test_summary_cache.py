@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+요약 캐시 테스트
+- 메모리 LRU 적중/밀려남, 다시 연 디스크 캐시 적중
+- 요약기 VERSION이나 코퍼스 통계가 바뀌면 이전 요약을 쓰지 않음
+"""
+import pytest
+
+from summary_cache import SummaryCache
+from text_summarizer import SimpleTextSummarizer
+
+TEXTS = [
+    "2027년도 1월 입영 육군 기술행정병 모집계획을 공고합니다. 접수 기간은 11월 2일부터 13일까지입니다.",
+    "해군 일반병 모집계획을 공고합니다. 지원서는 병무청 누리집에서 접수합니다.",
+    "공군 전문특기병 합격자를 발표합니다. 입영 일자를 확인하시기 바랍니다.",
+]
+
+class CountingSummarizer(SimpleTextSummarizer):
+    """summarize() 호출 횟수를 세는 요약기"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def summarize(self, text: str) -> str:
+        self.calls += 1
+        return super().summarize(text)
+
+def test_memory_lru_hits_and_eviction():
+    cache = SummaryCache(path=None, memory_size=2)
+    summarizer = CountingSummarizer(max_length=100)
+
+    first = cache.summarize(TEXTS[0], summarizer)
+    # 공백만 다른 본문은 같은 키
+    assert cache.summarize('  ' + TEXTS[0].replace(' ', '\n  '), summarizer) == first
+    assert summarizer.calls == 1
+    assert cache.memory_hits == 1
+
+    cache.summarize(TEXTS[1], summarizer)
+    cache.summarize(TEXTS[2], summarizer)  # 가장 오래 안 쓴 TEXTS[0]이 밀려남
+    cache.summarize(TEXTS[0], summarizer)
+    assert summarizer.calls == 4
+    assert cache.stats()['misses'] == 4
+
+def test_disk_hits_after_reopen(tmp_path):
+    path = str(tmp_path / 'summary_cache.db')
+    summarizer = CountingSummarizer(max_length=100)
+    cache = SummaryCache(path)
+    summaries = [cache.summarize(text, summarizer) for text in TEXTS]
+    cache.close()
+
+    reopened = SummaryCache(path)
+    assert [reopened.summarize(text, summarizer) for text in TEXTS] == summaries
+    assert summarizer.calls == len(TEXTS)
+    assert reopened.disk_hits == len(TEXTS)
+    # 디스크에서 읽은 항목은 메모리에도 올라감
+    reopened.summarize(TEXTS[0], summarizer)
+    assert reopened.memory_hits == 1
+    reopened.close()
+
+def test_version_change_invalidates(tmp_path, monkeypatch):
+    path = str(tmp_path / 'summary_cache.db')
+    summarizer = CountingSummarizer(max_length=100)
+    cache = SummaryCache(path)
+    cache.summarize(TEXTS[0], summarizer)
+    old_key = cache.make_key(TEXTS[0], summarizer)
+
+    monkeypatch.setattr(SimpleTextSummarizer, 'VERSION', SimpleTextSummarizer.VERSION + '-next')
+    assert cache.make_key(TEXTS[0], summarizer) != old_key
+    cache.summarize(TEXTS[0], summarizer)
+    assert summarizer.calls == 2
+    assert cache.hits == 0
+    cache.close()
+
+def test_corpus_change_invalidates_corpus_modes():
+    pytest.importorskip('numpy')
+    from corpus_ranker import CorpusStats
+
+    stats = CorpusStats(path=None)
+    stats.add_documents(TEXTS[1:])
+    stats.save()
+    cache = SummaryCache(path=None)
+    summarizer = CountingSummarizer(max_length=100, mode='textrank', corpus_stats=stats)
+    keyword = CountingSummarizer(max_length=100)
+
+    cache.summarize(TEXTS[0], summarizer)
+    cache.summarize(TEXTS[0], summarizer)
+    assert summarizer.calls == 1
+    keyword_key = cache.make_key(TEXTS[0], keyword)
+
+    # 새 게시글이 코퍼스에 들어가면 IDF가 달라지므로 다시 요약
+    stats.add_documents(TEXTS[:1])
+    stats.save()
+    cache.summarize(TEXTS[0], summarizer)
+    assert summarizer.calls == 2
+    # 키워드 방식은 코퍼스와 무관
+    assert cache.make_key(TEXTS[0], keyword) == keyword_key